@@ -0,0 +1,17 @@
+# analysis_pipeline.py
+"""
+Background job kinds behind the dashboard. The pages submit these and poll them instead of
+calling GPT in the script thread; the roadmap job is submitted once the analysis job has
+produced missing_skills (see main_app.run_pending_analysis).
+"""
+import job_queue
+from structured_output import failure_message
+from learning_roadmap import stream_learning_roadmap
+from project_recommendations import stream_projects
+from resume_analysis import evaluate_resume_profile, stream_career_goal
+
+job_queue.register("analysis", evaluate_resume_profile)
+# Failed parses come back as message items rather than exceptions; they must not be reused
+job_queue.register("roadmap", stream_learning_roadmap, streaming=True, check=failure_message)
+job_queue.register("projects", stream_projects, streaming=True, check=failure_message)
+job_queue.register("career_goal", stream_career_goal, streaming=True)
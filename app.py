@@ -1,8 +1,10 @@
 # app.py
 import streamlit as st
-from auth_pages import login_signup_page
-from main_app import main_app_content
-# from mongo_handler import get_user_data
+import metrics
+from auth_pages import login_signup_page, refresh_session
+
+# No-op unless SKILLMENTOR_METRICS_PORT is set; the exporter is shared by every session
+metrics.start_exporter()
 
 # --- Streamlit Session State Management ---
 if 'logged_in' not in st.session_state:
@@ -20,6 +22,7 @@ if 'data_loaded' not in st.session_state:
 
 # --- Logout function ---
 def logout_user():
+    st.session_state['account'] = None
     st.session_state['logged_in'] = False
     st.session_state['user_info'] = None
     st.session_state['user_id'] = None
@@ -28,19 +31,36 @@ def logout_user():
 
     st.session_state['resume_uploaded'] = False
     st.session_state['analysis_result'] = None
+    st.session_state['roadmap'] = None
+    st.session_state['projects'] = None
+    st.session_state['analysis_pending'] = False
     st.session_state['resume_text'] = None
     st.session_state['interests'] = None
     st.session_state['career_goal'] = None
     st.session_state['want_projects'] = False
 
-    st.info("Logged out successfully.")
-
 # --- Main Application Logic ---
+if st.session_state['logged_in'] and not refresh_session():
+    logout_user()
+    st.warning("Your session has ended. Please log in again.")
+
 if st.session_state['logged_in']:
     user_id = st.session_state['user_id']  # Pass user_id to main_app_content
     if not user_id:
         st.error("User ID not found! Please login again.")
     else:
+        # The dashboard modules are only imported once someone is logged in, so the login
+        # page renders without loading them
+        from main_app import main_app_content, load_stored_results
+        from mongo_handler import get_user_data
+
+        # Returning users land on their last dashboard, read once per login
+        if not st.session_state['data_loaded']:
+            record = get_user_data(user_id)
+            if record and record.get("analysis_result"):
+                load_stored_results(record)
+                st.session_state['current_page'] = "dashboard"
+            st.session_state['data_loaded'] = True
         main_app_content(logout_user, user_id)
 else:
     # Login/Signup page
@@ -1,57 +1,61 @@
 import streamlit as st
-import requests
-import json
-from firebase_config import firebaseConfig
-
-API_KEY = firebaseConfig.get("apiKey")
-AUTH_URL = "https://identitytoolkit.googleapis.com/v1"
+import firebase_auth
+from firebase_auth import AuthError
 
 def signup_user(email, password):
     try:
-        url = f"{AUTH_URL}/accounts:signUp?key={API_KEY}"
-        payload = {"email": email, "password": password, "returnSecureToken": True}
-        response = requests.post(url, data=json.dumps(payload))
-        response.raise_for_status()
+        firebase_auth.sign_up(email, password)
         st.session_state['signup_success'] = True
         st.success("Account created successfully! Please log in.")
         return True
-    except requests.exceptions.RequestException as e:
-        error_message = str(e)
-        if "EMAIL_EXISTS" in error_message:
+    except AuthError as e:
+        if e.code == "EMAIL_EXISTS":
             st.error("Error creating account: This email is already registered.")
-        elif "WEAK_PASSWORD" in error_message:
+        elif e.code == "WEAK_PASSWORD":
             st.error("Error creating account: Password should be at least 6 characters.")
-        elif "INVALID_EMAIL" in error_message:
+        elif e.code == "INVALID_EMAIL":
             st.error("Error creating account: Invalid email address.")
+        elif e.code == "NETWORK_ERROR" or e.code.startswith("HTTP_5"):
+            # The request may have gone through, so it is not retried automatically
+            st.error("Could not confirm the account was created. Try logging in before signing up again.")
         else:
-            st.error(f"Error creating account: {error_message}")
+            st.error(f"Error creating account: {e}")
         return False
 
 def login_user(email, password):
     try:
-        url = f"{AUTH_URL}/accounts:signInWithPassword?key={API_KEY}"
-        payload = {"email": email, "password": password, "returnSecureToken": True}
-        response = requests.post(url, data=json.dumps(payload))
-        response.raise_for_status()
-        
-        user_response = response.json()
-        st.session_state['logged_in'] = True
-        st.session_state['user_info'] = email
-        st.session_state['user_id'] = user_response.get('localId') # Store the unique UID
-        
-        st.success(f"Logged in as {email}!")
-        st.rerun()
-        return True
-    except requests.exceptions.RequestException as e:
-        error_message = str(e)
-        if "INVALID_LOGIN_CREDENTIALS" in error_message:
+        account = firebase_auth.sign_in(email, password)
+    except AuthError as e:
+        if e.code in ("INVALID_LOGIN_CREDENTIALS", "INVALID_PASSWORD", "EMAIL_NOT_FOUND"):
             st.error("Error logging in: Invalid email or password.")
-        elif "TOO_MANY_ATTEMPTS_TRY_LATER" in error_message:
+        elif e.code == "TOO_MANY_ATTEMPTS_TRY_LATER":
             st.error("Error logging in: Too many failed login attempts. Please try again later.")
         else:
-            st.error(f"Error logging in: {error_message}")
+            st.error(f"Error logging in: {e}")
         return False
 
+    st.session_state['logged_in'] = True
+    st.session_state['user_info'] = email
+    st.session_state['user_id'] = account["user_id"] # Store the unique UID
+    # ID/refresh tokens live with the session; kept fresh by refresh_session
+    st.session_state['account'] = account
+
+    st.success(f"Logged in as {email}!")
+    st.rerun()
+    return True
+
+def refresh_session():
+    """
+    Keep the logged-in user's ID token fresh (Firebase is only called shortly before it
+    expires). Returns False once Firebase no longer accepts the session, e.g. the account
+    was disabled or deleted; transient failures keep the user logged in.
+    """
+    try:
+        firebase_auth.get_id_token(st.session_state.get('account'))
+    except AuthError as e:
+        return e.code not in firebase_auth.SESSION_ENDED_CODES
+    return True
+
 def login_signup_page():
     st.set_page_config(page_title="Login/Signup - SkillMentor AI", layout="centered")
     st.title("SkillMentor AI - Login/Signup")
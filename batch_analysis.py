@@ -0,0 +1,175 @@
+# batch_analysis.py
+"""
+Headless resume analysis for whole cohorts.
+
+    python batch_analysis.py --input resumes/ --goal "Data Scientist" --interests "Data Science" --out results.jsonl
+    python batch_analysis.py --manifest cohort.csv --out results.jsonl --workers 8 --rpm 300
+
+A manifest is CSV or JSONL with the columns/keys `path`, `career_goal`, optional `interests`
+(separated by ";") and optional `id`. Results are appended to the output as JSON lines as each
+resume finishes; re-running with the same output skips resumes that already succeeded, so an
+interrupted run resumes where it stopped. `--fake-llm` runs against the local stub server.
+"""
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import llm_client
+from resume_ingest import extract_resume_text
+from resume_analysis import evaluate_resume_profile
+
+RESUME_EXTENSIONS = (".pdf", ".docx")
+
+
+# -----------------------------
+# Inputs
+# -----------------------------
+def _split_interests(value):
+    if isinstance(value, list):
+        return [str(v).strip() for v in value if str(v).strip()]
+    return [v.strip() for v in str(value or "").split(";") if v.strip()]
+
+
+def jobs_from_directory(directory, career_goal, interests):
+    for root, _, files in os.walk(directory):
+        for name in sorted(files):
+            if name.lower().endswith(RESUME_EXTENSIONS):
+                path = os.path.join(root, name)
+                yield {"id": os.path.relpath(path, directory), "path": path,
+                       "career_goal": career_goal, "interests": list(interests)}
+
+
+def jobs_from_manifest(manifest):
+    base = os.path.dirname(os.path.abspath(manifest))
+    with open(manifest, encoding="utf-8", newline="") as fh:
+        if manifest.lower().endswith(".jsonl"):
+            rows = [json.loads(line) for line in fh if line.strip()]
+        else:
+            rows = list(csv.DictReader(fh))
+    for row in rows:
+        path = row["path"] if os.path.isabs(row["path"]) else os.path.join(base, row["path"])
+        yield {"id": row.get("id") or row["path"], "path": path,
+               "career_goal": row.get("career_goal", ""), "interests": _split_interests(row.get("interests"))}
+
+
+def completed_ids(output_path):
+    """
+    Ids that already have a successful result in the output file (the checkpoint).
+    A truncated last line from an interrupted run is ignored.
+    """
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+    with open(output_path, encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("status") == "ok":
+                done.add(record.get("id"))
+    return done
+
+
+# -----------------------------
+# Processing
+# -----------------------------
+def analyze_job(job):
+    started = time.perf_counter()
+    record = {"id": job["id"], "path": job["path"], "career_goal": job["career_goal"],
+              "interests": job["interests"]}
+    try:
+        resume_text, resume_hash, skipped_pages = extract_resume_text(job["path"])
+        record["resume_hash"] = resume_hash
+        if skipped_pages:
+            record["skipped_pages"] = skipped_pages
+        analysis = evaluate_resume_profile(resume_text, job["interests"], job["career_goal"])
+        record["analysis"] = analysis
+        if analysis.get("degraded"):
+            # Local fallback after an LLM failure: keep it out of the checkpoint so it is retried
+            record["status"] = "error"
+            record["error"] = f"degraded: {analysis['degraded']}"
+        else:
+            record["status"] = "ok"
+    except Exception as e:
+        record["status"] = "error"
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["elapsed_s"] = round(time.perf_counter() - started, 3)
+    return record
+
+
+def run_batch(jobs, output_path, workers=4):
+    """
+    Analyse jobs with at most `workers` in flight, appending one JSON line per finished job.
+    Returns (succeeded, failed, skipped) counts.
+    """
+    done = completed_ids(output_path)
+    todo = [job for job in jobs if job["id"] not in done]
+    skipped = len(jobs) - len(todo)
+    succeeded = failed = 0
+    write_lock = threading.Lock()
+
+    # Make sure a checkpoint line never gets glued onto a truncated one
+    if os.path.exists(output_path) and os.path.getsize(output_path):
+        with open(output_path, "rb") as fh:
+            fh.seek(-1, os.SEEK_END)
+            needs_newline = fh.read(1) != b"\n"
+    else:
+        needs_newline = False
+
+    with open(output_path, "a", encoding="utf-8") as out, ThreadPoolExecutor(max_workers=workers) as pool:
+        if needs_newline:
+            out.write("\n")
+        futures = [pool.submit(analyze_job, job) for job in todo]
+        for future in as_completed(futures):
+            record = future.result()
+            with write_lock:
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                out.flush()
+            if record["status"] == "ok":
+                succeeded += 1
+            else:
+                failed += 1
+            print(f"[{succeeded + failed}/{len(todo)}] {record['id']}: {record['status']}", file=sys.stderr)
+    return succeeded, failed, skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analyse a cohort of resumes without the Streamlit UI.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", help="Directory of .pdf/.docx resumes")
+    source.add_argument("--manifest", help="CSV or JSONL manifest of resumes and goals")
+    parser.add_argument("--goal", default="", help="Career goal for every resume in --input")
+    parser.add_argument("--interests", default="", help="Interests for --input, separated by ';'")
+    parser.add_argument("--out", required=True, help="JSONL output file (also the checkpoint)")
+    parser.add_argument("--workers", type=int, default=4, help="Resumes analysed concurrently")
+    parser.add_argument("--rpm", type=float, default=None, help="Client-side limit on OpenAI requests per minute")
+    parser.add_argument("--fake-llm", action="store_true", help="Use the local fake OpenAI server")
+    args = parser.parse_args(argv)
+
+    if args.input and not args.goal:
+        parser.error("--goal is required with --input")
+
+    if args.fake_llm:
+        from devtools.fake_openai_server import start_server
+        _, base_url = start_server()
+        llm_client.configure(base_url=base_url, api_key="fake")
+    if args.rpm is not None:
+        llm_client.configure(requests_per_minute=args.rpm)
+
+    if args.input:
+        jobs = list(jobs_from_directory(args.input, args.goal, _split_interests(args.interests)))
+    else:
+        jobs = list(jobs_from_manifest(args.manifest))
+
+    succeeded, failed, skipped = run_batch(jobs, args.out, args.workers)
+    print(f"Done: {succeeded} succeeded, {failed} failed, {skipped} already complete.", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+# benchmarks/corpus.py
+"""
+Synthetic resume corpus for benchmarks: deterministic resumes of varying length, written as
+text-only PDFs (no PDF library needed) and DOCX files.
+
+    python -m benchmarks.corpus --out /tmp/resumes --per-size 5
+"""
+import os
+import io
+import random
+import argparse
+
+# Approximate page counts per size class
+SIZES = {"small": 1, "medium": 3, "large": 8}
+LINES_PER_PAGE = 55
+
+_SKILLS = ["Python", "Java", "JavaScript", "TypeScript", "React", "Node.js", "Django", "Flask", "Spring Boot",
+           "SQL", "PostgreSQL", "MongoDB", "Docker", "Kubernetes", "AWS", "Azure", "Git", "Linux", "Pandas",
+           "NumPy", "TensorFlow", "PyTorch", "Machine Learning", "Tableau", "Excel", "REST APIs", "HTML", "CSS",
+           "Figma", "Kotlin", "Swift", "Flutter", "Terraform", "Jenkins", "Spark", "Kafka", "Power BI"]
+_ROLES = ["Software Engineer", "Data Analyst", "Backend Developer", "Frontend Developer", "ML Engineer",
+          "DevOps Intern", "Research Assistant", "Full Stack Developer"]
+_COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Wayne Tech", "Hooli"]
+_VERBS = ["Built", "Designed", "Migrated", "Automated", "Optimised", "Led", "Maintained", "Shipped"]
+_OBJECTS = ["a reporting pipeline", "the customer API", "an internal dashboard", "a recommendation model",
+            "CI/CD workflows", "a mobile checkout flow", "the data warehouse", "a monitoring stack"]
+
+
+def make_resume(size="medium", seed=0):
+    """
+    Return the lines of a synthetic resume of roughly SIZES[size] pages.
+    """
+    rng = random.Random(f"{size}-{seed}")
+    target = SIZES[size] * LINES_PER_PAGE
+    lines = [f"Candidate {seed} {size.title()}", f"candidate{seed}@example.com | +1 555 01{seed % 100:02d}", "",
+             "SUMMARY", f"{rng.choice(_ROLES)} with {rng.randint(1, 12)} years of experience.", "",
+             "SKILLS", ", ".join(rng.sample(_SKILLS, rng.randint(5, 14))), "", "EXPERIENCE"]
+    while len(lines) < target - 12:
+        lines.append(f"{rng.choice(_ROLES)} - {rng.choice(_COMPANIES)} ({rng.randint(2012, 2025)})")
+        for _ in range(rng.randint(3, 6)):
+            lines.append(f"- {rng.choice(_VERBS)} {rng.choice(_OBJECTS)} using {', '.join(rng.sample(_SKILLS, 2))}.")
+        lines.append("")
+    lines += ["PROJECTS", f"- {rng.choice(_VERBS)} {rng.choice(_OBJECTS)} with {rng.choice(_SKILLS)}.", "",
+              "EDUCATION", "B.Tech in Computer Science, Example University", "",
+              "CERTIFICATIONS", f"{rng.choice(['AWS', 'Azure', 'Google Cloud'])} Fundamentals"]
+    return lines
+
+
+# -----------------------------
+# Writers
+# -----------------------------
+def _pdf_escape(text):
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)").encode("latin-1", "replace")
+
+
+def pdf_bytes(lines):
+    """
+    Build a minimal multi-page PDF with the lines as Helvetica text.
+    """
+    pages = [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)] or [[]]
+    font_id = 3
+    objects = {1: b"<< /Type /Catalog /Pages 2 0 R >>", font_id: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"}
+    page_ids = []
+    for index, page_lines in enumerate(pages):
+        page_id, content_id = 4 + 2 * index, 5 + 2 * index
+        stream = b"BT /F1 10 Tf 13 TL 50 800 Td " + b" ".join(b"(" + _pdf_escape(l) + b") '" for l in page_lines) + b" ET"
+        objects[content_id] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        objects[page_id] = (b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Contents %d 0 R"
+                            b" /Resources << /Font << /F1 %d 0 R >> >> >>" % (content_id, font_id))
+        page_ids.append(page_id)
+    objects[2] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % p for p in page_ids), len(page_ids))
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_id in sorted(objects):
+        offsets[obj_id] = out.tell()
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (obj_id, objects[obj_id]))
+    xref = out.tell()
+    count = max(objects) + 1
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % count)
+    for obj_id in range(1, count):
+        out.write(b"%010d 00000 n \n" % offsets[obj_id])
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (count, xref))
+    return out.getvalue()
+
+
+def docx_bytes(lines):
+    import docx
+    document = docx.Document()
+    for line in lines:
+        document.add_paragraph(line)
+    out = io.BytesIO()
+    document.save(out)
+    return out.getvalue()
+
+
+def build_corpus(directory, per_size=3, sizes=tuple(SIZES), formats=("pdf", "docx")):
+    """
+    Write per_size resumes of every size and format into directory. Returns
+    [(path, size, format)].
+    """
+    os.makedirs(directory, exist_ok=True)
+    corpus = []
+    for size in sizes:
+        for seed in range(per_size):
+            lines = make_resume(size, seed)
+            for fmt in formats:
+                path = os.path.join(directory, f"resume_{size}_{seed}.{fmt}")
+                with open(path, "wb") as fh:
+                    fh.write(pdf_bytes(lines) if fmt == "pdf" else docx_bytes(lines))
+                corpus.append((path, size, fmt))
+    return corpus
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic resume corpus.")
+    parser.add_argument("--out", required=True)
+    parser.add_argument("--per-size", type=int, default=3)
+    args = parser.parse_args(argv)
+    corpus = build_corpus(args.out, args.per_size)
+    print(f"Wrote {len(corpus)} resumes to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# benchmarks/load_test.py
+"""
+Multi-session load test of the Streamlit app with streamlit.testing.v1.AppTest. Each
+simulated user is a separate AppTest session that is already logged in and has a resume
+queued for analysis, so one run of app.py executes the full dashboard pipeline against the
+fake OpenAI server. Concurrency is doubled until the p95 session time exceeds --slo or a
+session fails; the last level that met the SLO is the instance's concurrency limit.
+
+    python -m benchmarks.load_test --latency 0.5 --token-rate 100 --slo 10 --max-sessions 64
+"""
+import os
+import sys
+import tempfile
+
+# Keep the load test's caches and stored dashboards out of the developer's .cache/
+os.environ.setdefault("SKILLMENTOR_CACHE_DIR", tempfile.mkdtemp(prefix="skillmentor-load-"))
+os.environ.setdefault("SKILLMENTOR_CACHE_DISABLED", "1")
+
+import json
+import time
+import argparse
+import statistics
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import llm_client
+from devtools.fake_openai_server import start_server
+from benchmarks.corpus import make_resume
+from required_skills import CAREER_GOALS, INTERESTS
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+_counter = iter(range(10 ** 9))
+_counter_lock = threading.Lock()
+
+
+def run_session(timeout):
+    """
+    Run one logged-in user through a dashboard analysis. Returns (seconds, error or None).
+    """
+    from streamlit.testing.v1 import AppTest
+    with _counter_lock:
+        n = next(_counter)
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    state = {
+        "logged_in": True, "user_id": f"load-user-{n}", "user_info": f"load{n}@example.com",
+        "data_loaded": True, "current_page": "dashboard", "resume_uploaded": True, "analysis_pending": True,
+        "resume_text": "\n".join(make_resume("medium", n)), "resume_hash": f"load-{n}",
+        "interests": INTERESTS[n % 3:n % 3 + 2], "career_goal": CAREER_GOALS[n % len(CAREER_GOALS)],
+        "want_projects": True,
+    }
+    for key, value in state.items():
+        at.session_state[key] = value
+    started = time.perf_counter()
+    try:
+        at.run()
+    except Exception as e:
+        return time.perf_counter() - started, f"{type(e).__name__}: {e}"
+    elapsed = time.perf_counter() - started
+    if at.exception:
+        return elapsed, str(at.exception[0].message)
+    if not at.session_state["analysis_result"]:
+        return elapsed, "no analysis result"
+    return elapsed, None
+
+
+def run_level(sessions, timeout):
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        results = list(pool.map(lambda _: run_session(timeout), range(sessions)))
+    wall = time.perf_counter() - started
+    times = sorted(t for t, error in results if error is None)
+    errors = [error for _, error in results if error is not None]
+    p95 = statistics.quantiles(times, n=100, method="inclusive")[94] if len(times) >= 2 else (times or [0])[0]
+    return {"sessions": sessions, "errors": len(errors), "first_error": errors[0] if errors else None,
+            "p50_s": round(statistics.median(times), 2) if times else None, "p95_s": round(p95, 2),
+            "sessions_per_min": round(60 * len(times) / wall, 1)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Find how many concurrent sessions one app instance sustains.")
+    parser.add_argument("--latency", type=float, default=0.5, help="Fake server seconds before the first token")
+    parser.add_argument("--token-rate", type=float, default=100.0, help="Fake server tokens per second")
+    parser.add_argument("--slo", type=float, default=10.0, help="p95 seconds per dashboard run to stay under")
+    parser.add_argument("--start", type=int, default=1, help="First concurrency level")
+    parser.add_argument("--max-sessions", type=int, default=32, help="Highest concurrency level tried")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per-session AppTest timeout")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    server, base_url = start_server(latency=args.latency, token_rate=args.token_rate)
+    llm_client.configure(base_url=base_url, api_key="fake")
+    llm_client.preload()
+
+    levels, limit = [], 0
+    sessions = args.start
+    try:
+        while sessions <= args.max_sessions:
+            result = run_level(sessions, args.timeout)
+            levels.append(result)
+            if not args.json:
+                print(f"{sessions:4d} sessions: p50 {result['p50_s']}s  p95 {result['p95_s']}s  "
+                      f"{result['sessions_per_min']} sessions/min  errors {result['errors']}"
+                      + (f" ({result['first_error']})" if result["first_error"] else ""))
+            if result["errors"] or result["p95_s"] > args.slo:
+                break
+            limit = sessions
+            sessions *= 2
+    finally:
+        server.shutdown()
+
+    if args.json:
+        print(json.dumps({"config": vars(args), "levels": levels, "concurrency_limit": limit}, indent=2))
+    else:
+        print(f"Concurrency limit at p95 <= {args.slo}s: {limit} sessions")
+    return 0 if limit else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
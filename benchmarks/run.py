@@ -0,0 +1,158 @@
+# benchmarks/run.py
+"""
+Stage benchmark against the local fake OpenAI server. Drives the PDF/DOCX extractors,
+evaluate_resume_profile, generate_learning_roadmap and suggest_projects over a synthetic
+resume corpus and reports throughput, p50/p95/p99 latency and peak heap memory per call.
+
+    python -m benchmarks.run --latency 0.3 --token-rate 200 --concurrency 4 --iterations 20
+    python -m benchmarks.run --cache --json > warm.json
+
+The LLM cache is disabled unless --cache is given, so every call reaches the fake server.
+"""
+import sys
+import json
+import time
+import argparse
+import tempfile
+import statistics
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import llm_cache
+import llm_client
+from devtools.fake_openai_server import start_server
+from benchmarks.corpus import build_corpus, SIZES
+from resume_ingest import extract_pdf_text, extract_docx_text, read_bytes
+from resume_analysis import evaluate_resume_profile
+from learning_roadmap import generate_learning_roadmap
+from project_recommendations import suggest_projects
+from required_skills import CAREER_GOALS, INTERESTS
+
+# A goal outside the precomputed table, so the required-skills prompt is exercised too
+FREE_TEXT_GOAL = "Robotics Software Engineer"
+MISSING_SKILL_SETS = [["Docker", "Kubernetes"], ["AWS", "Terraform", "Linux"], ["Machine Learning", "PyTorch"],
+                      ["React", "TypeScript", "GraphQL", "Redis"]]
+
+
+def summarize(name, latencies, errors, wall, peak_bytes):
+    ordered = sorted(latencies)
+    if len(ordered) >= 2:
+        cuts = statistics.quantiles(ordered, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = ordered[0] if ordered else 0.0
+    return {
+        "stage": name,
+        "runs": len(latencies) + errors,
+        "errors": errors,
+        "throughput_per_s": round(len(latencies) / wall, 2) if wall else 0.0,
+        "p50_ms": round(p50 * 1000, 1),
+        "p95_ms": round(p95 * 1000, 1),
+        "p99_ms": round(p99 * 1000, 1),
+        "peak_mem_mb": round(peak_bytes / 2 ** 20, 2),
+    }
+
+
+def peak_memory(func, item):
+    """
+    Peak Python heap allocated by one call. Measured in a separate, single-threaded call
+    because tracemalloc slows the timed runs down several-fold.
+    """
+    tracemalloc.start()
+    try:
+        func(item)
+        return tracemalloc.get_traced_memory()[1]
+    except Exception:
+        return 0
+    finally:
+        tracemalloc.stop()
+
+
+def run_stage(name, func, inputs, concurrency):
+    """
+    Call func on every input with `concurrency` threads; returns the stage summary.
+    """
+    def one(item):
+        started = time.perf_counter()
+        try:
+            func(item)
+        except Exception as e:
+            print(f"{name}: {type(e).__name__}: {e}", file=sys.stderr)
+            return None
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(one, inputs))
+    wall = time.perf_counter() - started
+    latencies = [r for r in results if r is not None]
+    return summarize(name, latencies, len(results) - len(latencies), wall, peak_memory(func, inputs[0]))
+
+
+def _cycle(items, count):
+    return [items[i % len(items)] for i in range(count)]
+
+
+def run_benchmarks(corpus, iterations, concurrency):
+    results = []
+    for size in SIZES:
+        for fmt, extract in (("pdf", extract_pdf_text), ("docx", extract_docx_text)):
+            files = [read_bytes(path) for path, s, f in corpus if s == size and f == fmt]
+            if files:
+                results.append(run_stage(f"extract_{fmt}[{size}]", extract, _cycle(files, iterations), concurrency))
+
+    texts = [extract_pdf_text(read_bytes(path)) for path, _, fmt in corpus if fmt == "pdf"]
+    goals = CAREER_GOALS + [FREE_TEXT_GOAL]
+    analysis_inputs = [(texts[i % len(texts)], INTERESTS[i % 3:i % 3 + 2], goals[i % len(goals)])
+                       for i in range(iterations)]
+    results.append(run_stage("evaluate_resume_profile", lambda args: evaluate_resume_profile(*args),
+                             analysis_inputs, concurrency))
+    results.append(run_stage("generate_learning_roadmap", generate_learning_roadmap,
+                             _cycle(MISSING_SKILL_SETS, iterations), concurrency))
+    results.append(run_stage("suggest_projects", suggest_projects, _cycle(goals, iterations), concurrency))
+    return results
+
+
+def print_table(results):
+    header = f"{'stage':28s} {'runs':>5s} {'err':>4s} {'ops/s':>8s} {'p50 ms':>9s} {'p95 ms':>9s} {'p99 ms':>9s} {'peak MB':>8s}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(f"{r['stage']:28s} {r['runs']:5d} {r['errors']:4d} {r['throughput_per_s']:8.2f} {r['p50_ms']:9.1f} "
+              f"{r['p95_ms']:9.1f} {r['p99_ms']:9.1f} {r['peak_mem_mb']:8.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark SkillMentor stages against a fake OpenAI server.")
+    parser.add_argument("--latency", type=float, default=0.2, help="Fake server seconds before the first token")
+    parser.add_argument("--token-rate", type=float, default=0.0, help="Fake server tokens per second (0 = instant)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Fraction of fake requests answered with 429")
+    parser.add_argument("--iterations", type=int, default=20, help="Calls per stage")
+    parser.add_argument("--concurrency", type=int, default=4, help="Threads per stage")
+    parser.add_argument("--per-size", type=int, default=2, help="Synthetic resumes per size class")
+    parser.add_argument("--corpus", help="Directory for the synthetic corpus (default: a temp dir)")
+    parser.add_argument("--cache", action="store_true", help="Keep the LLM cache enabled (warm-path numbers)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    llm_cache.CACHE_ENABLED = args.cache
+    server, base_url = start_server(latency=args.latency, token_rate=args.token_rate, fail_rate=args.fail_rate)
+    llm_client.configure(base_url=base_url, api_key="fake")
+    llm_client.preload()  # keep the one-off LangChain import out of the first timed call
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            corpus = build_corpus(args.corpus or tmp, args.per_size)
+            results = run_benchmarks(corpus, args.iterations, args.concurrency)
+    finally:
+        server.shutdown()
+
+    if args.json:
+        print(json.dumps({"config": vars(args), "results": results}, indent=2))
+    else:
+        print_table(results)
+    return 1 if any(r["errors"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
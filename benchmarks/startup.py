@@ -0,0 +1,117 @@
+# benchmarks/startup.py
+"""
+Cold-start import benchmark. Each scenario runs in a fresh interpreter under
+`python -X importtime`, and the import time up to the point where a page can render is
+reported (median over --runs):
+
+    login      streamlit + the login page modules
+    dashboard  everything the dashboard needs: pages, LLM stack, plotly, PDF/DOCX parsers
+
+    python benchmarks/startup.py --runs 5
+    python benchmarks/startup.py --write-baseline benchmarks/startup_baseline.json
+    python benchmarks/startup.py --baseline benchmarks/startup_baseline.json --tolerance 0.2
+
+With --baseline the exit status is 1 when a scenario is slower than baseline * (1 + tolerance).
+"""
+import os
+import re
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+from collections import defaultdict
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    "login": "import streamlit, firebase_auth, auth_pages",
+    "dashboard": ("import streamlit, firebase_auth, auth_pages, main_app, mongo_handler, llm_client; "
+                  "llm_client.preload(); import plotly.graph_objects, pdfplumber, docx"),
+}
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def parse_importtime(stderr):
+    """
+    Parse -X importtime output into (total_us, {top-level package: self_us}).
+    """
+    total, by_package = 0, defaultdict(int)
+    for line in stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if not match:
+            continue
+        self_us = int(match.group(1))
+        total += self_us
+        by_package[match.group(4).split(".")[0]] += self_us
+    return total, dict(by_package)
+
+
+def run_scenario(code):
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=REPO_ROOT, env=env,
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Scenario failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def measure(runs=5, top=8):
+    report = {}
+    for name, code in SCENARIOS.items():
+        totals, packages = [], defaultdict(list)
+        for _ in range(runs):
+            total, by_package = run_scenario(code)
+            totals.append(total)
+            for package, self_us in by_package.items():
+                packages[package].append(self_us)
+        heaviest = sorted(((statistics.median(v), p) for p, v in packages.items()), reverse=True)[:top]
+        report[name] = {
+            "median_ms": round(statistics.median(totals) / 1000, 1),
+            "max_ms": round(max(totals) / 1000, 1),
+            "heaviest_packages_ms": {p: round(us / 1000, 1) for us, p in heaviest},
+        }
+    return report
+
+
+def compare(report, baseline, tolerance):
+    regressions = []
+    for name, result in report.items():
+        reference = baseline.get(name, {}).get("median_ms")
+        if reference and result["median_ms"] > reference * (1 + tolerance):
+            regressions.append(f"{name}: {result['median_ms']} ms vs baseline {reference} ms")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure time-to-login-page and time-to-dashboard imports.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--baseline", help="Fail when slower than this baseline report")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown vs baseline (0.2 = 20%%)")
+    parser.add_argument("--write-baseline", help="Write the report to this file")
+    args = parser.parse_args(argv)
+
+    report = measure(args.runs)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for name, result in report.items():
+            heaviest = ", ".join(f"{p} {ms}" for p, ms in result["heaviest_packages_ms"].items())
+            print(f"{name:10s} median {result['median_ms']:8.1f} ms  max {result['max_ms']:8.1f} ms  ({heaviest})")
+
+    if args.write_baseline:
+        with open(args.write_baseline, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fh:
+            regressions = compare(report, json.load(fh), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
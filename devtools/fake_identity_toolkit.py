@@ -0,0 +1,149 @@
+# devtools/fake_identity_toolkit.py
+"""
+Local stand-in for the Firebase identity-toolkit and secure-token REST APIs, for exercising
+firebase_auth.py and the login page without a Firebase project.
+
+    python -m devtools.fake_identity_toolkit --port 9099 --latency 0.2 --fail-first 1
+    SKILLMENTOR_AUTH_URL=http://127.0.0.1:9099/v1 SKILLMENTOR_SECURE_TOKEN_URL=http://127.0.0.1:9099/v1 streamlit run app.py
+
+Accounts live in memory. Supports accounts:signUp, accounts:signInWithPassword and token
+(refresh), and can inject latency and TOO_MANY_ATTEMPTS_TRY_LATER failures.
+"""
+import json
+import time
+import uuid
+import argparse
+import threading
+from urllib.parse import urlparse, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeAuthConfig:
+    def __init__(self, latency=0.0, fail_first=0, expires_in=3600):
+        self.latency = latency          # seconds added to every response
+        self.fail_first = fail_first    # answer this many requests with TOO_MANY_ATTEMPTS_TRY_LATER
+        self.expires_in = expires_in    # ID token lifetime in seconds
+        self.requests = 0
+        self.accounts = {}              # email -> {"local_id", "password"}
+        self.refresh_tokens = {}        # refresh token -> local_id
+        self.lock = threading.Lock()
+
+    def should_fail(self):
+        with self.lock:
+            self.requests += 1
+            return self.requests <= self.fail_first
+
+
+# -----------------------------
+# HTTP Handler
+# -----------------------------
+class FakeIdentityToolkitHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    config = FakeAuthConfig()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, message, status=400):
+        self._send_json(status, {"error": {"code": status, "message": message,
+                                           "errors": [{"message": message, "domain": "global", "reason": "invalid"}]}})
+
+    def _issue_tokens(self, local_id):
+        config = self.config
+        refresh_token = uuid.uuid4().hex
+        with config.lock:
+            config.refresh_tokens[refresh_token] = local_id
+        return f"fake-id-token.{local_id}.{uuid.uuid4().hex[:8]}", refresh_token, str(config.expires_in)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        raw = self.rfile.read(length).decode("utf-8")
+        path = urlparse(self.path).path
+        config = self.config
+        time.sleep(config.latency)
+        if config.should_fail():
+            self._error("TOO_MANY_ATTEMPTS_TRY_LATER : Access to this account has been temporarily disabled.")
+            return
+
+        if path.endswith("/token"):
+            form = {k: v[0] for k, v in parse_qs(raw).items()}
+            with config.lock:
+                local_id = config.refresh_tokens.get(form.get("refresh_token"))
+            if form.get("grant_type") != "refresh_token" or local_id is None:
+                self._error("INVALID_REFRESH_TOKEN")
+                return
+            id_token, refresh_token, expires_in = self._issue_tokens(local_id)
+            self._send_json(200, {"id_token": id_token, "refresh_token": refresh_token, "expires_in": expires_in,
+                                  "token_type": "Bearer", "user_id": local_id, "project_id": "fake"})
+            return
+
+        request = json.loads(raw or "{}")
+        email, password = request.get("email", ""), request.get("password", "")
+        if path.endswith("/accounts:signUp"):
+            if "@" not in email:
+                self._error("INVALID_EMAIL")
+                return
+            if len(password) < 6:
+                self._error("WEAK_PASSWORD : Password should be at least 6 characters")
+                return
+            with config.lock:
+                if email in config.accounts:
+                    self._error("EMAIL_EXISTS")
+                    return
+                account = config.accounts[email] = {"local_id": uuid.uuid4().hex[:28], "password": password}
+        elif path.endswith("/accounts:signInWithPassword"):
+            with config.lock:
+                account = config.accounts.get(email)
+            if account is None or account["password"] != password:
+                self._error("INVALID_LOGIN_CREDENTIALS")
+                return
+        else:
+            self._error(f"Unknown path {path}", status=404)
+            return
+
+        id_token, refresh_token, expires_in = self._issue_tokens(account["local_id"])
+        self._send_json(200, {"kind": "identitytoolkit#VerifyPasswordResponse", "localId": account["local_id"],
+                              "email": email, "idToken": id_token, "refreshToken": refresh_token,
+                              "expiresIn": expires_in, "registered": True})
+
+
+def start_server(port=0, **config):
+    """
+    Start the fake server on a background thread. Returns (server, base_url), where base_url
+    serves as both SKILLMENTOR_AUTH_URL and SKILLMENTOR_SECURE_TOKEN_URL.
+    """
+    handler = type("ConfiguredFakeIdentityToolkitHandler", (FakeIdentityToolkitHandler,),
+                   {"config": FakeAuthConfig(**config)})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a fake Firebase identity-toolkit server.")
+    parser.add_argument("--port", type=int, default=9099)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--fail-first", type=int, default=0, help="Answer the first N requests with TOO_MANY_ATTEMPTS")
+    parser.add_argument("--expires-in", type=int, default=3600, help="ID token lifetime in seconds")
+    args = parser.parse_args()
+
+    server, base_url = start_server(args.port, latency=args.latency, fail_first=args.fail_first,
+                                    expires_in=args.expires_in)
+    print(f"Fake identity toolkit listening on {base_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
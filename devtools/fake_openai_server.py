@@ -0,0 +1,201 @@
+# devtools/fake_openai_server.py
+"""
+Local stand-in for the OpenAI chat completions API, for exercising the LLM client and the
+SkillMentor prompts without network access or API spend.
+
+    python -m devtools.fake_openai_server --port 8765 --latency 0.5 --token-rate 50
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=test streamlit run app.py
+
+Responses are canned per prompt type (analysis JSON, roadmap/project arrays, job title),
+and the server can inject latency, a token rate, 429/500 failures and, for chosen models,
+answers that are not valid JSON (to exercise model escalation).
+"""
+import re
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeConfig:
+    def __init__(self, latency=0.0, token_rate=0.0, fail_first=0, fail_rate=0.0, fail_status=429,
+                 malformed_models=()):
+        self.latency = latency          # seconds before the first token
+        self.token_rate = token_rate    # tokens per second after that; 0 = instant
+        self.fail_first = fail_first    # fail this many requests before succeeding
+        self.fail_rate = fail_rate      # then fail this fraction of requests at random
+        self.fail_status = fail_status
+        self.malformed_models = set(malformed_models)  # these models answer with prose instead of JSON
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def should_fail(self):
+        with self.lock:
+            self.requests += 1
+            if self.requests <= self.fail_first:
+                return True
+        return random.random() < self.fail_rate
+
+
+# -----------------------------
+# Canned Responses
+# -----------------------------
+def _skills_after(label, prompt):
+    match = re.search(label + r"\s*:?\s*(.+)", prompt)
+    if not match:
+        return ["Python", "SQL", "Docker"]
+    return [s.strip() for s in match.group(1).split(",") if s.strip()]
+
+
+def respond(prompt):
+    """
+    Pick a plausible response for one of the SkillMentor prompts.
+    """
+    if "recommended_course" in prompt:
+        skills = _skills_after("missing the following skills", prompt)
+        return json.dumps([{"skill": s, "recommended_course": f"{s} Fundamentals", "platform": "Coursera",
+                            "estimated_duration": "2-3 weeks"} for s in skills], indent=2)
+    if "project_name" in prompt:
+        return json.dumps([
+            {"project_name": "Portfolio Website", "description": "Build and deploy a personal portfolio.",
+             "estimated_duration": "1-2 weeks"},
+            {"project_name": "REST API Service", "description": "Design a CRUD API with authentication.",
+             "estimated_duration": "2-3 weeks"},
+            {"project_name": "Data Dashboard", "description": "Visualise a public dataset end to end.",
+             "estimated_duration": "2 weeks"},
+        ], indent=2)
+    if "JSON array of recommendation strings" in prompt:
+        skills = _skills_after("missing these skills", prompt)
+        return json.dumps([f"Take an introductory {s} course and build a small project with it." for s in skills[:5]])
+    if "core skills required for" in prompt:
+        return json.dumps(["Python", "SQL", "Git", "Docker", "REST APIs", "Linux", "Unit Testing", "AWS"])
+    if "JSON array of skill names" in prompt:
+        return json.dumps(["Python", "SQL", "Git", "Excel"])
+    if "required_skills" in prompt:
+        return "```json\n" + json.dumps({
+            "required_skills": ["Python", "SQL", "Docker", "AWS", "Machine Learning"],
+            "recommendations": ["Take a Docker course on Udemy.", "Earn the AWS Cloud Practitioner certificate.",
+                                "Complete Andrew Ng's Machine Learning Specialization on Coursera."],
+        }, indent=2) + "\n```"
+    if "job title" in prompt.lower():
+        return "Data Scientist"
+    return "OK"
+
+
+def _tokens(text):
+    # Split into word-ish pieces so streaming looks like real token deltas
+    return re.findall(r"\s*\S+", text) or [text]
+
+
+# -----------------------------
+# HTTP Handler
+# -----------------------------
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    config = FakeConfig()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+            return
+
+        config = self.config
+        if config.should_fail():
+            self._send_json(config.fail_status, {"error": {"message": "Injected failure", "type": "fake"}},
+                            headers={"Retry-After": "0"})
+            return
+
+        prompt = "\n".join(str(m.get("content", "")) for m in request.get("messages", []))
+        model = request.get("model", "gpt-4o")
+        text = respond(prompt)
+        if model in config.malformed_models and text.lstrip()[:1] in "[{":
+            text = "Sure! I would suggest starting with the basics and building small projects."
+        prompt_tokens = max(1, len(prompt) // 4)
+        pieces = _tokens(text)
+        delay = 1.0 / config.token_rate if config.token_rate else 0.0
+        time.sleep(config.latency)
+
+        if not request.get("stream"):
+            time.sleep(delay * len(pieces))
+            self._send_json(200, {
+                "id": "chatcmpl-fake", "object": "chat.completion", "created": int(time.time()), "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": len(pieces),
+                          "total_tokens": prompt_tokens + len(pieces)},
+            })
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        for i, piece in enumerate(pieces + [None]):
+            delta = {"content": piece} if piece is not None else {}
+            if i == 0:
+                delta["role"] = "assistant"
+            chunk = {"id": "chatcmpl-fake", "object": "chat.completion.chunk", "created": int(time.time()),
+                     "model": model, "choices": [{"index": 0, "delta": delta,
+                                                  "finish_reason": None if piece is not None else "stop"}]}
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+            if piece is not None:
+                time.sleep(delay)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+        self.close_connection = True
+
+
+def start_server(port=0, **config):
+    """
+    Start the fake server on a background thread. Returns (server, base_url);
+    call server.shutdown() when done.
+    """
+    handler = type("ConfiguredFakeOpenAIHandler", (FakeOpenAIHandler,), {"config": FakeConfig(**config)})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a fake OpenAI chat completions server.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds before the first token")
+    parser.add_argument("--token-rate", type=float, default=0.0, help="Tokens per second (0 = instant)")
+    parser.add_argument("--fail-first", type=int, default=0, help="Fail the first N requests")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Fraction of requests to fail")
+    parser.add_argument("--fail-status", type=int, default=429)
+    parser.add_argument("--malformed-models", default="", help="Comma-separated models that return broken JSON")
+    args = parser.parse_args()
+
+    server, base_url = start_server(args.port, latency=args.latency, token_rate=args.token_rate,
+                                    fail_first=args.fail_first, fail_rate=args.fail_rate,
+                                    fail_status=args.fail_status,
+                                    malformed_models=[m for m in args.malformed_models.split(",") if m])
+    print(f"Fake OpenAI server listening on {base_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
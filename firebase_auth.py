@@ -0,0 +1,170 @@
+# firebase_auth.py
+"""
+Firebase email/password auth over one pooled HTTP session. Every call has a strict timeout,
+TOO_MANY_ATTEMPTS_TRY_LATER and transient failures are retried with backoff (sign-up only
+when the request cannot have reached Firebase, sign-in never when throttled), and the ID
+token in the account record returned at sign-in is refreshed shortly before it expires.
+Callers keep that record in their session; nothing is cached here per user.
+
+Point it at the local fake server for development:
+
+    python -m devtools.fake_identity_toolkit --port 9099
+    SKILLMENTOR_AUTH_URL=http://127.0.0.1:9099/v1 SKILLMENTOR_SECURE_TOKEN_URL=http://127.0.0.1:9099/v1 streamlit run app.py
+"""
+import os
+import time
+import random
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from firebase_config import firebaseConfig
+
+# -----------------------------
+# Configuration
+# -----------------------------
+API_KEY = firebaseConfig.get("apiKey")
+AUTH_URL = os.getenv("SKILLMENTOR_AUTH_URL", "https://identitytoolkit.googleapis.com/v1")
+SECURE_TOKEN_URL = os.getenv("SKILLMENTOR_SECURE_TOKEN_URL", "https://securetoken.googleapis.com/v1")
+CONNECT_TIMEOUT = float(os.getenv("SKILLMENTOR_AUTH_CONNECT_TIMEOUT", 3))
+READ_TIMEOUT = float(os.getenv("SKILLMENTOR_AUTH_TIMEOUT", 10))
+MAX_RETRIES = int(os.getenv("SKILLMENTOR_AUTH_MAX_RETRIES", 2))
+BACKOFF_BASE = float(os.getenv("SKILLMENTOR_AUTH_BACKOFF_BASE", 0.5))
+BACKOFF_MAX = 4.0
+REFRESH_MARGIN_SECONDS = 300  # refresh ID tokens this long before they expire
+POOL_SIZE = 10
+
+RETRYABLE_CODES = {"TOO_MANY_ATTEMPTS_TRY_LATER"}
+# Token refresh failures meaning the session is over, not that Firebase is briefly unavailable
+SESSION_ENDED_CODES = {"TOKEN_EXPIRED", "USER_DISABLED", "USER_NOT_FOUND", "INVALID_REFRESH_TOKEN"}
+
+_lock = threading.Lock()
+_session = None
+
+
+class AuthError(Exception):
+    """
+    A Firebase auth failure. code is the Firebase error code (e.g. "EMAIL_EXISTS"),
+    or "NETWORK_ERROR" when the endpoint could not be reached in time.
+    """
+
+    def __init__(self, code, message=None):
+        super().__init__(message or code)
+        self.code = code
+
+
+def configure(auth_url=None, secure_token_url=None, api_key=None):
+    """
+    Re-point the client (e.g. at the fake identity-toolkit server).
+    """
+    global AUTH_URL, SECURE_TOKEN_URL, API_KEY
+    with _lock:
+        if auth_url is not None:
+            AUTH_URL = auth_url
+        if secure_token_url is not None:
+            SECURE_TOKEN_URL = secure_token_url
+        if api_key is not None:
+            API_KEY = api_key
+
+
+# -----------------------------
+# Transport
+# -----------------------------
+def get_session():
+    """
+    Process-wide requests.Session, so logins reuse pooled keep-alive connections.
+    """
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+def _error_code(response):
+    try:
+        message = response.json()["error"]["message"]
+    except (ValueError, KeyError, TypeError):
+        return f"HTTP_{response.status_code}", response.text[:200]
+    # Firebase messages look like "WEAK_PASSWORD : Password should be at least 6 characters"
+    return message.split(" ")[0], message
+
+
+def _post(url, idempotent=True, retry_codes=RETRYABLE_CODES, **kwargs):
+    """
+    POST with timeouts, retrying retry_codes, 5xx and connection errors with jittered
+    exponential backoff. Returns the decoded JSON body or raises AuthError.
+    A non-idempotent request is not retried after failures where it may already have been
+    applied (read timeout, dropped connection, 5xx), only when it never reached the server.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        last_attempt = attempt == MAX_RETRIES
+        try:
+            response = get_session().post(url, params={"key": API_KEY},
+                                          timeout=(CONNECT_TIMEOUT, READ_TIMEOUT), **kwargs)
+        except requests.exceptions.RequestException as e:
+            unsent = isinstance(e, requests.exceptions.ConnectTimeout)
+            if last_attempt or not (idempotent or unsent):
+                raise AuthError("NETWORK_ERROR", str(e)) from e
+        else:
+            if response.ok:
+                return response.json()
+            code, message = _error_code(response)
+            retryable = code in retry_codes or (idempotent and response.status_code >= 500)
+            if last_attempt or not retryable:
+                raise AuthError(code, message)
+        time.sleep(random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt))))
+
+
+# -----------------------------
+# Tokens
+# -----------------------------
+def _account(user_id, email, id_token, refresh_token, expires_in):
+    return {"user_id": user_id, "email": email, "id_token": id_token, "refresh_token": refresh_token,
+            "expires_at": time.time() + int(expires_in or 3600)}
+
+
+def get_id_token(account, force_refresh=False):
+    """
+    Return a valid ID token for an account record from sign_in/sign_up, refreshing it
+    through the secure token endpoint (and updating the record in place) only when it is
+    about to expire. Returns None without an account.
+    """
+    if not account:
+        return None
+    if not force_refresh and account["expires_at"] - REFRESH_MARGIN_SECONDS > time.time():
+        return account["id_token"]
+    data = _post(f"{SECURE_TOKEN_URL}/token",
+                 data={"grant_type": "refresh_token", "refresh_token": account["refresh_token"]})
+    account.update(_account(account["user_id"], account["email"], data["id_token"], data["refresh_token"],
+                            data.get("expires_in")))
+    return account["id_token"]
+
+
+# -----------------------------
+# Account Operations
+# -----------------------------
+def sign_up(email, password):
+    """
+    Create an account. Returns {"user_id", "email", "id_token", "refresh_token", "expires_at"}.
+    Not retried once the request may have reached Firebase, since a retry of a sign-up that
+    did go through fails with EMAIL_EXISTS; NETWORK_ERROR or HTTP_5xx then means unknown.
+    """
+    data = _post(f"{AUTH_URL}/accounts:signUp", idempotent=False,
+                 json={"email": email, "password": password, "returnSecureToken": True})
+    return _account(data["localId"], email, data.get("idToken"), data.get("refreshToken"), data.get("expiresIn"))
+
+
+def sign_in(email, password):
+    """
+    Sign in with email and password. Returns the same record as sign_up. Throttling is not
+    retried: for sign-in it means the account is locked after failed attempts, and every
+    retry would count as another one.
+    """
+    data = _post(f"{AUTH_URL}/accounts:signInWithPassword", retry_codes=(),
+                 json={"email": email, "password": password, "returnSecureToken": True})
+    return _account(data["localId"], email, data.get("idToken"), data.get("refreshToken"), data.get("expiresIn"))
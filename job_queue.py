@@ -0,0 +1,337 @@
+# job_queue.py
+"""
+Background jobs for LLM work, so Streamlit script runs only submit and poll instead of
+blocking on OpenAI calls.
+
+    job_id = job_queue.submit("roadmap", missing_skills=["Docker", "AWS"])
+    job = job_queue.status(job_id)   # {"status": "running", "items": [...], ...}
+
+Jobs are identified by a hash of their kind and inputs, so identical requests from reruns,
+other tabs or other users share one job (single-flight), and a finished job is picked up by
+whichever rerun polls next. Jobs are persisted in SQLite next to the LLM cache: rows left
+queued or running by a process that died are requeued, and finished results are kept for
+SKILLMENTOR_JOB_TTL seconds. Large text params (resume text) are persisted by content hash
+in session_store rather than inline, and the running process heartbeats its jobs so that
+slow ones (LLM retries included) are not mistaken for abandoned ones.
+"""
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import metrics
+import session_store
+from llm_cache import CACHE_DIR, normalize_input
+
+logger = logging.getLogger(__name__)
+
+JOB_DB_PATH = os.getenv("SKILLMENTOR_JOB_DB", os.path.join(CACHE_DIR, "jobs.sqlite3"))
+JOB_WORKERS = int(os.getenv("SKILLMENTOR_JOB_WORKERS", 4))
+JOB_TTL_SECONDS = int(os.getenv("SKILLMENTOR_JOB_TTL", 3600))
+# A queued/running job without a heartbeat for this long is assumed to belong to a dead process
+STALE_SECONDS = int(os.getenv("SKILLMENTOR_JOB_STALE", 300))
+HEARTBEAT_SECONDS = max(1, STALE_SECONDS // 5)
+PROGRESS_INTERVAL = 1.0  # seconds between writes of streamed items to SQLite
+INLINE_PARAM_CHARS = 1024  # longer string params are stored by content hash
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+# kind -> (func, streaming, check); see register()
+_handlers = {}
+
+
+def register(kind, func, streaming=False, check=None):
+    """
+    Make func(**params) available as job kind. A streaming func returns an iterator whose
+    items are published as they arrive and collected into the result list. check(result)
+    returns an error message for results that report a failure instead of raising (e.g. a
+    failed parse); such jobs are recorded as failed, so the next submission runs them again.
+    """
+    _handlers[kind] = (func, streaming, check)
+
+
+def job_id(kind, **params):
+    encoded = json.dumps({"kind": kind, "params": normalize_input(params)}, sort_keys=True,
+                         ensure_ascii=False, default=str)
+    return f"{kind}:{hashlib.sha256(encoded.encode('utf-8')).hexdigest()}"
+
+
+# -----------------------------
+# Persistent Store
+# -----------------------------
+def _pack(params):
+    """
+    Params as persisted: long strings become {"$blob": digest, "size": n} references into
+    session_store, so the job table holds no resume text.
+    """
+    packed = {}
+    for name, value in params.items():
+        if isinstance(value, str) and len(value) > INLINE_PARAM_CHARS:
+            handle = session_store.offload(value)
+            value = {"$blob": handle.digest, "size": handle.size}
+        packed[name] = value
+    return packed
+
+
+def _unpack(params):
+    """
+    Params with blob references resolved, or None if a referenced value has expired.
+    """
+    unpacked = {}
+    for name, value in params.items():
+        if isinstance(value, dict) and "$blob" in value:
+            value = session_store.resolve(session_store.Handle(value["$blob"], value["size"]))
+            if value is None:
+                return None
+        unpacked[name] = value
+    return unpacked
+
+
+class JobStore:
+    """
+    One row per job: kind, params, status, streamed items, result and error as JSON text.
+    """
+
+    def __init__(self, path=JOB_DB_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " id TEXT PRIMARY KEY,"
+                " kind TEXT NOT NULL,"
+                " params TEXT NOT NULL,"
+                " status TEXT NOT NULL,"
+                " items TEXT NOT NULL DEFAULT '[]',"
+                " result TEXT,"
+                " error TEXT,"
+                " created_at REAL NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, updated_at)")
+
+    def get(self, id):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT kind, params, status, items, result, error, updated_at FROM jobs WHERE id = ?", (id,)
+            ).fetchone()
+        if row is None:
+            return None
+        kind, params, status, items, result, error, updated_at = row
+        return {"id": id, "kind": kind, "params": json.loads(params), "status": status,
+                "items": json.loads(items), "result": json.loads(result) if result is not None else None,
+                "error": error, "updated_at": updated_at}
+
+    def enqueue(self, id, kind, params):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs (id, kind, params, status, items, result, error, created_at, updated_at)"
+                " VALUES (?, ?, ?, ?, '[]', NULL, NULL, ?, ?)",
+                (id, kind, json.dumps(_pack(params), ensure_ascii=False, default=str), QUEUED, now, now),
+            )
+            self._conn.execute("DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+                               (DONE, FAILED, now - JOB_TTL_SECONDS))
+
+    def update(self, id, status, items=None, result=None, error=None):
+        fields = {"status": status, "updated_at": time.time()}
+        if items is not None:
+            fields["items"] = json.dumps(items, ensure_ascii=False, default=str)
+        if result is not None:
+            fields["result"] = json.dumps(result, ensure_ascii=False, default=str)
+        if error is not None:
+            fields["error"] = error
+        with self._lock, self._conn:
+            self._conn.execute(f"UPDATE jobs SET {', '.join(f'{k} = ?' for k in fields)} WHERE id = ?",
+                               (*fields.values(), id))
+
+    def touch(self, ids):
+        """
+        Heartbeat: mark queued/running jobs as still owned by a live process.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"UPDATE jobs SET updated_at = ? WHERE status IN (?, ?) AND id IN ({', '.join('?' * len(ids))})",
+                (time.time(), QUEUED, RUNNING, *ids),
+            )
+
+    def delete(self, id):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM jobs WHERE id = ?", (id,))
+
+    def stale(self):
+        """
+        (id, kind, params) of queued/running jobs nobody has touched for STALE_SECONDS.
+        params is None when a value it referenced has expired from session_store.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, kind, params FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+                (QUEUED, RUNNING, time.time() - STALE_SECONDS),
+            ).fetchall()
+        return [(id, kind, _unpack(json.loads(params))) for id, kind, params in rows]
+
+
+# -----------------------------
+# Worker Pool
+# -----------------------------
+class JobQueue:
+    """
+    Runs jobs on a bounded thread pool. In-flight jobs are also tracked in memory, so
+    polling them does not touch SQLite and duplicate submissions return immediately;
+    streamed items reach SQLite (for other processes) at most every PROGRESS_INTERVAL.
+    """
+
+    def __init__(self, store, workers=JOB_WORKERS):
+        self.store = store
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="skillmentor-job")
+        self._inflight = {}   # id -> live job dict, shared with the worker
+        self._lock = threading.Lock()
+        threading.Thread(target=self._heartbeat, name="skillmentor-job-heartbeat", daemon=True).start()
+
+    def _heartbeat(self):
+        while True:
+            time.sleep(HEARTBEAT_SECONDS)
+            with self._lock:
+                ids = list(self._inflight)
+            if ids:
+                try:
+                    self.store.touch(ids)
+                except sqlite3.Error:
+                    logger.exception("job heartbeat failed")
+
+    def submit(self, kind, **params):
+        if kind not in _handlers:
+            raise KeyError(f"Unknown job kind: {kind}")
+        id = job_id(kind, **params)
+        with self._lock:
+            if id in self._inflight:
+                metrics.inc("jobs_submitted_total", kind=kind, result="coalesced")
+                return id
+            row = self.store.get(id)
+            if row is not None and (row["status"] == DONE or
+                                    (row["status"] in (QUEUED, RUNNING) and row["updated_at"] > time.time() - STALE_SECONDS)):
+                # Finished, or running in another process that shares the database
+                metrics.inc("jobs_submitted_total", kind=kind, result="reused")
+                return id
+            self._start(id, kind, params)
+        metrics.inc("jobs_submitted_total", kind=kind, result="queued")
+        return id
+
+    def _start(self, id, kind, params):
+        self.store.enqueue(id, kind, params)
+        job = {"id": id, "kind": kind, "status": QUEUED, "items": [], "result": None, "error": None}
+        self._inflight[id] = job
+        self._executor.submit(self._run, job, params)
+
+    def _run(self, job, params):
+        func, streaming, check = _handlers[job["kind"]]
+        job["status"] = RUNNING
+        self.store.update(job["id"], RUNNING)
+        try:
+            with metrics.timer(f"job.{job['kind']}"):
+                output = func(**params)
+                if streaming:
+                    written = time.monotonic()
+                    for item in output:
+                        job["items"].append(item)
+                        if time.monotonic() - written >= PROGRESS_INTERVAL:
+                            self.store.update(job["id"], RUNNING, items=job["items"])
+                            written = time.monotonic()
+                    output = list(job["items"])
+        except Exception as e:
+            logger.exception("job %s failed", job["id"])
+            job["error"] = f"{type(e).__name__}: {e}"
+            job["status"] = FAILED
+            self.store.update(job["id"], FAILED, items=job["items"], error=job["error"])
+        else:
+            job["result"] = output
+            job["error"] = check(output) if check is not None else None
+            if job["error"]:
+                logger.warning("job %s returned a failure: %s", job["id"], job["error"][:200])
+                self.store.update(job["id"], FAILED, items=job["items"], result=output, error=job["error"])
+                job["status"] = FAILED
+            else:
+                self.store.update(job["id"], DONE, items=job["items"], result=output)
+                job["status"] = DONE
+        finally:
+            with self._lock:
+                self._inflight.pop(job["id"], None)
+
+    def status(self, id):
+        """
+        {"status", "items", "result", "error"} for a job, or None if it is unknown (expired).
+        """
+        job = self._inflight.get(id)
+        if job is not None:
+            return {"status": job["status"], "items": list(job["items"]), "result": job["result"],
+                    "error": job["error"]}
+        row = self.store.get(id)
+        if row is None:
+            return None
+        return {k: row[k] for k in ("status", "items", "result", "error")}
+
+    def forget(self, id):
+        """
+        Drop a finished job so the next identical submission runs it again.
+        """
+        with self._lock:
+            if id not in self._inflight:
+                self.store.delete(id)
+
+    def recover(self):
+        """
+        Requeue jobs abandoned by a process that stopped while they were queued or running.
+        """
+        with self._lock:
+            for id, kind, params in self.store.stale():
+                if id in self._inflight or kind not in _handlers:
+                    continue
+                if params is None:
+                    logger.info("dropping abandoned job %s whose inputs have expired", id)
+                    self.store.delete(id)
+                    continue
+                logger.info("requeueing abandoned job %s", id)
+                self._start(id, kind, params)
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_queue():
+    """
+    Return the process-wide job queue, creating it (and requeueing abandoned jobs) on first use.
+    """
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                queue = JobQueue(JobStore())
+                queue.recover()
+                _queue = queue
+    return _queue
+
+
+def submit(kind, **params):
+    """
+    Start kind(**params) in the background unless an identical job is already running or
+    finished; returns the job id either way.
+    """
+    return get_queue().submit(kind, **params)
+
+
+def status(id):
+    return get_queue().status(id)
+
+
+def forget(id):
+    get_queue().forget(id)
@@ -1,60 +1,214 @@
-import os
-import json
-from langchain_community.chat_models import ChatOpenAI
-from langchain.chains import LLMChain
-from langchain.prompts import PromptTemplate
+import llm_cache
+import metrics
+import semantic_cache
+import model_router
+from llm_streaming import iter_json_array_items
+from structured_output import parse_structured, validate_item
+from skill_extractor import canonicalize_skill, canonicalize_skills
+from skill_graph import order_skills
 
-def generate_learning_roadmap(missing_skills):
-    """
-    Generate a structured learning roadmap for missing skills using GPT-4o.
-    Handles GPT responses wrapped inside a "text" field.
-    Returns a list of dicts: skill, recommended_course, platform, estimated_duration.
-    """
-    if not missing_skills:
-        return [{"message": "No missing skills detected. No roadmap needed."}]
-
-    prompt = f"""
+def _build_prompt(missing_skills):
+    return f"""
 You are a career coach.
 
 The user is missing the following skills: {', '.join(missing_skills)}
 
 Tasks:
-1. Generate a structured learning roadmap to bridge these skill gaps.
-2. Suggest relevant online courses from Tap Academy courses in Youtube if available, Udemy, Coursera, edX, Infosys Springboard and provide the best platform to learn.
-3. Provide the order in which the skills should be learned.
-4. Give an estimated timeline for each skill/course (e.g., 1-2 weeks, 2-3 weeks or in months).
+1. For each skill, suggest the most relevant online course from Tap Academy courses in Youtube if available, Udemy, Coursera, edX, Infosys Springboard and provide the best platform to learn.
+2. Give an estimated timeline for each skill/course (e.g., 1-2 weeks, 2-3 weeks or in months).
 
-Important: Return ONLY a JSON array of objects with keys:
-- skill
+Important: Return ONLY a JSON array with exactly one object per skill, with keys:
+- skill (exactly as given above)
 - recommended_course
 - platform
 - estimated_duration
 Do NOT include explanations, Markdown, or extra text.
 """
 
-    llm = ChatOpenAI(model="gpt-4o", api_key=os.getenv("OPENAI_API_KEY"), temperature=0)
-    chain = LLMChain(llm=llm, prompt=PromptTemplate(template=prompt, input_variables=[]))
-
-    # Call GPT
-    response = chain.invoke({})  # returns dict like {"text": "..."} in some versions
+def _parse_roadmap(response_text):
+    """
+    Parse the full response text. Returns (roadmap, ok).
+    """
+    roadmap, error = parse_structured(response_text, "roadmap")
+    if error:
+        return [{"message": "Failed to parse GPT JSON output. Raw output: " + response_text}], False
+    return roadmap, True
 
-    # If GPT returns a dict with 'text', extract it
-    if isinstance(response, dict) and "text" in response:
-        response_text = response["text"]
-    else:
-        response_text = str(response)
+# -----------------------------
+# Per-skill Entries
+# -----------------------------
+# Roadmaps are assembled from one cached entry per skill, so users missing {Docker, AWS} and
+# {Docker, Kubernetes, AWS} share the Docker and AWS entries; only uncached skills go to GPT.
+def _entry_key(skill):
+    return llm_cache.make_key("roadmap_entry", model_router.model_for("learning_roadmap"), skill=skill.lower())
 
-    # Clean up code fences
-    response_text = response_text.replace("```json", "").replace("```", "").strip()
+def _cached_entries(skills):
+    entries = {}
+    for skill in skills:
+        entry = llm_cache.lookup(_entry_key(skill))
+        if entry is not None:
+            entries[skill] = entry
+    return entries
 
-    # Parse JSON
-    try:
-        roadmap = json.loads(response_text)
-    except json.JSONDecodeError:
-        roadmap = [{"message": "Failed to parse GPT JSON output. Raw output: " + response_text}]
+def _assign(item, pending):
+    """
+    Match a generated entry to the pending skill with the same canonical name, cache it and
+    return (skill, entry). Entries that match no pending skill are neither cached nor used,
+    since the shared per-skill cache must never hold steps for another skill.
+    """
+    name = canonicalize_skill(item.get("skill", "")).lower()
+    skill = next((s for s in pending if s.lower() == name), None)
+    if skill is None:
+        return None
+    pending.remove(skill)
+    entry = dict(item, skill=skill)
+    llm_cache.store(_entry_key(skill), entry)
+    return skill, entry
 
-    # Ensure always a list
-    if not isinstance(roadmap, list):
-        roadmap = [roadmap]
+def _retry_entries(pending, entries):
+    """
+    One more request for skills the first answer did not cover (escalated to the large tier
+    when routing allows). Whatever is still missing afterwards stays uncached.
+    """
+    prompt = _build_prompt(pending)
+    result = model_router.escalate("learning_roadmap", prompt, "roadmap", reason="incomplete") or \
+        model_router.complete_structured("learning_roadmap", prompt, "roadmap")
+    items, error, _ = result
+    for item in items if not error else []:
+        assigned = _assign(item, pending)
+        if assigned:
+            entries[assigned[0]] = assigned[1]
 
+def _store_roadmap(cache_key, missing_skills, skills, entries):
+    """
+    The roadmap in prerequisite order. Only complete roadmaps are cached whole; an incomplete
+    one ends with a "Failed ..." message naming the skills without an entry, so it is neither
+    saved nor reused and the gaps are retried per skill next time.
+    """
+    order = order_skills(skills)
+    roadmap = [entries[s] for s in order if s in entries]
+    missing = [s for s in order if s not in entries]
+    if missing:
+        return roadmap + [{"message": "Failed to generate entries for: " + ", ".join(missing)}]
+    llm_cache.store(cache_key, roadmap)
+    semantic_cache.remember_roadmap(missing_skills, cache_key)
     return roadmap
+
+def _cached_roadmap(cache_key, missing_skills):
+    cached = llm_cache.lookup(cache_key)
+    if cached is None:
+        # Near-duplicate request (reordered/aliased skills)
+        cached = semantic_cache.lookup_roadmap(missing_skills)
+        if cached is not None:
+            llm_cache.store(cache_key, cached)
+    return cached
+
+@metrics.timed("generate_learning_roadmap")
+def generate_learning_roadmap(missing_skills):
+    """
+    Generate a structured learning roadmap for missing skills with the model routed for
+    learning_roadmap (small tier, escalated when its output does not validate).
+    Returns a list of dicts: skill, recommended_course, platform, estimated_duration,
+    in prerequisite order.
+    """
+    if not missing_skills:
+        return [{"message": "No missing skills detected. No roadmap needed."}]
+
+    # Serve repeated requests (Streamlit reruns, other users) from the cache
+    cache_key = llm_cache.make_key("learning_roadmap", model_router.model_for("learning_roadmap"),
+                                   missing_skills=list(missing_skills))
+    cached = _cached_roadmap(cache_key, missing_skills)
+    if cached is not None:
+        return cached
+
+    skills = canonicalize_skills(missing_skills)
+    entries = _cached_entries(skills)
+    pending = [s for s in skills if s not in entries]
+    if pending:
+        # One call for every uncached skill (small-tier model, escalated if its output does not validate)
+        items, error, response_text = model_router.complete_structured(
+            "learning_roadmap", _build_prompt(pending), "roadmap")
+        if error:
+            return [entries[s] for s in order_skills(skills) if s in entries] + \
+                [{"message": "Failed to parse GPT JSON output. Raw output: " + response_text}]
+        for item in items:
+            assigned = _assign(item, pending)
+            if assigned:
+                entries[assigned[0]] = assigned[1]
+        if pending:
+            _retry_entries(pending, entries)
+    return _store_roadmap(cache_key, missing_skills, skills, entries)
+
+def stream_learning_roadmap(missing_skills):
+    """
+    Streaming variant of generate_learning_roadmap: yields entries in prerequisite order,
+    each as soon as it and every entry before it are available (cached entries at once,
+    generated ones as their JSON objects complete). Shares the caches with
+    generate_learning_roadmap.
+    """
+    if not missing_skills:
+        yield {"message": "No missing skills detected. No roadmap needed."}
+        return
+
+    cache_key = llm_cache.make_key("learning_roadmap", model_router.model_for("learning_roadmap"),
+                                   missing_skills=list(missing_skills))
+    cached = _cached_roadmap(cache_key, missing_skills)
+    if cached is not None:
+        yield from cached
+        return
+
+    skills = canonicalize_skills(missing_skills)
+    order = order_skills(skills)
+    entries = _cached_entries(skills)
+    pending = [s for s in skills if s not in entries]
+    emitted = 0
+
+    def flush():
+        nonlocal emitted
+        while emitted < len(order) and order[emitted] in entries:
+            yield entries[order[emitted]]
+            emitted += 1
+
+    yield from flush()
+    if pending:
+        chunks = []
+        def tee():
+            for chunk in model_router.stream("learning_roadmap", _build_prompt(pending)):
+                chunks.append(chunk)
+                yield chunk
+
+        streamed = 0
+        for item in iter_json_array_items(tee()):
+            # Items that do not fit the schema are dropped before they are shown or cached
+            item = validate_item(item, "roadmap")
+            if item is None:
+                continue
+            streamed += 1
+            assigned = _assign(item, pending)
+            if assigned:
+                entries[assigned[0]] = assigned[1]
+                yield from flush()
+
+        if not streamed:
+            # Not an array (or nothing valid): fall back to parsing the whole response
+            items, ok = _parse_roadmap("".join(chunks))
+            if not ok:
+                escalated = model_router.escalate("learning_roadmap", _build_prompt(pending), "roadmap")
+                if escalated is not None and escalated[1] is None:
+                    items, ok = escalated[0], True
+            if not ok:
+                yield from (entries[s] for s in order[emitted:] if s in entries)
+                yield from items
+                return
+            for item in items:
+                assigned = _assign(item, pending)
+                if assigned:
+                    entries[assigned[0]] = assigned[1]
+        if pending:
+            _retry_entries(pending, entries)
+
+    # Entries stuck behind a skill the model skipped twice
+    yield from flush()
+    yield from (entries[s] for s in order[emitted:] if s in entries)
+    # Every entry is out; what is left is the incomplete marker, if any
+    yield from _store_roadmap(cache_key, missing_skills, skills, entries)[len(entries):]
@@ -0,0 +1,241 @@
+# llm_cache.py
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+import metrics
+
+# -----------------------------
+# Configuration
+# -----------------------------
+CACHE_DIR = os.getenv("SKILLMENTOR_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"))
+CACHE_DB_PATH = os.getenv("SKILLMENTOR_CACHE_DB", os.path.join(CACHE_DIR, "llm_cache.sqlite3"))
+DEFAULT_TTL_SECONDS = int(os.getenv("SKILLMENTOR_CACHE_TTL", 7 * 24 * 3600))
+MEMORY_MAX_ENTRIES = int(os.getenv("SKILLMENTOR_CACHE_MEMORY_ENTRIES", 512))
+DISK_MAX_ENTRIES = int(os.getenv("SKILLMENTOR_CACHE_DISK_ENTRIES", 20000))
+CACHE_ENABLED = os.getenv("SKILLMENTOR_CACHE_DISABLED", "").lower() not in ("1", "true", "yes")
+
+
+# -----------------------------
+# Key Helpers
+# -----------------------------
+def normalize_input(value):
+    """
+    Normalize prompt inputs so that cosmetic differences do not change the cache key:
+    strings are stripped and whitespace-collapsed, sets are sorted, dicts are normalized recursively.
+    """
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, (set, frozenset)):
+        return sorted(normalize_input(v) for v in value)
+    if isinstance(value, (list, tuple)):
+        return [normalize_input(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): normalize_input(v) for k, v in value.items()}
+    return value
+
+
+def make_key(namespace, model, **inputs):
+    """
+    Build a content-addressed cache key from the namespace (call site), model name and prompt inputs.
+    """
+    payload = {"namespace": namespace, "model": model, "inputs": normalize_input(inputs)}
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return f"{namespace}:{hashlib.sha256(encoded.encode('utf-8')).hexdigest()}"
+
+
+# -----------------------------
+# In-process Tier
+# -----------------------------
+class MemoryCache:
+    """
+    Thread-safe LRU cache with per-entry expiry. Values are stored as JSON text so callers
+    always receive a fresh copy they are free to mutate.
+    """
+
+    def __init__(self, max_entries=MEMORY_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at is not None and expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def set(self, key, payload, expires_at):
+        with self._lock:
+            self._entries[key] = (expires_at, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# -----------------------------
+# On-disk Tier
+# -----------------------------
+class SQLiteCache:
+    """
+    SQLite-backed cache shared by every process pointing at the same database file.
+    Expired rows are dropped on write, and the least recently used rows are evicted
+    once the table grows past max_entries.
+    """
+
+    def __init__(self, path=CACHE_DB_PATH, max_entries=DISK_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                " key TEXT PRIMARY KEY,"
+                " payload TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " expires_at REAL,"
+                " last_access REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_access ON llm_cache(last_access)")
+
+    def get(self, key):
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT payload, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            payload, expires_at = row
+            if expires_at is not None and expires_at < now:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+            return payload, expires_at
+
+    def set(self, key, payload, expires_at):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, payload, created_at, expires_at, last_access)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, payload, now, expires_at, now),
+            )
+            self._conn.execute("DELETE FROM llm_cache WHERE expires_at IS NOT NULL AND expires_at < ?", (now,))
+            self._conn.execute(
+                "DELETE FROM llm_cache WHERE key IN ("
+                " SELECT key FROM llm_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def delete(self, key):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_cache")
+
+
+# -----------------------------
+# Tiered Cache
+# -----------------------------
+class TieredCache:
+    """
+    Memory tier in front of the SQLite tier. Disk hits are promoted into memory.
+    """
+
+    def __init__(self, memory=None, disk=None):
+        self.memory = memory or MemoryCache()
+        self.disk = disk
+
+    def get(self, key):
+        payload = self.memory.get(key)
+        if payload is None and self.disk is not None:
+            row = self.disk.get(key)
+            if row is not None:
+                payload, expires_at = row
+                self.memory.set(key, payload, expires_at)
+        if payload is None:
+            return None
+        return json.loads(payload)
+
+    def set(self, key, value, ttl=None):
+        ttl = DEFAULT_TTL_SECONDS if ttl is None else ttl
+        expires_at = time.time() + ttl if ttl > 0 else None
+        payload = json.dumps(value, ensure_ascii=False)
+        self.memory.set(key, payload, expires_at)
+        if self.disk is not None:
+            self.disk.set(key, payload, expires_at)
+
+    def delete(self, key):
+        self.memory.delete(key)
+        if self.disk is not None:
+            self.disk.delete(key)
+
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """
+    Return the process-wide cache, creating it on first use. Falls back to the memory tier
+    alone if the SQLite file cannot be opened (e.g. read-only filesystem).
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    disk = SQLiteCache()
+                except (sqlite3.Error, OSError):
+                    disk = None
+                _cache = TieredCache(disk=disk)
+    return _cache
+
+
+def lookup(key):
+    """
+    Return the cached value for key, or None on a miss.
+    """
+    if not CACHE_ENABLED:
+        return None
+    value = get_cache().get(key)
+    metrics.inc("cache_requests_total", namespace=key.split(":", 1)[0], result="miss" if value is None else "hit")
+    return value
+
+
+def store(key, value, ttl=None):
+    """
+    Store a JSON-serialisable value under key. ttl is in seconds; 0 means no expiry.
+    """
+    if not CACHE_ENABLED:
+        return
+    get_cache().set(key, value, ttl)
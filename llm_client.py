@@ -0,0 +1,326 @@
+# llm_client.py
+import os
+import time
+import random
+import threading
+from collections import deque
+import metrics
+
+# httpx, openai and LangChain take over a second to import, so they are imported on first
+# use (or by preload()) rather than when the Streamlit pages import this module
+
+# -----------------------------
+# Configuration
+# -----------------------------
+DEFAULT_MODEL = os.getenv("SKILLMENTOR_LLM_MODEL", "gpt-4o")
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL")  # point at a local stub server in development
+REQUEST_TIMEOUT = float(os.getenv("SKILLMENTOR_LLM_TIMEOUT", 60))
+CONNECT_TIMEOUT = float(os.getenv("SKILLMENTOR_LLM_CONNECT_TIMEOUT", 10))
+MAX_CONCURRENCY = int(os.getenv("SKILLMENTOR_LLM_MAX_CONCURRENCY", 8))
+MAX_RETRIES = int(os.getenv("SKILLMENTOR_LLM_MAX_RETRIES", 3))
+BACKOFF_BASE = float(os.getenv("SKILLMENTOR_LLM_BACKOFF_BASE", 0.5))
+BACKOFF_MAX = float(os.getenv("SKILLMENTOR_LLM_BACKOFF_MAX", 20))
+METRICS_HISTORY = int(os.getenv("SKILLMENTOR_LLM_METRICS_HISTORY", 1000))
+REQUESTS_PER_MINUTE = float(os.getenv("SKILLMENTOR_LLM_RPM", 0))  # 0 = no client-side limit
+JSON_MODE_ENABLED = os.getenv("SKILLMENTOR_LLM_JSON_MODE", "1").lower() in ("1", "true", "yes")
+# USD per million (prompt, completion) tokens, for cost accounting; unknown models cost 0
+MODEL_PRICES = {
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1-nano": (0.10, 0.40),
+}
+
+_lock = threading.RLock()
+_http_client = None
+_openai_client = None
+_models = {}
+_semaphore = threading.BoundedSemaphore(MAX_CONCURRENCY)
+_call_metrics = deque(maxlen=METRICS_HISTORY)
+_preload_started = False
+
+
+class RateLimiter:
+    """
+    Token bucket shared by all threads: at most `per_minute` requests per minute, with
+    bursts up to `burst` requests.
+    """
+
+    def __init__(self, per_minute, burst=None):
+        self.rate = per_minute / 60.0
+        self.capacity = burst or max(1.0, per_minute / 60.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+_rate_limiter = RateLimiter(REQUESTS_PER_MINUTE) if REQUESTS_PER_MINUTE > 0 else None
+
+
+def configure(base_url=None, api_key=None, requests_per_minute=None):
+    """
+    Re-point the shared client (e.g. at a local stub server) and/or set a client-side
+    request rate. Existing pooled clients are discarded.
+    """
+    global OPENAI_BASE_URL, _http_client, _openai_client, _rate_limiter
+    with _lock:
+        if base_url is not None:
+            OPENAI_BASE_URL = base_url
+        if api_key is not None:
+            os.environ["OPENAI_API_KEY"] = api_key
+        if requests_per_minute is not None:
+            _rate_limiter = RateLimiter(requests_per_minute) if requests_per_minute > 0 else None
+        if base_url is not None or api_key is not None:
+            if _http_client is not None:
+                _http_client.close()
+            _http_client = None
+            _openai_client = None
+            _models.clear()
+
+
+# -----------------------------
+# Shared Transport and Models
+# -----------------------------
+def get_http_client():
+    """
+    Process-wide HTTP client: one connection pool with keep-alive, so repeated calls
+    reuse TLS sessions instead of handshaking every time.
+    """
+    global _http_client
+    if _http_client is None:
+        import httpx
+        with _lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    timeout=httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT),
+                    limits=httpx.Limits(max_connections=MAX_CONCURRENCY * 2,
+                                        max_keepalive_connections=MAX_CONCURRENCY),
+                )
+    return _http_client
+
+
+def get_openai_client():
+    """
+    Process-wide OpenAI SDK client on top of the pooled transport.
+    """
+    global _openai_client
+    if _openai_client is None:
+        import openai
+        with _lock:
+            if _openai_client is None:
+                _openai_client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"), base_url=OPENAI_BASE_URL,
+                                               timeout=REQUEST_TIMEOUT, max_retries=0,
+                                               http_client=get_http_client())
+    return _openai_client
+
+
+def get_chat_model(model=DEFAULT_MODEL, temperature=0):
+    """
+    Return the shared ChatOpenAI instance for (model, temperature). Retries are handled
+    here rather than by the SDK so that backoff and metrics stay in one place.
+    """
+    key = (model, temperature)
+    llm = _models.get(key)
+    if llm is None:
+        from langchain_community.chat_models import ChatOpenAI
+        with _lock:
+            llm = _models.get(key)
+            if llm is None:
+                llm = ChatOpenAI(model=model, api_key=os.getenv("OPENAI_API_KEY"), temperature=temperature,
+                                 openai_api_base=OPENAI_BASE_URL, client=get_openai_client().chat.completions,
+                                 max_retries=0, request_timeout=REQUEST_TIMEOUT)
+                _models[key] = llm
+    return llm
+
+
+def preload():
+    """
+    Import the OpenAI/LangChain stack without making a call.
+    """
+    import httpx  # noqa: F401
+    import openai  # noqa: F401
+    from langchain_community.chat_models import ChatOpenAI  # noqa: F401
+    from langchain_core.messages import HumanMessage  # noqa: F401
+
+
+def preload_in_background():
+    """
+    Start preload() once per process on a daemon thread, so the import cost is paid while
+    the user is still on the upload page instead of on the first analysis.
+    """
+    global _preload_started
+    with _lock:
+        if _preload_started:
+            return
+        _preload_started = True
+    threading.Thread(target=preload, name="llm-preload", daemon=True).start()
+
+
+# -----------------------------
+# Retry Policy
+# -----------------------------
+def _is_retryable(error):
+    import httpx
+    import openai
+    if isinstance(error, (openai.APIConnectionError, openai.APITimeoutError, openai.RateLimitError)):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+def _retry_delay(error, attempt):
+    """
+    Full-jitter exponential backoff, honouring a Retry-After header when the server sends one.
+    """
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), BACKOFF_MAX)
+        except ValueError:
+            pass
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+# -----------------------------
+# Metrics
+# -----------------------------
+def call_cost(model, prompt_tokens, completion_tokens):
+    prompt_price, completion_price = MODEL_PRICES.get(model, (0.0, 0.0))
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1e6
+
+
+def _record(name, model, started, attempts, status, prompt_tokens=0, completion_tokens=0, streamed=False,
+            estimated=False):
+    """
+    estimated marks token counts (and so cost) computed locally because the API did not
+    report usage; they are counted under llm_tokens_total{source="estimated"}.
+    """
+    latency = time.perf_counter() - started
+    cost = call_cost(model, prompt_tokens, completion_tokens)
+    record = {
+        "name": name,
+        "model": model,
+        "latency_s": round(latency, 4),
+        "attempts": attempts,
+        "status": status,
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "cost_usd": round(cost, 6),
+        "streamed": streamed,
+        "tokens_estimated": estimated,
+        "timestamp": time.time(),
+    }
+    _call_metrics.append(record)
+    metrics.observe(f"llm.{name}", latency)
+    metrics.inc("llm_calls_total", name=name, model=model, status=status)
+    metrics.inc("llm_retries_total", attempts - 1, name=name)
+    source = "estimated" if estimated else "reported"
+    metrics.inc("llm_tokens_total", prompt_tokens, name=name, model=model, kind="prompt", source=source)
+    metrics.inc("llm_tokens_total", completion_tokens, name=name, model=model, kind="completion", source=source)
+    metrics.inc("llm_cost_usd_total", cost, name=name, model=model)
+    metrics.log_event("llm_call", **record)
+
+
+def get_call_metrics():
+    """
+    Return a snapshot of the most recent per-call metrics records.
+    """
+    return list(_call_metrics)
+
+
+# -----------------------------
+# Public API
+# -----------------------------
+def complete(prompt, name="llm", model=DEFAULT_MODEL, temperature=0, json_mode=False):
+    """
+    Send a single-message chat completion and return the response text.
+    Concurrency is bounded process-wide; 429/5xx/connection errors are retried with backoff.
+    json_mode asks OpenAI for a JSON object response (the prompt must mention JSON and
+    expect an object at the top level).
+    """
+    from langchain_core.messages import HumanMessage
+    llm = get_chat_model(model, temperature)
+    kwargs = {"response_format": {"type": "json_object"}} if json_mode and JSON_MODE_ENABLED else {}
+    started = time.perf_counter()
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            if _rate_limiter is not None:
+                _rate_limiter.acquire()
+            with _semaphore:
+                result = llm.generate([[HumanMessage(content=prompt)]], **kwargs)
+        except Exception as e:
+            if attempt > MAX_RETRIES or not _is_retryable(e):
+                _record(name, model, started, attempt, type(e).__name__)
+                raise
+            time.sleep(_retry_delay(e, attempt - 1))
+            continue
+
+        usage = (result.llm_output or {}).get("token_usage") or {}
+        _record(name, model, started, attempt, "ok",
+                usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0))
+        return result.generations[0][0].message.content
+
+
+def _estimate_tokens(text):
+    from prompt_budget import count_tokens
+    return count_tokens(text)
+
+
+def stream(prompt, name="llm", model=DEFAULT_MODEL, temperature=0):
+    """
+    Stream a single-message chat completion, yielding text chunks. Retries happen only
+    before the first chunk arrives, so callers never see duplicated output. A concurrency
+    slot is held only while a request is open; it is released before backoff sleeps and
+    when the caller closes the generator early.
+    """
+    from langchain_core.messages import HumanMessage
+    llm = get_chat_model(model, temperature)
+    started = time.perf_counter()
+    attempt = 0
+    completion = []
+    while True:
+        attempt += 1
+        if _rate_limiter is not None:
+            _rate_limiter.acquire()
+        _semaphore.acquire()
+        chunks = llm.stream([HumanMessage(content=prompt)])
+        try:
+            for chunk in chunks:
+                if chunk.content:
+                    completion.append(chunk.content)
+                    yield chunk.content
+        except GeneratorExit:
+            # The streaming API does not report usage; estimated with the prompt tokenizer
+            _record(name, model, started, attempt, "cancelled", _estimate_tokens(prompt),
+                    _estimate_tokens("".join(completion)), streamed=True, estimated=True)
+            raise
+        except Exception as e:
+            if completion or attempt > MAX_RETRIES or not _is_retryable(e):
+                _record(name, model, started, attempt, type(e).__name__, streamed=True)
+                raise
+            delay = _retry_delay(e, attempt - 1)
+        else:
+            break
+        finally:
+            chunks.close()
+            _semaphore.release()
+        time.sleep(delay)
+    _record(name, model, started, attempt, "ok", _estimate_tokens(prompt),
+            _estimate_tokens("".join(completion)), streamed=True, estimated=True)
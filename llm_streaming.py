@@ -0,0 +1,90 @@
+# llm_streaming.py
+import json
+from structured_output import loads_tolerant
+
+
+class JsonArrayStream:
+    """
+    Incremental parser for a JSON array arriving in chunks. Anything before the opening
+    bracket (e.g. a ```json fence) is ignored, and each top-level element is returned
+    from feed() as soon as its closing character has been seen.
+    """
+
+    def __init__(self):
+        self.started = False
+        self.finished = False
+        self._element = None
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, chunk):
+        items = []
+        for c in chunk:
+            if self.finished:
+                break
+            if not self.started:
+                self.started = c == "["
+                continue
+            if self._element is None:
+                if c.isspace() or c == ",":
+                    continue
+                if c == "]":
+                    self.finished = True
+                    continue
+                self._element = [c]
+                self._depth = 1 if c in "{[" else 0
+                self._in_string = c == '"'
+                self._escape = False
+                continue
+
+            self._element.append(c)
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if self._depth == 0:
+                        self._emit(items)
+            elif c == '"':
+                self._in_string = True
+            elif c in "{[":
+                self._depth += 1
+            elif c in "}]":
+                if self._depth == 0:
+                    # A bare scalar closed by the end of the array
+                    self._element.pop()
+                    self._emit(items)
+                    self.finished = True
+                else:
+                    self._depth -= 1
+                    if self._depth == 0:
+                        self._emit(items)
+            elif c == "," and self._depth == 0:
+                self._element.pop()
+                self._emit(items)
+        return items
+
+    def _emit(self, items):
+        text = "".join(self._element).strip()
+        self._element = None
+        try:
+            items.append(json.loads(text))
+        except json.JSONDecodeError:
+            try:
+                items.append(loads_tolerant(text))
+            except ValueError:
+                pass  # drop a malformed element rather than the whole array
+
+
+def iter_json_array_items(chunks):
+    """
+    Yield each element of a streamed JSON array as soon as it is complete. The source is
+    always drained so the underlying request finishes cleanly.
+    """
+    parser = JsonArrayStream()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+
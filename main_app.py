@@ -1,31 +1,98 @@
 # main_app.py
 import os
+import time
 import streamlit as st
-import pdfplumber
-from docx import Document as docx_document
-from learning_roadmap import generate_learning_roadmap
-from project_recommendations import suggest_projects
-from resume_analysis import evaluate_resume_profile
-from langchain_community.chat_models import ChatOpenAI
-from langchain.schema import HumanMessage
-import plotly.graph_objects as go
-
-# Load OpenAI key
-openai_api_key = os.getenv("OPENAI_API_KEY")
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+import llm_client
+import metrics
+import job_queue
+import model_router
+import session_store
+import analysis_pipeline  # registers the background job kinds
+from required_skills import CAREER_GOALS, INTERESTS
+from resume_ingest import (extract_resume_text, extract_pdf_text, extract_docx_text, read_bytes, PDF_MIME, DOCX_MIME,
+                           MAX_PAGES)
+from mongo_handler import get_user_data, save_user_data, matches_inputs, is_complete_analysis
+from structured_output import failure_message
+
+# Sidebar performance panel: shown to everyone with SKILLMENTOR_ADMIN_PANEL=1, otherwise only
+# to the comma-separated SKILLMENTOR_ADMIN_EMAILS
+SHOW_ADMIN_PANEL = os.getenv("SKILLMENTOR_ADMIN_PANEL", "").lower() in ("1", "true", "yes")
+ADMIN_EMAILS = {e.strip().lower() for e in os.getenv("SKILLMENTOR_ADMIN_EMAILS", "").split(",") if e.strip()}
+# Seconds between reruns while background jobs are still running
+JOB_POLL_INTERVAL = float(os.getenv("SKILLMENTOR_JOB_POLL", 0.5))
 
 # -----------------------------
 # Helper Functions
 # -----------------------------
 def extract_text_from_pdf(file):
-    text = ""
-    with pdfplumber.open(file) as pdf:
-        for page in pdf.pages:
-            text += page.extract_text() or ""
-    return text
+    return extract_pdf_text(read_bytes(file))
 
 def extract_text_from_docx(file):
-    doc = docx_document(file)
-    return "\n".join([para.text for para in doc.paragraphs])
+    return extract_docx_text(read_bytes(file))
+
+def load_stored_results(record):
+    """
+    Put a stored analysis back into the session so the dashboard renders it without GPT calls.
+    """
+    for name in ("analysis_result", "roadmap", "projects"):
+        set_value(name, record.get(name))
+    st.session_state["career_goal"] = record.get("career_goal")
+    st.session_state["interests"] = record.get("interests") or []
+    st.session_state["resume_hash"] = record.get("resume_hash")
+    st.session_state["analysis_pending"] = False
+    st.session_state["resume_uploaded"] = True
+
+def set_value(name, value):
+    """
+    Keep large values (resume text, results) in session_store; the session holds a handle.
+    """
+    st.session_state[name] = session_store.offload(value)
+
+def get_value(name):
+    return session_store.resolve(st.session_state.get(name))
+
+def _is_failure(items):
+    return failure_message(items) is not None
+
+def store_results(user_id):
+    """
+    Persist the session's results for user_id. Degraded analyses (GPT fallback) and ones
+    without required skills are not stored, nor are failed roadmap/project parses.
+    """
+    fields = {"analysis_result": get_value("analysis_result"),
+              "resume_hash": st.session_state.get("resume_hash"),
+              "career_goal": st.session_state.get("career_goal"),
+              "interests": st.session_state.get("interests") or []}
+    for name in ("roadmap", "projects"):
+        items = get_value(name)
+        fields[name] = None if _is_failure(items) else items
+    if is_complete_analysis(fields["analysis_result"]):
+        save_user_data(user_id, **fields)
+
+def poll_job(name, kind, **params):
+    """
+    Submit kind(**params) as a background job once per session (under name) and return its
+    current status. Identical jobs from other reruns or sessions are shared.
+    """
+    jobs = st.session_state.setdefault("jobs", {})
+    job = job_queue.status(jobs[name]) if name in jobs else None
+    if job is None:
+        # Not submitted yet, or expired from the job store
+        jobs[name] = job_queue.submit(kind, **params)
+        job = job_queue.status(jobs[name])
+    return job
+
+def is_running(job):
+    return job is not None and job["status"] in (job_queue.QUEUED, job_queue.RUNNING)
+
+def rerun_shortly(message):
+    """
+    Keep polling: wait briefly, then rerun the script to pick up job progress.
+    """
+    with st.spinner(message):
+        time.sleep(JOB_POLL_INTERVAL)
+    st.rerun()
 
 # -----------------------------
 # Upload Page
@@ -38,163 +105,324 @@ def show_upload_page(user_id=None):
         st.info("Please upload your resume to continue.")
         return
 
-    # Extract resume text
-    resume_text = ""
-    if uploaded_file.type == "application/pdf":
-        resume_text = extract_text_from_pdf(uploaded_file)
-    elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-        resume_text = extract_text_from_docx(uploaded_file)
-    st.session_state["resume_text"] = resume_text
+    # Extract resume text once per uploaded file: reruns reuse the digest and text kept for
+    # its file_id, and re-uploads of the same content hit the text cache by hash
+    upload = st.session_state.get("upload") or {}
+    if upload.get("file_id") != uploaded_file.file_id or st.session_state.get("resume_text") is None:
+        resume_text, upload = "", {"file_id": uploaded_file.file_id, "skipped_pages": 0}
+        if uploaded_file.type in (PDF_MIME, DOCX_MIME):
+            try:
+                with metrics.timer("resume_extraction", file_type=uploaded_file.type):
+                    resume_text, upload["resume_hash"], upload["skipped_pages"] = \
+                        extract_resume_text(uploaded_file)
+            except ValueError as e:
+                st.error(str(e))
+                return
+        set_value("resume_text", resume_text)
+        st.session_state["upload"] = upload
+    resume_text = get_value("resume_text")
+    if upload.get("resume_hash"):
+        st.session_state["resume_hash"] = upload["resume_hash"]
+    if upload["skipped_pages"]:
+        st.warning(f"Only the first {MAX_PAGES} pages of your resume were read; "
+                   f"{upload['skipped_pages']} more were skipped.")
 
     # User Inputs
-    interests = st.multiselect("Select your interests:",
-                               ["Full Stack Development","Artificial Intelligence", "Web Development", "Data Science",
-                                "Cybersecurity", "Cloud Computing", "Mobile App Development",
-                                "Game Development", "UI/UX Design", "Software Developer"])
+    interests = st.multiselect("Select your interests:", INTERESTS)
     st.session_state["interests"] = interests
 
     career_goal_known = st.checkbox("I know my career goal")
     if career_goal_known:
-        career_goal = st.selectbox("Select your career goal:",
-                                   ["Java Full Stack Developer","Python Full Stack Developer","Mern Stack Developer","Data Scientist", "Data Engineer", "Cybersecurity Analyst",
-                                    "Cloud Architect", "Mobile App Developer","Frontend Developer","UI/UX Designer"])
+        career_goal = st.selectbox("Select your career goal:", CAREER_GOALS)
         st.session_state['career_goal'] = career_goal
     else:
         st.info("Based on your resume and interests, a suitable role will be suggested.")
         if st.button("Suggest me a career goal"):
-            llm = ChatOpenAI(model="gpt-4o", api_key=openai_api_key, temperature=0)
-            prompt = f"""
-You are an expert career coach.
-
-Resume:
-{resume_text}
-
-User Interests: {', '.join(interests)}
-
-Task:
-Suggest one suitable career goal/job role for this user based on the resume and interests. 
-Return ONLY the job title as plain text.
-"""
-            response = llm([HumanMessage(content=prompt)])
-            if isinstance(response, list):
-                suggested_goal = response[0].content.strip()
-            elif hasattr(response, "content"):
-                suggested_goal = response.content.strip()
+            st.session_state.setdefault("jobs", {}).pop("career_goal", None)
+            st.session_state["suggesting_goal"] = True
+        if st.session_state.get("suggesting_goal"):
+            # The title is generated in the background and shown as it streams in
+            job = poll_job("career_goal", "career_goal", resume_text=resume_text, interests=interests)
+            suggested_goal = "".join(job["result"] or job["items"]).strip()
+            if is_running(job):
+                if suggested_goal:
+                    st.info(f"Suggested Career Goal: {suggested_goal}")
+                rerun_shortly("Suggesting a career goal...")
+            st.session_state["suggesting_goal"] = False
+            if job["status"] == job_queue.FAILED:
+                st.error(f"Career goal suggestion failed: {job['error']}")
             else:
-                suggested_goal = str(response).strip()
-            st.session_state['career_goal'] = suggested_goal
-            st.success(f"Suggested Career Goal: {suggested_goal}")
+                st.session_state['career_goal'] = suggested_goal
+                st.success(f"Suggested Career Goal: {suggested_goal}")
 
-    # Start Analysis
+    # Start Analysis: the LLM stages run on the dashboard so each tab fills in as soon as it is ready
     if "career_goal" in st.session_state and st.button("Start Analysis"):
         st.session_state["current_page"] = "dashboard"
-        with st.spinner("Analyzing resume and computing skill match..."):
-            analysis_result = evaluate_resume_profile(
-                st.session_state["resume_text"],
-                st.session_state["interests"],
-                st.session_state["career_goal"]
-            )
-            st.session_state["analysis_result"] = analysis_result
-            st.session_state["resume_uploaded"] = True
+        # Same resume, goal and interests as the stored analysis: show it instead of calling GPT again
+        record = get_user_data(user_id)
+        if matches_inputs(record, st.session_state.get("resume_hash"), st.session_state["career_goal"], interests):
+            load_stored_results(record)
+            st.rerun()
+        st.session_state["analysis_result"] = None
+        st.session_state["roadmap"] = None
+        st.session_state["projects"] = None
+        st.session_state["analysis_pending"] = True
+        st.session_state["resume_uploaded"] = True
+        st.session_state["jobs"] = {}
+        st.rerun()
+
+# -----------------------------
+# Dashboard Tabs
+# -----------------------------
+def render_profile_tab(analysis_result):
+    st.subheader("Profile Summary")
+    extracted_skills = analysis_result.get("extracted_skills", [])
+    required_skills = analysis_result.get("required_skills", [])
+    st.write(f"**Extracted Skills:** {', '.join(extracted_skills)}")
+    st.write(f"**Required Skills:** {', '.join(required_skills)}")
+
+def render_skill_gap_tab(analysis_result):
+    st.subheader("Skill Match & Gap")
+    skill_match = analysis_result.get("skill_match_percentage", 0)
+    skill_gap = analysis_result.get("skill_gap_percentage", 0)
+    st.metric("Skill Match %", f"{skill_match}%")
+    st.metric("Skill Gap %", f"{skill_gap}%")
+    missing_skills = analysis_result.get("missing_skills", [])
+    if missing_skills:
+        st.write("**Missing Skills:**", ", ".join(missing_skills))
+    else:
+        st.write("No skills missing!")
+    # Visualization: Donut Chart (plotly is only imported once a dashboard is shown)
+    import plotly.graph_objects as go
+    labels = ['Skills Acquired', 'Skills Missing']
+    values = [skill_match, skill_gap]
+    fig = go.Figure(data=[go.Pie(labels=labels, values=values, hole=0.5, marker=dict(colors=['#00cc96', '#ef553b']))])
+    fig.update_layout(title_text="Skill Match vs Skill Gap", title_font_size=20)
+    st.plotly_chart(fig, use_container_width=True)
+
+def render_recommendations_tab(analysis_result):
+    st.subheader("Recommendations to Bridge Gaps")
+    for rec in analysis_result.get("recommendations", []):
+        with st.expander(rec[:30]+"..."):
+            st.write(rec)
+
+def render_roadmap_item(i, item):
+    if isinstance(item, dict) and "message" in item:
+        st.write(item["message"])
+    elif isinstance(item, dict):
+        with st.expander(item.get("skill", f"Skill {i+1}")):
+            st.write(f"**Course:** {item.get('recommended_course')}")
+            st.write(f"**Platform:** {item.get('platform')}")
+            st.write(f"**Estimated Duration:** {item.get('estimated_duration')}")
+    else:
+        st.write(item)
+
+def render_roadmap_tab(roadmap):
+    st.subheader("Learning Roadmap to Bridge Skill Gaps")
+    for i, item in enumerate(roadmap):
+        render_roadmap_item(i, item)
+
+def render_project_item(i, proj):
+    if isinstance(proj, dict) and "message" in proj:
+        st.write(proj["message"])
+    elif isinstance(proj, dict):
+        with st.expander(proj.get("project_name", f"Project {i+1}")):
+            st.write(f"**Description:** {proj.get('description')}")
+            st.write(f"**Estimated Duration:** {proj.get('estimated_duration')}")
+    else:
+        st.write(proj)
+
+def render_projects_tab(projects):
+    for i, proj in enumerate(projects):
+        render_project_item(i, proj)
+
+def run_pending_analysis(slots, user_id=None):
+    """
+    Analysis and projects run as background jobs, the roadmap once the analysis has
+    produced missing_skills. Each rerun renders what has arrived so far (roadmap and
+    project entries one by one) and polls again until every job has finished.
+    """
+    analysis = poll_job("analysis", "analysis", resume_text=get_value("resume_text"),
+                        interests=st.session_state["interests"], career_goal=st.session_state["career_goal"])
+    projects = poll_job("projects", "projects", career_goal=st.session_state["career_goal"])
+    roadmap = None
+    if analysis["status"] == job_queue.DONE:
+        analysis_result = analysis["result"]
+        set_value("analysis_result", analysis_result)
+        if analysis_result.get("degraded"):
+            st.warning("GPT was unavailable, so only part of the analysis could be computed. "
+                       "Start the analysis again later for the full result.")
+        for name, render in (("profile", render_profile_tab), ("skills", render_skill_gap_tab),
+                             ("recommendations", render_recommendations_tab)):
+            with slots[name].container():
+                render(analysis_result)
+        roadmap = poll_job("roadmap", "roadmap", missing_skills=analysis_result.get("missing_skills", []))
+
+    with slots["roadmap"].container():
+        st.subheader("Learning Roadmap to Bridge Skill Gaps")
+        for i, item in enumerate(roadmap["items"] if roadmap else []):
+            render_roadmap_item(i, item)
+    if st.session_state.get("want_projects"):
+        with slots["projects"].container():
+            render_projects_tab(projects["items"])
+
+    for stage, job in (("analysis", analysis), ("projects", projects), ("roadmap", roadmap)):
+        if job is not None and job["status"] == job_queue.FAILED:
+            if job["result"] is None:  # else the failure message is already among the rendered items
+                st.error(f"{stage.capitalize()} failed: {job['error']}")
+        elif job is not None and job["status"] == job_queue.DONE and stage != "analysis":
+            set_value(stage, job["result"])
+    if is_running(analysis) or is_running(projects) or is_running(roadmap):
+        rerun_shortly("Analyzing resume, building your roadmap and finding projects...")
+
+    if analysis["status"] == job_queue.DONE and analysis["result"].get("degraded"):
+        # Not saved, and the next Start Analysis runs it again instead of reusing this job
+        job_queue.forget(st.session_state["jobs"]["analysis"])
+    st.session_state["analysis_pending"] = False
+    st.session_state["jobs"] = {}
+    store_results(user_id)
 
 # Dashboard Page
-def show_dashboard_page():
+def show_dashboard_page(user_id=None):
     st.title("Resume Analysis Dashboard 📊",)
-    analysis_result = st.session_state.get("analysis_result")
+    analysis_result = get_value("analysis_result")
     career_goal = st.session_state.get("career_goal")
     resume_uploaded = st.session_state.get("resume_uploaded", False)
+    analysis_pending = st.session_state.get("analysis_pending", False)
 
-    if not analysis_result or not resume_uploaded:
+    if (not analysis_result and not analysis_pending) or not resume_uploaded:
         st.warning("No analysis data found. Please upload your resume and start analysis first.")
         return
 
     # Tabs
     tabs = st.tabs(["Profile Summary", "Skill Match & Gap", "Recommendations", "Learning Roadmap", "Project Recommendations"])
-
-    # Profile Summary Tab
-    with tabs[0]:
-        st.subheader("Profile Summary")
-        extracted_skills = analysis_result.get("extracted_skills", [])
-        required_skills = analysis_result.get("required_skills", [])
-        st.write(f"**Extracted Skills:** {', '.join(extracted_skills)}")
-        st.write(f"**Required Skills:** {', '.join(required_skills)}")
-
-    # ----- Skill Match & Gap Tab -----
-    with tabs[1]:
-        st.subheader("Skill Match & Gap")
-        skill_match = analysis_result.get("skill_match_percentage", 0)
-        skill_gap = analysis_result.get("skill_gap_percentage", 0)
-        st.metric("Skill Match %", f"{skill_match}%")
-        st.metric("Skill Gap %", f"{skill_gap}%")
-        missing_skills = analysis_result.get("missing_skills", [])
-        if missing_skills:
-            st.write("**Missing Skills:**", ", ".join(missing_skills))
-        else:
-            st.write("No skills missing!")
-              # Visualization: Donut Chart
-        labels = ['Skills Acquired', 'Skills Missing']
-        values = [skill_match, skill_gap]
-        fig = go.Figure(data=[go.Pie(labels=labels, values=values, hole=0.5, marker=dict(colors=['#00cc96', '#ef553b']))])
-        fig.update_layout(title_text="Skill Match vs Skill Gap", title_font_size=20)
-        st.plotly_chart(fig, use_container_width=True)
-
-    # ----- Recommendations Tab -----
-    with tabs[2]:
-        st.subheader("Recommendations to Bridge Gaps")
-        for rec in analysis_result.get("recommendations", []):
-            with st.expander(rec[:30]+"..."):
-                st.write(rec)
-
-    # ----- Learning Roadmap Tab -----
-    with tabs[3]:
-        st.subheader("Learning Roadmap to Bridge Skill Gaps")
-        roadmap = generate_learning_roadmap(missing_skills)
-        for i, item in enumerate(roadmap):
-            if isinstance(item, dict):
-                with st.expander(item.get("skill", f"Skill {i+1}")):
-                    st.write(f"**Course:** {item.get('recommended_course')}")
-                    st.write(f"**Platform:** {item.get('platform')}")
-                    st.write(f"**Estimated Duration:** {item.get('estimated_duration')}")
-            else:
-                st.write(item)
+    slots = {}
+    for name, tab in zip(["profile", "skills", "recommendations", "roadmap"], tabs):
+        with tab:
+            slots[name] = st.empty()
 
     # ----- Project Recommendations Tab -----
     with tabs[4]:
         st.session_state["want_projects"] = st.checkbox(
             "Show project recommendations?", value=st.session_state.get("want_projects", False)
         )
-        if st.session_state["want_projects"] and career_goal:
-            projects = suggest_projects(career_goal)
-            for i, proj in enumerate(projects):
-                if isinstance(proj, dict):
-                    with st.expander(proj.get("project_name", f"Project {i+1}")):
-                        st.write(f"**Description:** {proj.get('description')}")
-                        st.write(f"**Estimated Duration:** {proj.get('estimated_duration')}")
-                else:
-                    st.write(proj)
+        slots["projects"] = st.empty()
+
+    if analysis_pending:
+        run_pending_analysis(slots, user_id)
+        return
+
+    with slots["profile"].container():
+        render_profile_tab(analysis_result)
+    with slots["skills"].container():
+        render_skill_gap_tab(analysis_result)
+    with slots["recommendations"].container():
+        render_recommendations_tab(analysis_result)
+
+    # Results computed by the pipeline are reused; jobs cover sessions from before it existed
+    waiting = False
+    roadmap = get_value("roadmap")
+    if roadmap is None:
+        job = poll_job("roadmap", "roadmap", missing_skills=analysis_result.get("missing_skills", []))
+        if job["status"] == job_queue.DONE:
+            roadmap = job["result"]
+            set_value("roadmap", roadmap)
+            store_results(user_id)
+        elif job["status"] == job_queue.FAILED:
+            st.error(f"Roadmap failed: {job['error']}")
+        waiting = waiting or is_running(job)
+    with slots["roadmap"].container():
+        render_roadmap_tab(roadmap if roadmap is not None else job["items"])
+
+    if st.session_state["want_projects"] and career_goal:
+        projects = get_value("projects")
+        if projects is None:
+            job = poll_job("projects", "projects", career_goal=career_goal)
+            if job["status"] == job_queue.DONE:
+                projects = job["result"]
+                set_value("projects", projects)
+                store_results(user_id)
+            elif job["status"] == job_queue.FAILED:
+                st.error(f"Projects failed: {job['error']}")
+            waiting = waiting or is_running(job)
+        with slots["projects"].container():
+            render_projects_tab(projects if projects is not None else job["items"])
+
+    if waiting:
+        rerun_shortly("Loading...")
 
 # -----------------------------
-# Main App Content
+# Admin Panel
 # -----------------------------
-def main_app_content(logout_callback, user_id=None):
-    if "current_page" not in st.session_state:
-        st.session_state["current_page"] = "upload"
+def is_admin():
+    return SHOW_ADMIN_PANEL or (st.session_state.get("user_info") or "").lower() in ADMIN_EMAILS
 
-    if st.session_state["current_page"] == "upload":
-        show_upload_page(user_id)
-    elif st.session_state["current_page"] == "dashboard":
-        show_dashboard_page()
+def render_admin_panel():
+    with st.sidebar.expander("Performance (admin)"):
+        summary = metrics.stage_summary()
+        if summary:
+            st.table([{"stage": stage, **values} for stage, values in summary.items()])
+        else:
+            st.write("No stages timed yet.")
+        hits = metrics.counter_total("cache_requests_total", result="hit")
+        lookups = metrics.counter_total("cache_requests_total")
+        parsed = metrics.counter_total("parse_total")
+        st.write(f"**Cache hit rate:** {hits / lookups:.0%}" if lookups else "**Cache hit rate:** n/a")
+        st.write(f"**Parse failures:** {metrics.counter_total('parse_total', result='failed'):g} / {parsed:g}")
+        st.write(f"**LLM retries:** {metrics.counter_total('llm_retries_total'):g}")
+        st.write(f"**Tokens:** {metrics.counter_total('llm_tokens_total', kind='prompt'):g} prompt, "
+                 f"{metrics.counter_total('llm_tokens_total', kind='completion'):g} completion "
+                 f"({metrics.counter_total('llm_tokens_total', source='estimated'):g} estimated for streamed calls)")
+        st.write(f"**LLM cost:** ${metrics.counter_total('llm_cost_usd_total'):.4f}")
+        routes = model_router.summary()
+        if routes:
+            st.table(routes)
+        memory = session_store.usage()
+        st.write(f"**Session memory:** {memory['session_bytes'] / 2 ** 20:.1f} MB in {len(memory['sessions'])} sessions; "
+                 f"store {memory['store_memory_bytes'] / 2 ** 20:.1f} MB ({memory['store_entries']} values)")
+        if memory["sessions"]:
+            st.table(memory["sessions"][:10])
 
-    # Sidebar Logout and "Upload New Resume" button
+# -----------------------------
+# Main App Content
+# -----------------------------
+def render_sidebar(logout_callback):
+    """
+    Sidebar Logout and "Upload New Resume" buttons. Rendered before the page, since polling
+    for background jobs reruns the script before anything after it is drawn.
+    """
     st.sidebar.header("Navigation")
     if st.sidebar.button("Upload New Resume / Start Fresh Analysis"):
         st.session_state["current_page"] = "upload"
         st.session_state["resume_uploaded"] = False
         st.session_state["analysis_result"] = None
+        st.session_state["roadmap"] = None
+        st.session_state["projects"] = None
+        st.session_state["analysis_pending"] = False
         st.session_state["resume_text"] = None
         st.session_state["interests"] = None
         st.session_state["career_goal"] = None
         st.session_state["want_projects"] = False
+        st.session_state["jobs"] = {}
 
     if st.sidebar.button("Logout"):
         logout_callback()
+        st.rerun()
+
+    if is_admin():
+        render_admin_panel()
+
+def main_app_content(logout_callback, user_id=None):
+    llm_client.preload_in_background()
+    # Memory accounting per browser session (also sweeps idle sessions)
+    ctx = get_script_run_ctx()
+    if ctx is not None:
+        session_store.track(ctx.session_id, st.session_state)
+    if "current_page" not in st.session_state:
+        st.session_state["current_page"] = "upload"
+
+    render_sidebar(logout_callback)
+    if st.session_state["current_page"] == "upload":
+        show_upload_page(user_id)
+    elif st.session_state["current_page"] == "dashboard":
+        show_dashboard_page(user_id)
@@ -0,0 +1,241 @@
+# metrics.py
+"""
+In-process instrumentation: stage timers, counters and structured (JSON) event logs, with
+a Prometheus text exporter and percentile summaries for the sidebar admin panel.
+
+    with metrics.timer("resume_extraction"):
+        ...
+    metrics.inc("cache_requests_total", namespace="roadmap", result="hit")
+
+Set SKILLMENTOR_METRICS_PORT to serve /metrics for Prometheus, and SKILLMENTOR_METRICS_LOG=1
+to print every event as a JSON line on stderr.
+"""
+import os
+import sys
+import json
+import time
+import logging
+import threading
+import functools
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+METRICS_PORT = int(os.getenv("SKILLMENTOR_METRICS_PORT", 0))  # 0 = no exporter
+METRICS_WINDOW = int(os.getenv("SKILLMENTOR_METRICS_WINDOW", 1000))  # samples kept per stage for percentiles
+LOG_EVENTS = os.getenv("SKILLMENTOR_METRICS_LOG", "").lower() in ("1", "true", "yes")
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+PREFIX = "skillmentor_"
+
+logger = logging.getLogger("skillmentor.metrics")
+if LOG_EVENTS and not logger.handlers:
+    _handler = logging.StreamHandler(sys.stderr)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+
+_lock = threading.Lock()
+_counters = defaultdict(float)                             # (name, labels) -> value
+_samples = defaultdict(lambda: deque(maxlen=METRICS_WINDOW))  # stage -> recent durations
+_histograms = defaultdict(lambda: [0] * (len(BUCKETS) + 1))   # stage -> bucket counts (+Inf last)
+_sums = defaultdict(float)
+_exporter = None
+
+
+def _labels(labels):
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+# -----------------------------
+# Recording
+# -----------------------------
+def inc(metric, amount=1, **labels):
+    """
+    Add amount to the counter metric{labels}.
+    """
+    if amount:
+        with _lock:
+            _counters[(metric, _labels(labels))] += amount
+
+
+def observe(stage, seconds):
+    """
+    Record one wall-time sample for stage.
+    """
+    with _lock:
+        _samples[stage].append(seconds)
+        _sums[stage] += seconds
+        buckets = _histograms[stage]
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                buckets[i] += 1
+                break
+        else:
+            buckets[-1] += 1
+
+
+def log_event(event, /, **fields):
+    """
+    Emit one structured log line: {"event": ..., "ts": ..., **fields}.
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps({"event": event, "ts": round(time.time(), 3), **fields}, default=str))
+
+
+@contextmanager
+def timer(stage, **fields):
+    """
+    Time the block as stage, count it by status and log a "stage" event.
+    """
+    started = time.perf_counter()
+    status = "ok"
+    try:
+        yield
+    except BaseException as e:
+        status = type(e).__name__
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        observe(stage, elapsed)
+        inc("stage_runs_total", stage=stage, status=status)
+        log_event("stage", stage=stage, status=status, duration_ms=round(elapsed * 1000, 1), **fields)
+
+
+def timed(stage):
+    """
+    Decorator form of timer() for plain (non-generator) functions.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timer(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# -----------------------------
+# Reading
+# -----------------------------
+def _percentile(sorted_values, q):
+    index = max(0, min(len(sorted_values) - 1, int(round(q * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def stage_summary():
+    """
+    Per-stage count and p50/p95/p99 wall time (ms) over the last METRICS_WINDOW samples.
+    """
+    with _lock:
+        snapshot = {stage: sorted(values) for stage, values in _samples.items()}
+    return {stage: {"count": len(values),
+                    "p50_ms": round(_percentile(values, 0.50) * 1000, 1),
+                    "p95_ms": round(_percentile(values, 0.95) * 1000, 1),
+                    "p99_ms": round(_percentile(values, 0.99) * 1000, 1)}
+            for stage, values in sorted(snapshot.items()) if values}
+
+
+def counters():
+    """
+    Snapshot of every counter as {name: {labels_tuple: value}}.
+    """
+    result = defaultdict(dict)
+    with _lock:
+        for (name, labels), value in _counters.items():
+            result[name][labels] = value
+    return dict(result)
+
+
+def counter_total(metric, **match):
+    """
+    Sum of counter metric over every label set that includes the given labels.
+    """
+    wanted = set(_labels(match))
+    return sum(v for labels, v in counters().get(metric, {}).items() if wanted <= set(labels))
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def render_prometheus():
+    """
+    All counters and stage histograms in the Prometheus text exposition format.
+    """
+    lines = []
+    with _lock:
+        by_name = defaultdict(list)
+        for (name, labels), value in sorted(_counters.items()):
+            by_name[name].append((labels, value))
+        histograms = {stage: (list(b), _sums[stage]) for stage, b in _histograms.items()}
+
+    for name, series in by_name.items():
+        lines.append(f"# TYPE {PREFIX}{name} counter")
+        lines.extend(f"{PREFIX}{name}{_format_labels(labels)} {value:g}" for labels, value in series)
+
+    metric = PREFIX + "stage_duration_seconds"
+    lines.append(f"# TYPE {metric} histogram")
+    for stage, (buckets, total) in sorted(histograms.items()):
+        cumulative = 0
+        for bound, count in zip(BUCKETS + ("+Inf",), buckets):
+            cumulative += count
+            lines.append(f'{metric}_bucket{{stage="{_escape(stage)}",le="{bound}"}} {cumulative}')
+        lines.append(f'{metric}_sum{{stage="{_escape(stage)}"}} {total:.6f}')
+        lines.append(f'{metric}_count{{stage="{_escape(stage)}"}} {cumulative}')
+    return "\n".join(lines) + "\n"
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _samples.clear()
+        _histograms.clear()
+        _sums.clear()
+
+
+# -----------------------------
+# Exporter
+# -----------------------------
+def start_exporter(port=None):
+    """
+    Serve /metrics on port (default SKILLMENTOR_METRICS_PORT) from a daemon thread.
+    Does nothing when no port is configured or the exporter is already running.
+    """
+    global _exporter
+    port = METRICS_PORT if port is None else port
+    if not port or _exporter is not None:
+        return _exporter
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    with _lock:
+        if _exporter is None:
+            try:
+                server = ThreadingHTTPServer(("0.0.0.0", port), MetricsHandler)
+            except OSError:
+                # Another Streamlit process on this host already serves the port
+                logger.warning("metrics exporter port %s is in use", port)
+                return None
+            server.daemon_threads = True
+            threading.Thread(target=server.serve_forever, name="metrics-exporter", daemon=True).start()
+            _exporter = server
+    return _exporter
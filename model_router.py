@@ -0,0 +1,161 @@
+# model_router.py
+"""
+Routes each LLM task to a model tier. Short, easily validated outputs (career goal, skill
+list, roadmap entries, project list) go to the small tier; the analysis step keeps the large
+model. When a small-tier response fails schema validation, the prompt is re-sent once to
+the large tier.
+
+    SKILLMENTOR_MODEL_ROUTES="learning_roadmap=large,career_goal=small"
+
+Every routed call is counted as routing_total{task,tier,model,outcome} and timed as
+"route.<task>"; token cost per task and model is in llm_cost_usd_total (llm_client).
+"""
+import os
+import time
+import metrics
+import llm_client
+from structured_output import parse_structured
+
+TIERS = {
+    "small": os.getenv("SKILLMENTOR_MODEL_SMALL", "gpt-4o-mini"),
+    "large": llm_client.DEFAULT_MODEL,
+}
+DEFAULT_ROUTES = {
+    "career_goal": "small",
+    "skill_extraction": "small",
+    "project_recommendations": "small",
+    "learning_roadmap": "small",
+    "resume_analysis": "large",
+    "recommendations": "large",
+}
+ESCALATION_TIER = "large"
+ESCALATION_ENABLED = os.getenv("SKILLMENTOR_MODEL_ESCALATE", "1").lower() in ("1", "true", "yes")
+
+
+def _parse_routes(spec):
+    routes = {}
+    for pair in spec.split(","):
+        task, _, tier = pair.partition("=")
+        if task.strip() and tier.strip():
+            routes[task.strip()] = tier.strip()
+    return routes
+
+
+ROUTES = {**DEFAULT_ROUTES, **_parse_routes(os.getenv("SKILLMENTOR_MODEL_ROUTES", ""))}
+
+
+def route(task):
+    """
+    (tier, model) for task. Unknown tasks use the large tier; a route may also name a
+    model directly instead of a tier.
+    """
+    tier = ROUTES.get(task, "large")
+    return tier, TIERS.get(tier, tier)
+
+
+def model_for(task):
+    return route(task)[1]
+
+
+def _record(task, tier, model, started, outcome):
+    elapsed = time.perf_counter() - started
+    metrics.observe(f"route.{task}", elapsed)
+    metrics.inc("routing_total", task=task, tier=tier, model=model, outcome=outcome)
+    metrics.log_event("route", task=task, tier=tier, model=model, outcome=outcome,
+                      duration_ms=round(elapsed * 1000, 1))
+
+
+# -----------------------------
+# Routed Calls
+# -----------------------------
+def complete(task, prompt, **kwargs):
+    """
+    llm_client.complete on the model routed for task.
+    """
+    tier, model = route(task)
+    started = time.perf_counter()
+    try:
+        text = llm_client.complete(prompt, name=task, model=model, **kwargs)
+    except Exception:
+        _record(task, tier, model, started, "error")
+        raise
+    _record(task, tier, model, started, "ok")
+    return text
+
+
+def stream(task, prompt, **kwargs):
+    """
+    llm_client.stream on the model routed for task.
+    """
+    tier, model = route(task)
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield from llm_client.stream(prompt, name=task, model=model, **kwargs)
+        outcome = "ok"
+    except GeneratorExit:
+        outcome = "cancelled"
+        raise
+    finally:
+        _record(task, tier, model, started, outcome)
+
+
+def escalate(task, prompt, schema, reason="invalid", **kwargs):
+    """
+    Re-send a prompt whose routed response failed validation ("invalid") or left part of
+    the request unanswered ("incomplete") to the escalation tier. Returns
+    (value, error, text), or None when the task already runs there or escalation is disabled.
+    """
+    tier, model = route(task)
+    target = TIERS[ESCALATION_TIER]
+    if not ESCALATION_ENABLED or model == target:
+        return None
+    metrics.inc("routing_escalations_total", task=task, model=model, reason=reason)
+    started = time.perf_counter()
+    try:
+        text = llm_client.complete(prompt, name=task, model=target, **kwargs)
+    except Exception:
+        _record(task, ESCALATION_TIER, target, started, "error")
+        raise
+    value, error = parse_structured(text, schema)
+    _record(task, ESCALATION_TIER, target, started, "invalid" if error else "escalated")
+    return value, error, text
+
+
+def complete_structured(task, prompt, schema, **kwargs):
+    """
+    Call the model routed for task and parse the response with schema, escalating once if
+    it does not validate. Returns (value, error, text) like parse_structured plus the text
+    of the response that was used.
+    """
+    tier, model = route(task)
+    started = time.perf_counter()
+    try:
+        text = llm_client.complete(prompt, name=task, model=model, **kwargs)
+    except Exception:
+        _record(task, tier, model, started, "error")
+        raise
+    value, error = parse_structured(text, schema)
+    _record(task, tier, model, started, "invalid" if error else "ok")
+    if error:
+        escalated = escalate(task, prompt, schema, **kwargs)
+        if escalated is not None:
+            return escalated
+    return value, error, text
+
+
+def summary():
+    """
+    Per task: routed model, calls by outcome and token cost, for the admin panel.
+    """
+    rows = {}
+    for labels, value in metrics.counters().get("routing_total", {}).items():
+        labels = dict(labels)
+        row = rows.setdefault(labels["task"], {"task": labels["task"], "model": model_for(labels["task"]),
+                                               "calls": 0, "invalid": 0, "escalated": 0, "cost_usd": 0.0})
+        row["calls"] += value
+        if labels["outcome"] in ("invalid", "escalated"):
+            row[labels["outcome"]] += value
+    for task, row in rows.items():
+        row["cost_usd"] = round(metrics.counter_total("llm_cost_usd_total", name=task), 4)
+    return sorted(rows.values(), key=lambda r: r["task"])
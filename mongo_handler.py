@@ -0,0 +1,168 @@
+# mongo_handler.py
+"""
+Per-user storage of the last analysis, roadmap and projects, keyed by the Firebase user_id,
+so a returning user sees their dashboard again without re-uploading or re-running GPT.
+
+The backend is MongoDB when SKILLMENTOR_USER_STORE is a mongodb:// URI (requires pymongo),
+otherwise a local SQLite file exposing the same small collection interface
+(find_one / update_one with $set / delete_one).
+"""
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from llm_cache import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+USER_STORE_URI = os.getenv("SKILLMENTOR_USER_STORE", os.path.join(CACHE_DIR, "user_data.sqlite3"))
+MONGO_DATABASE = os.getenv("SKILLMENTOR_MONGO_DB", "skillmentor")
+MONGO_COLLECTION = "user_data"
+
+
+# -----------------------------
+# SQLite Backend
+# -----------------------------
+class SQLiteCollection:
+    """
+    A single-table stand-in for a Mongo collection of user documents. Only equality
+    filters on user_id and $set updates are supported, which is all this app needs;
+    every read is one primary-key lookup.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS user_data ("
+                " user_id TEXT PRIMARY KEY,"
+                " document TEXT NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def _user_id(filter):
+        if set(filter) != {"user_id"}:
+            raise ValueError(f"SQLiteCollection only supports filtering on user_id, got {sorted(filter)}")
+        return str(filter["user_id"])
+
+    def find_one(self, filter, projection=None):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT document FROM user_data WHERE user_id = ?", (self._user_id(filter),)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def update_one(self, filter, update, upsert=False):
+        user_id = self._user_id(filter)
+        changes = update.get("$set", {})
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT document FROM user_data WHERE user_id = ?", (user_id,)).fetchone()
+            if row is None and not upsert:
+                return
+            document = json.loads(row[0]) if row else {"user_id": user_id}
+            document.update(changes)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO user_data (user_id, document, updated_at) VALUES (?, ?, ?)",
+                (user_id, json.dumps(document, ensure_ascii=False), time.time()),
+            )
+
+    def delete_one(self, filter):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM user_data WHERE user_id = ?", (self._user_id(filter),))
+
+
+# -----------------------------
+# Backend Selection
+# -----------------------------
+def _mongo_collection(uri):
+    from pymongo import MongoClient
+    collection = MongoClient(uri, serverSelectionTimeoutMS=5000)[MONGO_DATABASE][MONGO_COLLECTION]
+    collection.create_index("user_id", unique=True)
+    return collection
+
+
+_collection = None
+_collection_lock = threading.Lock()
+
+
+def get_collection():
+    """
+    Return the process-wide user collection, creating it on first use.
+    """
+    global _collection
+    if _collection is None:
+        with _collection_lock:
+            if _collection is None:
+                if USER_STORE_URI.startswith(("mongodb://", "mongodb+srv://")):
+                    _collection = _mongo_collection(USER_STORE_URI)
+                else:
+                    _collection = SQLiteCollection(USER_STORE_URI)
+    return _collection
+
+
+# -----------------------------
+# User Data
+# -----------------------------
+def get_user_data(user_id):
+    """
+    Return the stored document for user_id (analysis_result, roadmap, projects, resume_hash,
+    career_goal, interests...), or None if there is none or the store is unavailable.
+    """
+    if not user_id:
+        return None
+    try:
+        return get_collection().find_one({"user_id": user_id}, {"_id": 0})
+    except Exception:
+        logger.warning("Could not load stored data for user %s", user_id, exc_info=True)
+        return None
+
+
+def save_user_data(user_id, **fields):
+    """
+    Merge fields into the user's document. Storage errors are logged, never raised,
+    so a broken store cannot break the dashboard.
+    """
+    if not user_id or not fields:
+        return
+    fields["updated_at"] = time.time()
+    try:
+        get_collection().update_one({"user_id": user_id}, {"$set": fields}, upsert=True)
+    except Exception:
+        logger.warning("Could not store data for user %s", user_id, exc_info=True)
+
+
+def clear_user_data(user_id):
+    try:
+        get_collection().delete_one({"user_id": user_id})
+    except Exception:
+        logger.warning("Could not delete stored data for user %s", user_id, exc_info=True)
+
+
+def is_complete_analysis(analysis_result):
+    """
+    True for a full analysis: not a degraded GPT fallback and with required skills.
+    Only those are worth persisting or reloading.
+    """
+    return bool(analysis_result) and not analysis_result.get("degraded") \
+        and bool(analysis_result.get("required_skills"))
+
+
+def matches_inputs(record, resume_hash, career_goal, interests):
+    """
+    True when record holds a complete analysis of this exact resume, goal and interest set,
+    i.e. it can be shown instead of running the LLM stages again.
+    """
+    if not record or not is_complete_analysis(record.get("analysis_result")):
+        return False
+    return (record.get("resume_hash") == resume_hash
+            and record.get("career_goal") == career_goal
+            and sorted(record.get("interests") or []) == sorted(interests or []))
@@ -1,22 +1,12 @@
-import os
-import json
-from langchain_community.chat_models import ChatOpenAI
-from langchain.chains import LLMChain
-from langchain.prompts import PromptTemplate
+import llm_cache
+import metrics
+import semantic_cache
+import model_router
+from llm_streaming import iter_json_array_items
+from structured_output import parse_structured, validate_item
 
-def suggest_projects(career_goal):
-    """
-    Suggest 3-5 practical projects based on the user's career goal.
-    Returns a list of project dictionaries with:
-    - project_name
-    - description
-    - estimated_duration
-    """
-
-    if not career_goal:
-        return [{"message": "No career goal provided. Cannot suggest projects."}]
-
-    prompt = f"""
+def _build_prompt(career_goal):
+    return f"""
 You are a career mentor.
 
 The user's career goal is: {career_goal}
@@ -34,24 +24,106 @@ Important:
 - Do NOT include explanations, Markdown, or text outside the JSON.
 """
 
-    llm = ChatOpenAI(model="gpt-4o", api_key=os.getenv("OPENAI_API_KEY"), temperature=0)
-    chain = LLMChain(llm=llm, prompt=PromptTemplate(template=prompt, input_variables=[]))
-
-    # Call GPT
-    response = chain.invoke({})
-    response_text = response.get("text", str(response)) if isinstance(response, dict) else str(response)
+def _parse_projects(response_text):
+    """
+    Parse the full response text. Returns (projects, ok).
+    """
+    projects, error = parse_structured(response_text, "projects")
+    if error:
+        return [{"message": "Failed to parse GPT JSON output. Raw output: " + response_text}], False
+    return projects, True
 
-    # Clean code fences
-    response_text = response_text.replace("```json", "").replace("```", "").strip()
+@metrics.timed("suggest_projects")
+def suggest_projects(career_goal):
+    """
+    Suggest 3-5 practical projects based on the user's career goal.
+    Returns a list of project dictionaries with:
+    - project_name
+    - description
+    - estimated_duration
+    """
 
-    # Parse JSON
-    try:
-        projects = json.loads(response_text)
-    except json.JSONDecodeError:
-        projects = [{"message": "Failed to parse GPT JSON output. Raw output: " + response_text}]
+    if not career_goal:
+        return [{"message": "No career goal provided. Cannot suggest projects."}]
 
-    # Ensure output is always a list
-    if not isinstance(projects, list):
-        projects = [projects]
+    # Serve repeated requests (Streamlit reruns, other users) from the cache
+    cache_key = llm_cache.make_key("project_recommendations", model_router.model_for("project_recommendations"),
+                                   career_goal=career_goal)
+    cached = llm_cache.lookup(cache_key)
+    if cached is None:
+        # Near-duplicate request (reordered/aliased skills, reworded goal)
+        cached = semantic_cache.lookup_projects(career_goal)
+        if cached is not None:
+            llm_cache.store(cache_key, cached)
+    if cached is not None:
+        return cached
 
+    # Small-tier model, escalated if its output does not validate
+    projects, error, response_text = model_router.complete_structured(
+        "project_recommendations", _build_prompt(career_goal), "projects")
+    if error:
+        return [{"message": "Failed to parse GPT JSON output. Raw output: " + response_text}]
+    llm_cache.store(cache_key, projects)
+    semantic_cache.remember_projects(career_goal, cache_key)
     return projects
+
+def stream_projects(career_goal):
+    """
+    Streaming variant of suggest_projects: yields each project as soon as its JSON
+    object is complete. Shares the cache with suggest_projects.
+    """
+    if not career_goal:
+        yield {"message": "No career goal provided. Cannot suggest projects."}
+        return
+
+    cache_key = llm_cache.make_key("project_recommendations", model_router.model_for("project_recommendations"),
+                                   career_goal=career_goal)
+    cached = llm_cache.lookup(cache_key)
+    if cached is None:
+        cached = semantic_cache.lookup_projects(career_goal)
+        if cached is not None:
+            llm_cache.store(cache_key, cached)
+    if cached is not None:
+        yield from cached
+        return
+
+    chunks = []
+    def tee():
+        for chunk in model_router.stream("project_recommendations", _build_prompt(career_goal)):
+            chunks.append(chunk)
+            yield chunk
+
+    projects, dropped = [], 0
+    for item in iter_json_array_items(tee()):
+        # Items that do not fit the schema are dropped before they are shown or cached
+        item = validate_item(item, "projects")
+        if item is None:
+            dropped += 1
+            continue
+        projects.append(item)
+        yield item
+
+    if projects and dropped:
+        # Part of the small-tier answer was malformed: top it up from the large tier
+        escalated = model_router.escalate("project_recommendations", _build_prompt(career_goal), "projects")
+        if escalated is not None and escalated[1] is None:
+            shown = {p.get("project_name") for p in projects}
+            extra = [p for p in escalated[0] if p.get("project_name") not in shown]
+            extra = extra[:max(0, len(escalated[0]) - len(projects))]
+            projects.extend(extra)
+            yield from extra
+    if projects:
+        llm_cache.store(cache_key, projects)
+        semantic_cache.remember_projects(career_goal, cache_key)
+        return
+
+    # Not an array (or nothing valid): fall back to parsing the whole response
+    projects, ok = _parse_projects("".join(chunks))
+    if not ok:
+        escalated = model_router.escalate("project_recommendations", _build_prompt(career_goal), "projects")
+        if escalated is not None and escalated[1] is None:
+            projects, ok = escalated[0], True
+    if ok:
+        llm_cache.store(cache_key, projects)
+        semantic_cache.remember_projects(career_goal, cache_key)
+    yield from projects
@@ -0,0 +1,216 @@
+# prompt_budget.py
+import os
+import re
+import logging
+import threading
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+RESUME_TOKEN_BUDGET = int(os.getenv("SKILLMENTOR_RESUME_TOKEN_BUDGET", 1500))
+TOKENIZER_MODEL = os.getenv("SKILLMENTOR_LLM_MODEL", "gpt-4o")
+MIN_SECTION_TOKENS = 20
+
+# Section headings commonly found in resumes, most useful for career analysis first
+SECTION_PRIORITY = ["skills", "technical skills", "experience", "work experience", "professional experience",
+                    "internships", "internship", "projects", "certifications", "achievements", "summary",
+                    "profile", "objective", "education", "publications", "activities", "extracurricular activities",
+                    "languages", "interests", "hobbies", "references", "declaration"]
+_HEADING_RE = re.compile(r"^[\W_]*(%s)[\s:\-–—]*$" % "|".join(re.escape(h) for h in SECTION_PRIORITY), re.IGNORECASE)
+_PAGE_NUMBER_RE = re.compile(r"^(page\s*)?\d+(\s*(of|/)\s*\d+)?$", re.IGNORECASE)
+
+_stats = deque(maxlen=1000)
+_encoder = None
+_encoder_lock = threading.Lock()
+
+
+# -----------------------------
+# Token Counting
+# -----------------------------
+def _get_encoder():
+    """
+    Load the tiktoken encoding for the configured model once. Returns None if tiktoken is not
+    installed or its encoding files cannot be loaded (e.g. offline), in which case token
+    counts fall back to the ~4 characters per token rule of thumb.
+    """
+    global _encoder
+    if _encoder is None:
+        with _encoder_lock:
+            if _encoder is None:
+                try:
+                    import tiktoken
+                    try:
+                        _encoder = tiktoken.encoding_for_model(TOKENIZER_MODEL)
+                    except KeyError:
+                        _encoder = tiktoken.get_encoding("o200k_base")
+                except Exception:
+                    _encoder = False
+    return _encoder or None
+
+
+def count_tokens(text):
+    encoder = _get_encoder()
+    if encoder is None:
+        return (len(text) + 3) // 4
+    return len(encoder.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text, max_tokens):
+    if max_tokens <= 0:
+        return ""
+    encoder = _get_encoder()
+    if encoder is None:
+        return text[:max_tokens * 4]
+    tokens = encoder.encode(text, disallowed_special=())
+    return text if len(tokens) <= max_tokens else encoder.decode(tokens[:max_tokens])
+
+
+# -----------------------------
+# Cleanup
+# -----------------------------
+def normalize_whitespace(text):
+    """
+    Collapse runs of spaces/tabs, strip each line and allow at most one blank line in a row.
+    """
+    lines = [" ".join(line.split()) for line in text.replace("\r", "\n").split("\n")]
+    result, blank = [], False
+    for line in lines:
+        if not line:
+            if not blank and result:
+                result.append("")
+            blank = True
+            continue
+        result.append(line)
+        blank = False
+    return "\n".join(result).strip()
+
+
+def dedupe_lines(text):
+    """
+    Drop page numbers and lines that repeat verbatim (running headers/footers, table cells
+    repeated across pages), keeping the first occurrence.
+    """
+    seen, result = set(), []
+    for line in text.split("\n"):
+        key = line.strip().lower()
+        if key:
+            if _PAGE_NUMBER_RE.match(key) or key in seen:
+                continue
+            seen.add(key)
+        result.append(line)
+    return "\n".join(result)
+
+
+def detect_sections(text):
+    """
+    Split resume text into (heading, body) pairs in document order. Text before the first
+    recognised heading is returned under the heading "header".
+    """
+    sections, heading, body = [], "header", []
+    for line in text.split("\n"):
+        match = _HEADING_RE.match(line.strip())
+        if match:
+            if body or heading != "header":
+                sections.append((heading, "\n".join(body).strip()))
+            heading, body = match.group(1).lower(), [line]
+        else:
+            body.append(line)
+    sections.append((heading, "\n".join(body).strip()))
+    return [(h, b) for h, b in sections if b]
+
+
+# -----------------------------
+# Budgeting
+# -----------------------------
+def _priority(heading):
+    if heading == "header":
+        return -1  # name/contact/summary block at the top is always kept first
+    return SECTION_PRIORITY.index(heading)
+
+
+def compress_resume(text, max_tokens=RESUME_TOKEN_BUDGET, name="resume"):
+    """
+    Clean up resume text and fit it into max_tokens, keeping the most useful sections
+    (skills, experience, projects...) and cutting the least useful ones first. Text that
+    already fits after cleanup is returned as cleaned.
+    Returns (compressed_text, report) where report records the tokens saved.
+    """
+    text = text or ""
+    original_tokens = count_tokens(text)
+    cleaned = dedupe_lines(normalize_whitespace(text))
+    sections = detect_sections(cleaned)
+
+    kept = dict(enumerate(body for _, body in sections))
+    compressed = cleaned
+    if count_tokens(cleaned) > max_tokens:
+        # Over budget only: no single section may take more than a third of the budget, so
+        # one long experience section cannot crowd out skills and projects
+        section_cap = max(MIN_SECTION_TOKENS, max_tokens // 3)
+        budget = max_tokens
+        kept = {}
+        for index in sorted(range(len(sections)), key=lambda i: _priority(sections[i][0])):
+            body = sections[index][1]
+            allowance = min(budget, section_cap)
+            if allowance < MIN_SECTION_TOKENS:
+                break
+            if count_tokens(body) > allowance:
+                body = truncate_to_tokens(body, allowance)
+            kept[index] = body
+            budget -= count_tokens(body)
+        compressed = "\n\n".join(kept[i] for i in sorted(kept))
+    compressed_tokens = count_tokens(compressed)
+    report = {
+        "name": name,
+        "original_tokens": original_tokens,
+        "compressed_tokens": compressed_tokens,
+        "tokens_saved": max(0, original_tokens - compressed_tokens),
+        "sections": [h for h, _ in sections],
+        "dropped_sections": [sections[i][0] for i in range(len(sections)) if i not in kept],
+    }
+    _stats.append(report)
+    logger.info("prompt budget %s: %d -> %d tokens (%d saved)", name, original_tokens,
+                compressed_tokens, report["tokens_saved"])
+    return compressed, report
+
+
+def get_budget_reports():
+    """
+    Return the most recent compression reports.
+    """
+    return list(_stats)
+
+
+def main(argv=None):
+    """
+    Measure the savings on a directory of real resumes:
+
+        python prompt_budget.py resumes/ --budget 1500
+    """
+    import argparse
+    from resume_ingest import extract_resume_text
+
+    parser = argparse.ArgumentParser(description="Report prompt tokens saved by resume compression.")
+    parser.add_argument("directory")
+    parser.add_argument("--budget", type=int, default=RESUME_TOKEN_BUDGET)
+    args = parser.parse_args(argv)
+
+    total_before = total_after = 0
+    for name in sorted(os.listdir(args.directory)):
+        if not name.lower().endswith((".pdf", ".docx")):
+            continue
+        try:
+            text, _, _ = extract_resume_text(os.path.join(args.directory, name))
+        except Exception as e:
+            print(f"{name}: skipped ({e})")
+            continue
+        _, report = compress_resume(text, args.budget, name=name)
+        total_before += report["original_tokens"]
+        total_after += report["compressed_tokens"]
+        print(f"{name}: {report['original_tokens']} -> {report['compressed_tokens']} tokens")
+    if total_before:
+        print(f"Total: {total_before} -> {total_after} tokens "
+              f"({100 * (total_before - total_after) / total_before:.1f}% saved)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# required_skills.py
+"""
+Precomputed required-skills table for the fixed career goals and interests offered on the
+upload page. Requirements for a (career goal, interest set) pair are the goal's skills plus
+the skills of each selected interest, so the table only needs one entry per goal and per
+interest. Rebuild it with GPT when the role definitions should be refreshed:
+
+    python required_skills.py build
+    python required_skills.py show "Data Scientist" "Data Science" "Cloud Computing"
+"""
+import os
+import sys
+import json
+import argparse
+from datetime import datetime, timezone
+from skill_extractor import canonicalize_skills
+
+TABLE_PATH = os.getenv("SKILLMENTOR_REQUIRED_SKILLS",
+                       os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "required_skills.json"))
+
+CAREER_GOALS = ["Java Full Stack Developer", "Python Full Stack Developer", "Mern Stack Developer", "Data Scientist",
+                "Data Engineer", "Cybersecurity Analyst", "Cloud Architect", "Mobile App Developer",
+                "Frontend Developer", "UI/UX Designer"]
+
+INTERESTS = ["Full Stack Development", "Artificial Intelligence", "Web Development", "Data Science",
+             "Cybersecurity", "Cloud Computing", "Mobile App Development", "Game Development",
+             "UI/UX Design", "Software Developer"]
+
+_tables = {}
+
+
+def _normalize(name):
+    return " ".join(str(name).split()).lower()
+
+
+def load_table(path=TABLE_PATH):
+    """
+    Load a table once per process. A missing file yields an empty table (every lookup
+    then falls back to GPT).
+    """
+    table = _tables.get(path)
+    if table is None:
+        try:
+            with open(path, encoding="utf-8") as fh:
+                table = json.load(fh)
+        except FileNotFoundError:
+            table = {"version": 0, "goals": {}, "interests": {}}
+        table["_goals"] = {_normalize(k): v for k, v in table.get("goals", {}).items()}
+        table["_interests"] = {_normalize(k): v for k, v in table.get("interests", {}).items()}
+        _tables[path] = table
+    return table
+
+
+def table_version():
+    return load_table().get("version", 0)
+
+
+def lookup_required_skills(career_goal, interests=()):
+    """
+    Return the required skills for (career_goal, interests) from the table, or None when
+    the goal or any interest is not in it (e.g. a free-text goal from "Suggest me a career goal").
+    """
+    table = load_table()
+    goal_skills = table["_goals"].get(_normalize(career_goal or ""))
+    if goal_skills is None:
+        return None
+    skills = list(goal_skills)
+    for interest in sorted(interests or []):
+        interest_skills = table["_interests"].get(_normalize(interest))
+        if interest_skills is None:
+            return None
+        skills.extend(interest_skills)
+    return canonicalize_skills(skills)
+
+
+# -----------------------------
+# Offline Build
+# -----------------------------
+def _ask_for_skills(subject):
+    import llm_client
+    from structured_output import parse_structured
+    prompt = f"""
+You are an expert career coach.
+
+List the core skills required for: {subject}
+
+Return ONLY a JSON array of 8-16 short skill names (e.g. "Python", "Docker", "REST APIs"), no extra text.
+"""
+    skills, error = parse_structured(llm_client.complete(prompt, name="required_skills_build"), "skill_list")
+    if error:
+        raise ValueError(f"Could not parse required skills for {subject!r}: {error}")
+    return canonicalize_skills(skills)
+
+
+def build_table(path=TABLE_PATH, goals=CAREER_GOALS, interests=INTERESTS):
+    """
+    Regenerate every goal and interest entry with GPT and write a new table version.
+    """
+    import llm_client
+    previous = load_table(path) if os.path.exists(path) else {"version": 0}
+    table = {
+        "version": previous.get("version", 0) + 1,
+        "source": "llm",
+        "model": llm_client.DEFAULT_MODEL,
+        "built_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "goals": {},
+        "interests": {},
+    }
+    for goal in goals:
+        print(f"Building goal: {goal}", file=sys.stderr)
+        table["goals"][goal] = _ask_for_skills(f"the job role '{goal}'")
+    for interest in interests:
+        print(f"Building interest: {interest}", file=sys.stderr)
+        table["interests"][interest] = _ask_for_skills(f"someone interested in '{interest}'")
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        json.dump(table, fh, indent=2)
+    os.replace(tmp_path, path)
+    _tables.pop(path, None)
+    return table
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the precomputed required-skills table.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Regenerate the table with GPT")
+    build.add_argument("--out", default=TABLE_PATH)
+    show = sub.add_parser("show", help="Print the required skills for a goal and interests")
+    show.add_argument("career_goal")
+    show.add_argument("interests", nargs="*")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        table = build_table(args.out)
+        print(f"Wrote version {table['version']} to {args.out}")
+    else:
+        skills = lookup_required_skills(args.career_goal, args.interests)
+        print(json.dumps(skills, indent=2) if skills is not None else "Not in table")
+
+
+if __name__ == "__main__":
+    main()
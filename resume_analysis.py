@@ -1,81 +1,225 @@
 # resume_analysis.py
-import os
-import re
-import json
-from langchain_community.chat_models import ChatOpenAI
-from langchain.schema import HumanMessage
+import hashlib
+import llm_cache
+import metrics
+import model_router
+from skill_extractor import extract_skills, canonicalize_skills, compute_skill_match, TAXONOMY_VERSION
+from required_skills import lookup_required_skills, table_version
+from prompt_budget import compress_resume
 
-# Load OpenAI key from environment variables
-openai_api_key = os.getenv("OPENAI_API_KEY")
+# Below this many locally recognised skills the resume is probably unusual enough to ask GPT
+MIN_LOCAL_SKILLS = 3
 
-def evaluate_resume_profile(resume_text, interests, career_goal):
+EMPTY_ANALYSIS = {"extracted_skills": [], "required_skills": [], "skill_match_percentage": 0,
+                  "skill_gap_percentage": 0, "missing_skills": [], "recommendations": []}
+
+def extract_skills_with_llm(resume_text):
     """
-    GPT-powered resume analysis:
-    - Extract skills dynamically from the resume (technical + internships + projects + experience)
-    - Determine required skills for selected interests & career goal
-    - Compute skill match % and skill gap %
-    - Provide actionable recommendations
+    GPT fallback for resumes the local taxonomy barely recognises. Returns a list of
+    canonicalized skills, or [] if the response cannot be parsed.
     """
-    llm = ChatOpenAI(model="gpt-4o", api_key=openai_api_key, temperature=0)
+    cache_key = llm_cache.make_key("resume_skills", model_router.model_for("skill_extraction"), resume_text=resume_text)
+    cached = llm_cache.lookup(cache_key)
+    if cached is not None:
+        return cached
 
+    compressed_resume, _ = compress_resume(resume_text, name="skill_extraction")
     prompt = f"""
 You are an expert career coach.
 
 Resume:
-{resume_text}
+{compressed_resume}
+
+Task:
+Extract all skills mentioned anywhere in the resume, including technical skills, internships,
+projects, work experience and achievements.
+
+Return ONLY a JSON array of skill names, no extra text.
+"""
+    skills, error, _ = model_router.complete_structured("skill_extraction", prompt, "skill_list")
+    if error:
+        return []
+    skills = canonicalize_skills(skills)
+    llm_cache.store(cache_key, skills)
+    return skills
 
+def _required_skills_and_recommendations(extracted_skills, interests, career_goal):
+    """
+    Ask GPT for the skills the goal requires and for recommendations. Only the extracted
+    skill list is sent, never the resume itself. Returns (required_skills, recommendations).
+    """
+    prompt = f"""
+You are an expert career coach.
+
+The user already has these skills: {', '.join(extracted_skills) or 'none listed'}
 User Interests: {', '.join(interests)}
 Career Goal: {career_goal}
 
 Tasks:
-1. Extract all skills mentioned anywhere in the resume, including:
-   - Technical skills
-   - Internships
-   - Projects
-   - Work experience
-   - Achievements
-2. List all the skills required for the selected interests and career goal.
-3. Compute skill match percentage (skills they have / skills required).
-4. Compute skill gap percentage.
-5. List missing skills.
-6. Provide 3-5 actionable recommendations (courses, learning paths, or projects) to cover missing skills.
+1. List all the skills required for the selected interests and career goal.
+2. Provide 3-5 actionable recommendations (courses, learning paths, or projects) to cover the required skills the user does not have yet.
 
 **Important:** Return ONLY JSON, no extra text. The JSON keys must be:
-- extracted_skills
 - required_skills
-- skill_match_percentage
-- skill_gap_percentage
-- missing_skills
 - recommendations
 """
+    result, error, _ = model_router.complete_structured("resume_analysis", prompt, "requirements", json_mode=True)
+    if error:
+        return None, []
+    return result["required_skills"], result["recommendations"]
+
+def _recommendations(extracted_skills, missing_skills, career_goal):
+    """
+    Ask GPT for recommendations only; the required skills are already known.
+    Returns None if the response cannot be parsed.
+    """
+    if not missing_skills:
+        return []
+    cache_key = llm_cache.make_key("recommendations", model_router.model_for("recommendations"),
+                                   extracted_skills=set(extracted_skills), missing_skills=missing_skills,
+                                   career_goal=career_goal)
+    cached = llm_cache.lookup(cache_key)
+    if cached is not None:
+        return cached
+    prompt = f"""
+You are an expert career coach.
+
+Career Goal: {career_goal}
+The user already has these skills: {', '.join(extracted_skills) or 'none listed'}
+The user is missing these skills: {', '.join(missing_skills)}
+
+Task:
+Provide 3-5 actionable recommendations (courses, learning paths, or projects) to cover the missing skills.
+
+**Important:** Return ONLY a JSON array of recommendation strings, no extra text.
+"""
+    recommendations, error, _ = model_router.complete_structured("recommendations", prompt, "recommendations")
+    if error:
+        return None
+    llm_cache.store(cache_key, recommendations)
+    return recommendations
+
+# -----------------------------
+# Cached Stages
+# -----------------------------
+# resume -> skills and (goal, interests) -> required skills are cached separately, so trying
+# another goal for the same resume only recomputes the match locally (plus recommendations)
+def resume_skills(resume_text):
+    """
+    Stage 1: the skills in a resume, cached by the resume's content hash.
+    """
+    resume_hash = hashlib.sha256(resume_text.encode("utf-8")).hexdigest()
+    cache_key = llm_cache.make_key("resume_skills_stage", model_router.model_for("skill_extraction"),
+                                   resume_hash=resume_hash, taxonomy_version=TAXONOMY_VERSION)
+    cached = llm_cache.lookup(cache_key)
+    if cached is not None:
+        return cached
+
+    extracted_skills = extract_skills(resume_text)
+    if len(extracted_skills) < MIN_LOCAL_SKILLS:
+        try:
+            llm_skills = extract_skills_with_llm(resume_text)
+        except Exception:
+            return extracted_skills  # keep the local result when GPT is unavailable; retried next time
+        if not llm_skills:
+            return extracted_skills
+        extracted_skills = canonicalize_skills(extracted_skills + llm_skills)
+    llm_cache.store(cache_key, extracted_skills)
+    return extracted_skills
+
+def _required_skills_key(career_goal, interests):
+    return llm_cache.make_key("required_skills", model_router.model_for("resume_analysis"),
+                              career_goal=career_goal, interests=set(interests or []))
+
+def required_skills_for(career_goal, interests):
+    """
+    Stage 2: required skills for a goal and interests, from the precomputed table or from
+    an earlier GPT answer for goals outside it. None when neither has them.
+    """
+    required_skills = lookup_required_skills(career_goal, interests)
+    if required_skills is None:
+        required_skills = llm_cache.lookup(_required_skills_key(career_goal, interests))
+    return required_skills
 
-    # Call GPT
-    response = llm([HumanMessage(content=prompt)])
+def _degraded(result, reason):
+    """
+    Mark a partial local result returned because GPT failed. Degraded results are never
+    cached, so callers should show them but not persist them or treat them as final.
+    """
+    return dict(result, degraded=reason)
 
-    # Extract text from GPT response
-    if isinstance(response, list) and len(response) > 0:
-        response_text = response[0].content
-    elif hasattr(response, "content"):
-        response_text = response.content
-    else:
-        response_text = str(response)
+@metrics.timed("evaluate_resume_profile")
+def evaluate_resume_profile(resume_text, interests, career_goal):
+    """
+    Resume analysis:
+    - Extract skills locally from the resume with the skill taxonomy (GPT only as a fallback),
+      cached per resume
+    - Look up required skills for selected interests & career goal in the precomputed table
+      (GPT only for goals that are not in it), cached per goal and interests
+    - Compute skill match %, skill gap % and missing skills exactly in Python
+    - Provide actionable recommendations (GPT)
+    When GPT fails, the partial local result is returned with a "degraded" reason.
+    """
+    # Same resume, interests and goal always yield the same analysis at temperature 0
+    cache_key = llm_cache.make_key("resume_analysis", model_router.model_for("resume_analysis"),
+                                   resume_text=resume_text, interests=set(interests or []),
+                                   career_goal=career_goal, required_skills_version=table_version(),
+                                   taxonomy_version=TAXONOMY_VERSION)
+    cached = llm_cache.lookup(cache_key)
+    if cached is not None:
+        return cached
 
-    # Clean JSON inside any markdown fences
-    response_text = re.sub(r"```(?:json)?", "", response_text).replace("```", "").strip()
-    response_text = response_text.replace("'", '"')  # ensure proper JSON quotes
+    extracted_skills = resume_skills(resume_text)
+    result = dict(EMPTY_ANALYSIS, extracted_skills=extracted_skills)
+    required_skills = required_skills_for(career_goal, interests)
+    if required_skills is not None:
+        # Known goal (or one asked about before): match/gap are computed locally, even if GPT
+        # is down; GPT only adds recommendations
+        result["required_skills"] = required_skills
+        result.update(compute_skill_match(extracted_skills, required_skills))
+        try:
+            recommendations = _recommendations(extracted_skills, result["missing_skills"], career_goal)
+        except Exception as e:
+            return _degraded(result, f"recommendations failed: {type(e).__name__}: {e}")
+        if recommendations is None:
+            return _degraded(result, "recommendations could not be parsed")
+        result["recommendations"] = recommendations
+        llm_cache.store(cache_key, result)
+        return result
 
-    # Parse JSON safely
     try:
-        result = json.loads(response_text)
-    except json.JSONDecodeError:
-        result = {"extracted_skills": [], "required_skills": [], "skill_match_percentage": 0,
-                  "skill_gap_percentage": 0, "missing_skills": [], "recommendations": []}
+        required_skills, recommendations = _required_skills_and_recommendations(
+            extracted_skills, interests or [], career_goal)
+    except Exception as e:
+        # GPT is unavailable: still show the locally extracted skills
+        return _degraded(result, f"required skills failed: {type(e).__name__}: {e}")
+    if required_skills is None:
+        # Do not cache a failed parse so the next attempt retries the model
+        return _degraded(result, "required skills could not be parsed")
 
-    # Ensure all keys exist
-    keys = ["extracted_skills", "required_skills", "skill_match_percentage",
-            "skill_gap_percentage", "missing_skills", "recommendations"]
-    for k in keys:
-        if k not in result:
-            result[k] = [] if "skills" in k or k=="recommendations" else 0
+    result["required_skills"] = canonicalize_skills(required_skills)
+    llm_cache.store(_required_skills_key(career_goal, interests), result["required_skills"])
+    result.update(compute_skill_match(extracted_skills, result["required_skills"]))
+    result["recommendations"] = recommendations
 
+    llm_cache.store(cache_key, result)
     return result
+
+def stream_career_goal(resume_text, interests):
+    """
+    Suggest one career goal/job title for the user, yielding the text as it is generated.
+    """
+    compressed_resume, _ = compress_resume(resume_text, name="career_goal")
+    prompt = f"""
+You are an expert career coach.
+
+Resume:
+{compressed_resume}
+
+User Interests: {', '.join(interests)}
+
+Task:
+Suggest one suitable career goal/job role for this user based on the resume and interests. 
+Return ONLY the job title as plain text.
+"""
+    yield from model_router.stream("career_goal", prompt)
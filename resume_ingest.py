@@ -0,0 +1,254 @@
+# resume_ingest.py
+import io
+import os
+import hashlib
+import logging
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import llm_cache
+
+logger = logging.getLogger(__name__)
+
+# -----------------------------
+# Configuration
+# -----------------------------
+PDF_BACKEND = os.getenv("SKILLMENTOR_PDF_BACKEND", "pdfplumber")  # "pdfplumber" or "pdfium" (text only, faster)
+MAX_UPLOAD_BYTES = int(os.getenv("SKILLMENTOR_MAX_UPLOAD_MB", 10)) * 1024 * 1024
+MAX_PAGES = int(os.getenv("SKILLMENTOR_MAX_PAGES", 30))
+PARALLEL_PAGE_THRESHOLD = int(os.getenv("SKILLMENTOR_PARALLEL_PAGES", 8))
+PARALLEL_WORKERS = int(os.getenv("SKILLMENTOR_PARSE_WORKERS", max(1, min(4, (os.cpu_count() or 1)))))
+TEXT_CACHE_TTL = 30 * 24 * 3600
+# Uploads larger than this are spooled to a temp file on disk instead of held in memory
+SPOOL_MEMORY_BYTES = int(os.getenv("SKILLMENTOR_SPOOL_MB", 1)) * 1024 * 1024
+_CHUNK_BYTES = 256 * 1024
+
+PDF_MIME = "application/pdf"
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+# -----------------------------
+# Hashing
+# -----------------------------
+def read_bytes(file):
+    """
+    Return the raw bytes of an uploaded file, a path or a bytes object.
+    """
+    if isinstance(file, (bytes, bytearray)):
+        return bytes(file)
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb") as fh:
+            return fh.read()
+    if hasattr(file, "getvalue"):
+        return file.getvalue()
+    file.seek(0)
+    return file.read()
+
+
+def content_digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def spool_upload(file, max_bytes=MAX_UPLOAD_BYTES):
+    """
+    Copy an uploaded file, path or bytes object into a SpooledTemporaryFile in chunks,
+    hashing it on the way, so no second full in-memory copy of a large upload is made.
+    Returns (spool, digest, size) with spool rewound; the caller closes it.
+    Raises ValueError as soon as the upload exceeds max_bytes.
+    """
+    if isinstance(file, (bytes, bytearray)):
+        source = io.BytesIO(file)
+    elif isinstance(file, (str, os.PathLike)):
+        source = open(file, "rb")
+    else:
+        source = file
+        source.seek(0)
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY_BYTES)
+    digest, size = hashlib.sha256(), 0
+    try:
+        while chunk := source.read(_CHUNK_BYTES):
+            size += len(chunk)
+            if size > max_bytes:
+                raise ValueError(f"Resume is too large; the limit is {max_bytes // (1024 * 1024)} MB.")
+            digest.update(chunk)
+            spool.write(chunk)
+    except BaseException:
+        spool.close()
+        raise
+    finally:
+        if source is not file:
+            source.close()
+    spool.seek(0)
+    return spool, digest.hexdigest(), size
+
+
+def _stream(data):
+    """
+    A rewound binary stream over PDF/DOCX bytes or an already open (spooled) file.
+    """
+    if isinstance(data, (bytes, bytearray)):
+        return io.BytesIO(data)
+    data.seek(0)
+    return data
+
+
+# -----------------------------
+# PDF Extraction
+# -----------------------------
+def _open_pdf(data, backend, start=0, stop=None):
+    """
+    Open a PDF once and return (document, total page count). pdfplumber documents only
+    turn pages [start, stop) into Page objects.
+    """
+    if backend == "pdfium":
+        import pypdfium2 as pdfium
+        pdf = pdfium.PdfDocument(_stream(data))
+        return pdf, len(pdf)
+    import pdfplumber
+    from pdfminer.pdftypes import resolve1
+    pdf = pdfplumber.open(_stream(data), pages=range(start + 1, stop + 1) if stop is not None else None)
+    try:
+        total = int(resolve1(resolve1(pdf.doc.catalog["Pages"])["Count"]))
+    except Exception:
+        total = len(pdf.pages) + start
+    return pdf, total
+
+
+def _page_texts(pdf, backend, start, stop):
+    """
+    Yield the text of pages [start, stop) of a document from _open_pdf, closing each page
+    as soon as its text has been read so parsed objects do not accumulate in memory.
+    """
+    if backend == "pdfium":
+        for index in range(start, min(stop or len(pdf), len(pdf))):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            try:
+                yield textpage.get_text_range().replace("\r\n", "\n")
+            finally:
+                textpage.close()
+                page.close()
+        return
+    # Opened with only the requested pages when stop is given
+    for page in pdf.pages if stop is not None else pdf.pages[start:]:
+        try:
+            yield page.extract_text() or ""
+        finally:
+            # Drop the parsed layout objects and char cache before reading the next page
+            page.close()
+
+
+def iter_pdf_pages(data, backend=PDF_BACKEND, start=0, stop=None):
+    """
+    Lazily yield the text of each page in [start, stop) from PDF bytes or a binary file.
+    """
+    pdf, _ = _open_pdf(data, backend, start, stop)
+    try:
+        yield from _page_texts(pdf, backend, start, stop)
+    finally:
+        pdf.close()
+
+
+def _extract_page_range(data, backend, start, stop):
+    return list(iter_pdf_pages(data, backend, start, stop))
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool():
+    """
+    Process pool shared by every parallel extraction, started on first use.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=PARALLEL_WORKERS)
+        return _pool
+
+
+def _extract_parallel(data, backend, page_count):
+    global _pool
+    if not isinstance(data, (bytes, bytearray)):
+        data = _stream(data).read()  # worker processes need the bytes themselves
+    chunk = -(-page_count // PARALLEL_WORKERS)
+    ranges = [(start, min(start + chunk, page_count)) for start in range(0, page_count, chunk)]
+    pool = _get_pool()
+    try:
+        futures = [pool.submit(_extract_page_range, data, backend, start, stop) for start, stop in ranges]
+        return [text for future in futures for text in future.result()]
+    except BrokenProcessPool:
+        # A worker died (e.g. killed for memory); start a fresh pool next time and parse here
+        logger.warning("PDF worker pool broke; parsing %d pages in-process", page_count)
+        with _pool_lock:
+            if _pool is pool:
+                _pool = None
+        return list(iter_pdf_pages(data, backend, 0, page_count))
+
+
+def extract_pdf_pages(data, backend=PDF_BACKEND, max_pages=MAX_PAGES, parallel=None):
+    """
+    Extract text from PDF bytes or a binary file, reading at most max_pages pages.
+    Returns (text, skipped_pages), skipped_pages being the pages beyond max_pages that
+    were not read. Large documents are split into page ranges parsed on a shared process
+    pool (parallel=None decides by page count).
+    """
+    pdf, total = _open_pdf(data, backend, 0, max_pages)
+    page_count = min(total, max_pages)
+    if parallel is None:
+        parallel = PARALLEL_WORKERS > 1 and page_count >= PARALLEL_PAGE_THRESHOLD
+    try:
+        if not parallel:
+            return "\n".join(_page_texts(pdf, backend, 0, page_count)), total - page_count
+    finally:
+        pdf.close()
+    return "\n".join(_extract_parallel(data, backend, page_count)), total - page_count
+
+
+def extract_pdf_text(data, backend=PDF_BACKEND, max_pages=MAX_PAGES, parallel=None):
+    """
+    Text of the first max_pages pages of a PDF; see extract_pdf_pages.
+    """
+    return extract_pdf_pages(data, backend, max_pages, parallel)[0]
+
+
+# -----------------------------
+# DOCX Extraction
+# -----------------------------
+def extract_docx_text(data):
+    from docx import Document as docx_document
+    doc = docx_document(_stream(data))
+    return "\n".join(para.text for para in doc.paragraphs)
+
+
+# -----------------------------
+# Cached Entry Point
+# -----------------------------
+def extract_resume_text(file, file_type=None, backend=PDF_BACKEND):
+    """
+    Extract resume text from an uploaded PDF/DOCX, caching the result by content hash so
+    reruns and re-uploads of the same file are parsed only once. The upload is streamed
+    through a spooled temp file rather than copied into memory.
+    Returns (text, digest, skipped_pages), skipped_pages counting PDF pages beyond
+    MAX_PAGES that were not read. Raises ValueError for oversized or unsupported files.
+    """
+    file_type = file_type or getattr(file, "type", None)
+    if file_type is None:
+        name = str(getattr(file, "name", file)).lower()
+        file_type = DOCX_MIME if name.endswith(".docx") else PDF_MIME
+    if file_type not in (PDF_MIME, DOCX_MIME):
+        raise ValueError(f"Unsupported resume format: {file_type}")
+
+    spool, digest, _ = spool_upload(file)
+    with spool:
+        cache_key = llm_cache.make_key("resume_pages", backend if file_type == PDF_MIME else "docx",
+                                       digest=digest, max_pages=MAX_PAGES)
+        cached = llm_cache.lookup(cache_key)
+        if cached is None:
+            text, skipped = extract_pdf_pages(spool, backend) if file_type == PDF_MIME else \
+                (extract_docx_text(spool), 0)
+            cached = {"text": text, "skipped_pages": skipped}
+            llm_cache.store(cache_key, cached, ttl=TEXT_CACHE_TTL)
+    return cached["text"], digest, cached["skipped_pages"]
@@ -0,0 +1,265 @@
+# semantic_cache.py
+"""
+Similarity cache in front of the exact-key LLM cache. Missing-skill sets and career goals are
+canonicalized and embedded as hashed TF-IDF vectors; a lookup returns the cached result of
+the nearest stored request when the cosine similarity clears a threshold, so "ReactJS, AWS"
+reuses the roadmap for "Amazon Web Services, React" and "Sr. Data Scientist" reuses the
+projects for "Data Scientist".
+
+Vectors live in a fixed-size NumPy matrix per index with least-recently-used eviction; the
+results themselves stay in llm_cache, so expiry and persistence work as before.
+"""
+import os
+import re
+import math
+import time
+import zlib
+import threading
+import numpy as np
+import llm_cache
+import metrics
+from skill_extractor import canonicalize_skill, canonicalize_skills
+
+SEMANTIC_CACHE_ENABLED = os.getenv("SKILLMENTOR_SEMANTIC_CACHE", "1").lower() in ("1", "true", "yes")
+SKILLS_THRESHOLD = float(os.getenv("SKILLMENTOR_SEMANTIC_SKILLS_THRESHOLD", 0.7))
+GOAL_THRESHOLD = float(os.getenv("SKILLMENTOR_SEMANTIC_GOAL_THRESHOLD", 0.85))
+INDEX_CAPACITY = int(os.getenv("SKILLMENTOR_SEMANTIC_CAPACITY", 2000))
+DIMENSIONS = 2048
+CANDIDATES = 5  # nearest neighbours checked before giving up
+
+# Seniority and filler words that do not change which projects suit a goal
+_GOAL_STOPWORDS = {"senior", "junior", "sr", "jr", "lead", "principal", "entry", "level", "associate", "intern",
+                   "a", "an", "the", "of", "and", "in", "for"}
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+
+
+# -----------------------------
+# Featurization
+# -----------------------------
+def _bucket(feature):
+    return zlib.crc32(feature.encode("utf-8")) % DIMENSIONS
+
+
+def skill_features(skills):
+    """
+    One feature per canonical skill plus half-weighted words, so unknown skills that are
+    worded slightly differently still overlap. A subset of a stored set scores lower the
+    smaller it is, which is why roadmap hits are also checked for coverage.
+    """
+    features = {}
+    for skill in canonicalize_skills(skills):
+        key = skill.lower()
+        features[f"s:{key}"] = features.get(f"s:{key}", 0) + 1.0
+        for word in _WORD_RE.findall(key):
+            features[f"w:{word}"] = features.get(f"w:{word}", 0) + 0.5
+    return features
+
+
+def goal_features(goal):
+    """
+    Word unigrams and character trigrams of the normalized goal.
+    """
+    # "Front-end" and "Frontend" should be the same word
+    words = [w for w in _WORD_RE.findall(str(goal).lower().replace("-", "")) if w not in _GOAL_STOPWORDS]
+    features = {}
+    for word in words:
+        features[f"w:{word}"] = features.get(f"w:{word}", 0) + 1.0
+        padded = f"#{word}#"
+        for i in range(len(padded) - 2):
+            gram = f"c:{padded[i:i + 3]}"
+            features[gram] = features.get(gram, 0) + 0.5
+    return features
+
+
+class Vectorizer:
+    """
+    Hashed TF-IDF. Document frequencies come from a fixed reference corpus (the curated
+    goals, interests and skills), so vectors never change once stored.
+    """
+
+    def __init__(self, featurize, reference_documents):
+        self.featurize = featurize
+        df = np.zeros(DIMENSIONS, dtype=np.float32)
+        for document in reference_documents:
+            for bucket in {_bucket(f) for f in featurize(document)}:
+                df[bucket] += 1
+        n = len(reference_documents)
+        self.idf = np.log((1 + n) / (1 + df)).astype(np.float32) + 1.0
+
+    def embed(self, document):
+        vector = np.zeros(DIMENSIONS, dtype=np.float32)
+        for feature, tf in self.featurize(document).items():
+            vector[_bucket(feature)] += 1.0 + math.log(tf) if tf >= 1 else tf
+        vector *= self.idf
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else None
+
+
+# -----------------------------
+# Nearest-neighbour Index
+# -----------------------------
+class SemanticIndex:
+    """
+    Brute-force cosine index over a NumPy matrix that grows up to capacity rows. Each row
+    maps to an llm_cache key plus metadata; when full, the least recently used row is
+    overwritten.
+    """
+
+    def __init__(self, name, vectorizer, threshold, capacity=INDEX_CAPACITY):
+        self.name = name
+        self.vectorizer = vectorizer
+        self.threshold = threshold
+        self.capacity = capacity
+        initial = min(64, capacity)
+        self._matrix = np.zeros((initial, DIMENSIONS), dtype=np.float32)
+        self._last_used = np.full(initial, -np.inf)
+        self._entries = [None] * initial   # (cache_key, meta)
+        self._rows = {}                    # cache_key -> row
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._rows)
+
+    def _grow(self):
+        extra = min(len(self._entries), self.capacity - len(self._entries))
+        self._matrix = np.vstack([self._matrix, np.zeros((extra, DIMENSIONS), dtype=np.float32)])
+        self._last_used = np.concatenate([self._last_used, np.full(extra, -np.inf)])
+        self._entries.extend([None] * extra)
+
+    def add(self, document, cache_key, meta=None):
+        vector = self.vectorizer.embed(document)
+        if vector is None:
+            return
+        with self._lock:
+            row = self._rows.get(cache_key)
+            if row is None:
+                if len(self._rows) == len(self._entries) and len(self._entries) < self.capacity:
+                    self._grow()
+                row = int(np.argmin(self._last_used))
+                if self._entries[row] is not None:
+                    del self._rows[self._entries[row][0]]
+                self._rows[cache_key] = row
+            self._matrix[row] = vector
+            self._entries[row] = (cache_key, meta)
+            self._last_used[row] = time.monotonic()
+
+    def query(self, document, accept=None):
+        """
+        Return [(cache_key, meta, similarity)] for up to CANDIDATES rows above the threshold,
+        most similar first, optionally filtered by accept(meta).
+        """
+        vector = self.vectorizer.embed(document)
+        if vector is None or not self._rows:
+            return []
+        with self._lock:
+            scores = self._matrix @ vector
+            top = np.argsort(-scores)[:CANDIDATES]
+            matches = []
+            for row in top:
+                entry = self._entries[row]
+                if entry is None or scores[row] < self.threshold:
+                    break
+                if accept is None or accept(entry[1]):
+                    matches.append((entry[0], entry[1], float(scores[row])))
+                    self._last_used[row] = time.monotonic()
+            return matches
+
+    def discard(self, cache_key):
+        with self._lock:
+            row = self._rows.pop(cache_key, None)
+            if row is not None:
+                self._matrix[row] = 0
+                self._entries[row] = None
+                self._last_used[row] = -np.inf
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def _reference_corpus():
+    from required_skills import load_table, CAREER_GOALS, INTERESTS
+    table = load_table()
+    skill_sets = list(table.get("goals", {}).values()) + list(table.get("interests", {}).values())
+    goals = list(CAREER_GOALS) + list(INTERESTS) + list(table.get("goals", {}))
+    return skill_sets, goals
+
+
+def get_index(name):
+    """
+    The process-wide "roadmap" (skill sets) or "projects" (career goals) index.
+    """
+    index = _indexes.get(name)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(name)
+            if index is None:
+                skill_sets, goals = _reference_corpus()
+                if name == "roadmap":
+                    index = SemanticIndex(name, Vectorizer(skill_features, skill_sets), SKILLS_THRESHOLD)
+                else:
+                    index = SemanticIndex(name, Vectorizer(goal_features, goals), GOAL_THRESHOLD)
+                _indexes[name] = index
+    return index
+
+
+def _cached(index, matches, select=lambda value, meta: value):
+    for cache_key, meta, _ in matches:
+        value = llm_cache.lookup(cache_key)
+        if value is None:
+            index.discard(cache_key)  # expired or evicted from the exact cache
+            continue
+        value = select(value, meta)
+        if value is not None:
+            metrics.inc("semantic_cache_requests_total", index=index.name, result="hit")
+            return value
+    metrics.inc("semantic_cache_requests_total", index=index.name, result="miss")
+    return None
+
+
+# -----------------------------
+# Roadmaps
+# -----------------------------
+def lookup_roadmap(missing_skills):
+    """
+    Roadmap for a similar missing-skill set whose entries cover every requested skill,
+    trimmed to the requested skills. None on a miss.
+    """
+    if not SEMANTIC_CACHE_ENABLED or not missing_skills:
+        return None
+    wanted = {s.lower() for s in canonicalize_skills(missing_skills)}
+
+    def select(roadmap, meta):
+        if set(meta) == wanted:
+            return roadmap
+        items = [item for item in roadmap if isinstance(item, dict)
+                 and canonicalize_skill(item.get("skill", "")).lower() in wanted]
+        covered = {canonicalize_skill(item.get("skill", "")).lower() for item in items}
+        return items if covered == wanted else None
+
+    index = get_index("roadmap")
+    matches = index.query(missing_skills, accept=lambda meta: wanted <= set(meta))
+    return _cached(index, matches, select)
+
+
+def remember_roadmap(missing_skills, cache_key):
+    if SEMANTIC_CACHE_ENABLED and missing_skills:
+        get_index("roadmap").add(missing_skills, cache_key, [s.lower() for s in canonicalize_skills(missing_skills)])
+
+
+# -----------------------------
+# Projects
+# -----------------------------
+def lookup_projects(career_goal):
+    """
+    Project list for a similar career goal, or None on a miss.
+    """
+    if not SEMANTIC_CACHE_ENABLED or not career_goal:
+        return None
+    index = get_index("projects")
+    return _cached(index, index.query(career_goal))
+
+
+def remember_projects(career_goal, cache_key):
+    if SEMANTIC_CACHE_ENABLED and career_goal:
+        get_index("projects").add(career_goal, cache_key, career_goal)
@@ -0,0 +1,235 @@
+# session_store.py
+"""
+Keeps large per-session values (resume text, analysis result, roadmap, projects) out of
+st.session_state. Values are stored once by content hash in a byte-bounded LRU memory tier
+over a SQLite file, and the session only holds a small Handle:
+
+    st.session_state["roadmap"] = session_store.offload(roadmap)
+    roadmap = session_store.resolve(st.session_state["roadmap"])
+
+Identical values from different sessions (the same resume, a popular roadmap) are stored
+once. track() keeps per-session memory accounting; sessions idle for longer than
+SKILLMENTOR_SESSION_IDLE seconds have their uploads released and their values dropped from
+the memory tier (they stay on disk and are reloaded on the next access).
+"""
+import os
+import sys
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict, namedtuple
+import metrics
+from llm_cache import CACHE_DIR, SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+STORE_DB_PATH = os.getenv("SKILLMENTOR_SESSION_STORE", os.path.join(CACHE_DIR, "session_store.sqlite3"))
+MEMORY_MAX_BYTES = int(os.getenv("SKILLMENTOR_SESSION_MEMORY_MB", 64)) * 1024 * 1024
+STORE_TTL_SECONDS = int(os.getenv("SKILLMENTOR_SESSION_STORE_TTL", 7 * 24 * 3600))
+DISK_MAX_ENTRIES = int(os.getenv("SKILLMENTOR_SESSION_STORE_ENTRIES", 50000))
+IDLE_SECONDS = int(os.getenv("SKILLMENTOR_SESSION_IDLE", 1800))
+EVICTION_INTERVAL = 60  # seconds between idle-session sweeps
+
+Handle = namedtuple("Handle", "digest size")
+
+
+# -----------------------------
+# Content-addressed Store
+# -----------------------------
+class BlobStore:
+    """
+    JSON values by SHA-256 digest. The memory tier is an LRU bounded by total payload
+    bytes rather than entry count, since resumes vary from a few KB to several hundred.
+    """
+
+    def __init__(self, max_bytes=MEMORY_MAX_BYTES, disk=None):
+        self.max_bytes = max_bytes
+        self.disk = disk
+        self._memory = OrderedDict()   # digest -> payload
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def memory_bytes(self):
+        return self._bytes
+
+    def __len__(self):
+        return len(self._memory)
+
+    def _remember(self, digest, payload):
+        with self._lock:
+            if digest in self._memory:
+                self._memory.move_to_end(digest)
+                return
+            self._memory[digest] = payload
+            self._bytes += len(payload)
+            while self._bytes > self.max_bytes and len(self._memory) > 1:
+                _, evicted = self._memory.popitem(last=False)
+                self._bytes -= len(evicted)
+                metrics.inc("session_store_evictions_total", reason="memory")
+
+    def put(self, value):
+        payload = json.dumps(value, ensure_ascii=False, sort_keys=True)
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        if digest not in self._memory and self.disk is not None:
+            self.disk.set(digest, payload, time.time() + STORE_TTL_SECONDS)
+        self._remember(digest, payload)
+        return Handle(digest, len(payload))
+
+    def get(self, handle):
+        with self._lock:
+            payload = self._memory.get(handle.digest)
+            if payload is not None:
+                self._memory.move_to_end(handle.digest)
+        if payload is None and self.disk is not None:
+            row = self.disk.get(handle.digest)
+            if row is not None:
+                payload = row[0]
+                self._remember(handle.digest, payload)
+        metrics.inc("session_store_requests_total", result="miss" if payload is None else "hit")
+        return json.loads(payload) if payload is not None else None
+
+    def release(self, digests):
+        """
+        Drop digests from the memory tier only; the disk copy stays.
+        """
+        freed = 0
+        with self._lock:
+            for digest in digests:
+                payload = self._memory.pop(digest, None)
+                if payload is not None:
+                    self._bytes -= len(payload)
+                    freed += len(payload)
+        return freed
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """
+    Return the process-wide store. Without a writable SQLite file values live in memory
+    only, and ones evicted from it are gone (resolve() then returns None).
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                try:
+                    disk = SQLiteCache(STORE_DB_PATH, max_entries=DISK_MAX_ENTRIES)
+                except (sqlite3.Error, OSError):
+                    disk = None
+                _store = BlobStore(disk=disk)
+    return _store
+
+
+def offload(value):
+    """
+    Store value and return its Handle; None stays None.
+    """
+    return None if value is None else get_store().put(value)
+
+
+def resolve(value):
+    """
+    The stored value for a Handle; anything else (including values put into the session
+    before they were offloaded) is returned unchanged.
+    """
+    return get_store().get(value) if isinstance(value, Handle) else value
+
+
+# -----------------------------
+# Session Accounting
+# -----------------------------
+_sessions = {}   # session_id -> {"last_active", "state_bytes", "offloaded_bytes", "handles"}
+_sessions_lock = threading.Lock()
+_last_sweep = 0.0
+
+
+def value_size(value):
+    """
+    Approximate bytes held by one session_state value.
+    """
+    if isinstance(value, Handle):
+        return 0
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    if hasattr(value, "size") and isinstance(value.size, int):
+        return value.size  # st.file_uploader's UploadedFile
+    if isinstance(value, (dict, list, tuple)):
+        try:
+            return len(json.dumps(value, default=str))
+        except (TypeError, ValueError):
+            pass
+    return sys.getsizeof(value)
+
+
+def track(session_id, state):
+    """
+    Record the memory held by one session (its session_state, and the values it references
+    in the store) and mark it active. Idle sessions are swept every EVICTION_INTERVAL.
+    """
+    global _last_sweep
+    items = list(state.items())
+    handles = {v.digest: v.size for _, v in items if isinstance(v, Handle)}
+    usage = {"last_active": time.time(),
+             "state_bytes": sum(value_size(v) for _, v in items),
+             "offloaded_bytes": sum(handles.values()),
+             "handles": set(handles)}
+    with _sessions_lock:
+        _sessions[session_id] = usage
+        sweep = usage["last_active"] - _last_sweep >= EVICTION_INTERVAL
+        if sweep:
+            _last_sweep = usage["last_active"]
+    if sweep:
+        evict_idle()
+
+
+def _release_uploads(session_id):
+    try:
+        from streamlit import runtime
+        if runtime.exists():
+            runtime.get_instance().uploaded_file_mgr.remove_session_files(session_id)
+    except Exception:
+        logger.exception("could not release uploads of session %s", session_id)
+
+
+def evict_idle(idle_seconds=IDLE_SECONDS, now=None):
+    """
+    Release sessions inactive for idle_seconds: drop their uploaded files and remove the
+    values only they reference from the memory tier. Returns the number of sessions released.
+    """
+    now = time.time() if now is None else now
+    with _sessions_lock:
+        idle = {sid: u for sid, u in _sessions.items() if now - u["last_active"] >= idle_seconds}
+        for sid in idle:
+            del _sessions[sid]
+        in_use = set().union(*(u["handles"] for u in _sessions.values()))
+    freed = get_store().release(set().union(*(u["handles"] for u in idle.values())) - in_use) if idle else 0
+    for sid in idle:
+        _release_uploads(sid)
+    if idle:
+        metrics.inc("session_store_evictions_total", len(idle), reason="idle")
+        metrics.log_event("sessions_evicted", sessions=len(idle), freed_bytes=freed)
+    return len(idle)
+
+
+def usage():
+    """
+    Per-session and total memory accounting for the admin panel.
+    """
+    now = time.time()
+    with _sessions_lock:
+        sessions = [{"session": sid[:8], "idle_s": round(now - u["last_active"]),
+                     "state_kb": round(u["state_bytes"] / 1024, 1),
+                     "offloaded_kb": round(u["offloaded_bytes"] / 1024, 1)}
+                    for sid, u in _sessions.items()]
+    store = get_store()
+    return {"sessions": sorted(sessions, key=lambda s: -s["state_kb"]),
+            "session_bytes": sum(s["state_kb"] for s in sessions) * 1024,
+            "store_memory_bytes": store.memory_bytes,
+            "store_entries": len(store)}
@@ -0,0 +1,316 @@
+# skill_extractor.py
+from collections import deque
+
+# -----------------------------
+# Skill Taxonomy
+# -----------------------------
+# Canonical skill name -> aliases. The canonical name is always matched as well.
+# Aliases listed in CASE_SENSITIVE_ALIASES only match with the exact casing shown, and those
+# in LIST_CONTEXT_ALIASES only inside a list. Bump TAXONOMY_VERSION whenever the taxonomy or
+# the matching rules change, so cached extraction results are recomputed.
+TAXONOMY_VERSION = 3
+SKILL_TAXONOMY = {
+    # Languages
+    "Python": ["Python3", "Python 3"],
+    "Java": ["Core Java", "Java 8", "Java 11", "Java 17", "J2EE", "Java EE"],
+    "JavaScript": ["JS", "ES6", "ECMAScript", "Javascript"],
+    "TypeScript": ["TS"],
+    "C": [],
+    "C++": ["CPP"],
+    "C#": ["C Sharp", "CSharp"],
+    "Golang": ["Go", "Go lang", "Go programming"],
+    "Kotlin": [],
+    "Swift": [],
+    "Dart": [],
+    "R": ["RStudio", "R programming"],
+    "SQL": ["Structured Query Language", "PL/SQL", "T-SQL"],
+    "Bash": ["Shell Scripting", "Shell Script"],
+    # Web
+    "HTML": ["HTML5"],
+    "CSS": ["CSS3"],
+    "React": ["ReactJS", "React.js", "React JS"],
+    "Angular": ["AngularJS", "Angular.js"],
+    "Vue.js": ["Vue", "VueJS"],
+    "Next.js": ["NextJS"],
+    "Redux": [],
+    "Node.js": ["NodeJS", "Node JS"],
+    "Express.js": ["ExpressJS", "Express JS"],
+    "Bootstrap": [],
+    "Tailwind CSS": ["Tailwind", "TailwindCSS"],
+    "REST APIs": ["REST API", "RESTful", "RESTful APIs", "REST"],
+    "GraphQL": [],
+    "Spring Boot": ["Spring Framework", "Spring MVC", "SpringBoot"],
+    "Hibernate": ["JPA"],
+    "Servlets": ["JSP", "Servlet"],
+    "Maven": [],
+    "JUnit": [],
+    "Django": [],
+    "Flask": [],
+    "FastAPI": [],
+    "MERN Stack": ["MERN"],
+    # Databases
+    "MySQL": [],
+    "PostgreSQL": ["Postgres"],
+    "MongoDB": ["Mongo"],
+    "Oracle Database": ["Oracle DB", "Oracle"],
+    "Redis": [],
+    "Firebase": [],
+    # Data & AI
+    "Pandas": [],
+    "NumPy": ["Numpy"],
+    "Scikit-learn": ["sklearn", "scikit learn"],
+    "TensorFlow": ["Tensorflow"],
+    "Keras": [],
+    "PyTorch": ["Pytorch"],
+    "Machine Learning": ["ML"],
+    "Deep Learning": ["DL", "Neural Networks"],
+    "Natural Language Processing": ["NLP"],
+    "Computer Vision": ["OpenCV"],
+    "Generative AI": ["GenAI", "LLMs", "LLM", "Large Language Models"],
+    "LangChain": [],
+    "Statistics": ["Statistical Analysis"],
+    "Data Analysis": ["Data Analytics"],
+    "Data Visualization": ["Data Visualisation", "Matplotlib", "Seaborn", "Plotly"],
+    "Tableau": [],
+    "Power BI": ["PowerBI"],
+    "Excel": ["MS Excel", "Microsoft Excel"],
+    "Apache Spark": ["Spark", "PySpark"],
+    "Hadoop": [],
+    "Apache Kafka": ["Kafka"],
+    "Apache Airflow": ["Airflow"],
+    "ETL": ["ELT", "Data Pipelines"],
+    "Data Warehousing": ["Data Warehouse"],
+    "Snowflake": [],
+    "dbt": [],
+    # Cloud & DevOps
+    "AWS": ["Amazon Web Services", "EC2", "S3", "AWS Lambda"],
+    "Azure": ["Microsoft Azure"],
+    "GCP": ["Google Cloud", "Google Cloud Platform"],
+    "Docker": ["Containerization"],
+    "Kubernetes": ["K8s"],
+    "Terraform": ["Infrastructure as Code", "IaC"],
+    "Ansible": [],
+    "CI/CD": ["CI CD", "Continuous Integration", "Continuous Deployment", "GitHub Actions"],
+    "Jenkins": [],
+    "Git": [],
+    "GitHub": [],
+    "Linux": ["Unix", "Ubuntu"],
+    "Microservices": ["Microservice"],
+    "Serverless": [],
+    "Cloud Security": [],
+    "Networking": ["Computer Networks", "TCP/IP", "DNS"],
+    "Monitoring": ["Prometheus", "Grafana"],
+    # Security
+    "Cybersecurity": ["Cyber Security", "Information Security", "InfoSec"],
+    "Penetration Testing": ["Pentesting", "Pen Testing"],
+    "Ethical Hacking": [],
+    "Network Security": ["Firewalls", "Firewall"],
+    "SIEM": ["Splunk"],
+    "Incident Response": [],
+    "Cryptography": ["Encryption"],
+    "Vulnerability Assessment": ["VAPT"],
+    "Wireshark": [],
+    "Nmap": [],
+    "Burp Suite": [],
+    "Identity and Access Management": ["IAM"],
+    "OWASP": ["OWASP Top 10"],
+    # Mobile
+    "Android": ["Android Studio"],
+    "iOS": [],
+    "Flutter": [],
+    "React Native": [],
+    "Jetpack Compose": [],
+    "SwiftUI": [],
+    # Design
+    "Figma": [],
+    "Adobe XD": [],
+    "UI Design": ["User Interface Design"],
+    "UX Research": ["User Research", "Usability Testing"],
+    "Wireframing": ["Wireframes"],
+    "Prototyping": ["Prototypes"],
+    "Design Systems": [],
+    "Responsive Design": [],
+    # Games
+    "Unity": [],
+    "Unreal Engine": ["Unreal"],
+    # Fundamentals & practices
+    "Data Structures and Algorithms": ["DSA", "Data Structures"],
+    "Object-Oriented Programming": ["OOP", "OOPS", "Object Oriented Programming"],
+    "System Design": [],
+    "Design Patterns": [],
+    "Unit Testing": ["Test-Driven Development", "TDD"],
+    "Selenium": [],
+    "Agile": ["Scrum", "Kanban"],
+    "Cloud Architecture": ["Solution Architecture", "Well-Architected Framework"],
+}
+
+# Short or ambiguous tokens that only count when written with this exact casing
+CASE_SENSITIVE_ALIASES = {"C", "R", "JS", "TS", "ML", "DL", "DNS", "IAM", "IaC", "ELT", "ETL",
+                          "REST", "LLM", "LLMs", "S3", "EC2", "DSA", "OOP", "OOPS", "TDD",
+                          "Unity", "Swift", "Dart", "Vue", "Mongo", "Oracle", "Spark", "Unreal",
+                          "Go", "Excel", "Networking", "Agile", "React"}
+# Letters and ordinary words ("Grade C", "John R. Smith", "let's go", "professional
+# networking"): they only count between list separators, e.g. "Languages: C, Go" or "Python / R"
+LIST_CONTEXT_ALIASES = {"C", "R", "Go", "Networking"}
+_LIST_BEFORE = ",;/|(•·●▪*\n"
+_LIST_AFTER = ",;/|).•·●▪\n"
+# After a label only a list that continues counts: "Languages: C, C++" but not "Grade: C"
+_LIST_AFTER_LABEL = ",;/|"
+
+
+# -----------------------------
+# Aho-Corasick Index
+# -----------------------------
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over every alias in a taxonomy, so a resume is scanned once
+    regardless of how many skills are known. Matches must sit on word boundaries, and
+    overlapping matches resolve to the longest (e.g. "C++" wins over "C").
+    """
+
+    def __init__(self, taxonomy=SKILL_TAXONOMY, case_sensitive=CASE_SENSITIVE_ALIASES,
+                 list_context=LIST_CONTEXT_ALIASES):
+        self.list_context = set(list_context)
+        self.canonical = {}
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        for skill, aliases in taxonomy.items():
+            for alias in [skill] + list(aliases):
+                self.canonical[alias.lower()] = skill
+                self._add(alias, alias in case_sensitive)
+        self._build_failure_links()
+
+    def _add(self, alias, exact_case):
+        node = 0
+        for ch in alias.lower():
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((alias, exact_case))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text):
+        """
+        Return canonical skills found in text, in order of first appearance.
+        """
+        # Collapse whitespace but keep line breaks for list context; aliases still match
+        # across them since the automaton sees them as spaces
+        text = "\n".join(" ".join(line.split()) for line in text.splitlines())
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # A few characters lowercase to several; keep offsets aligned with the original
+            lowered = "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+        lowered = lowered.replace("\n", " ")
+        candidates = []
+        node = 0
+        for end, ch in enumerate(lowered):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for alias, exact_case in self._out[node]:
+                start = end - len(alias) + 1
+                if exact_case and text[start:end + 1] != alias:
+                    continue
+                if start > 0 and (lowered[start - 1].isalnum() or lowered[start - 1] == "&"):
+                    continue
+                if end + 1 < len(lowered) and (lowered[end + 1].isalnum() or lowered[end + 1] in "+#&"):
+                    continue
+                if alias in self.list_context and not self._in_list(text, start, end + 1):
+                    continue
+                candidates.append((start, end + 1, alias))
+
+        # Keep the longest match at each position, then drop anything overlapping an earlier match
+        candidates.sort(key=lambda m: (m[0], -(m[1] - m[0])))
+        found, seen, covered_until = [], set(), 0
+        for start, end, alias in candidates:
+            if start < covered_until:
+                continue
+            covered_until = end
+            skill = self.canonical[alias.lower()]
+            if skill not in seen:
+                seen.add(skill)
+                found.append(skill)
+        return found
+
+    @staticmethod
+    def _in_list(text, start, end):
+        before = text[:start].rstrip(" ")[-1:]
+        after = text[end:].lstrip(" ")[:1]
+        if before == ":":
+            return after != "" and after in _LIST_AFTER_LABEL
+        return (not before or before in _LIST_BEFORE) and (not after or after in _LIST_AFTER)
+
+
+_matcher = None
+
+
+def get_matcher():
+    global _matcher
+    if _matcher is None:
+        _matcher = SkillMatcher()
+    return _matcher
+
+
+# -----------------------------
+# Public API
+# -----------------------------
+def canonicalize_skill(name):
+    """
+    Map a skill name or alias to its canonical taxonomy name; unknown skills are returned
+    stripped but otherwise unchanged.
+    """
+    name = " ".join(str(name).split())
+    return get_matcher().canonical.get(name.lower(), name)
+
+
+def canonicalize_skills(names):
+    """
+    Canonicalize a list of skills, dropping case-insensitive duplicates but keeping order.
+    """
+    result, seen = [], set()
+    for name in names or []:
+        skill = canonicalize_skill(name)
+        if skill and skill.lower() not in seen:
+            seen.add(skill.lower())
+            result.append(skill)
+    return result
+
+
+def extract_skills(text):
+    """
+    Extract canonical skills from resume text using the local taxonomy.
+    """
+    if not text:
+        return []
+    return get_matcher().find(text)
+
+
+def compute_skill_match(extracted_skills, required_skills):
+    """
+    Compute match/gap percentages and missing skills exactly, comparing canonical names.
+    Percentages are whole numbers that always add up to 100 (or are both 0 when nothing is required).
+    """
+    have = {s.lower() for s in canonicalize_skills(extracted_skills)}
+    required = canonicalize_skills(required_skills)
+    missing = [s for s in required if s.lower() not in have]
+    if not required:
+        return {"skill_match_percentage": 0, "skill_gap_percentage": 0, "missing_skills": []}
+    match = round(100 * (len(required) - len(missing)) / len(required))
+    return {"skill_match_percentage": match, "skill_gap_percentage": 100 - match, "missing_skills": missing}
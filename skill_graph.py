@@ -0,0 +1,144 @@
+# skill_graph.py
+"""
+Prerequisite graph over canonical skill names (see skill_extractor.SKILL_TAXONOMY), used to
+put roadmap entries in a sensible learning order without asking GPT for one.
+"""
+from graphlib import TopologicalSorter, CycleError
+from skill_extractor import canonicalize_skill
+
+# skill -> skills that should be learned before it
+PREREQUISITES = {
+    # Programming foundations
+    "Object-Oriented Programming": ["Java"],
+    "Data Structures and Algorithms": ["Python"],
+    "Design Patterns": ["Object-Oriented Programming"],
+    "Unit Testing": ["Git"],
+    "JUnit": ["Java"],
+    "Maven": ["Java"],
+    "Servlets": ["Java"],
+    "Hibernate": ["Java", "SQL"],
+    "Spring Boot": ["Java", "Object-Oriented Programming", "Maven"],
+    "Microservices": ["REST APIs", "Docker"],
+    "System Design": ["Data Structures and Algorithms", "Microservices"],
+    # Web
+    "JavaScript": ["HTML", "CSS"],
+    "Responsive Design": ["CSS"],
+    "Bootstrap": ["CSS"],
+    "Tailwind CSS": ["CSS"],
+    "TypeScript": ["JavaScript"],
+    "React": ["JavaScript"],
+    "Redux": ["React"],
+    "Next.js": ["React", "Node.js"],
+    "Angular": ["TypeScript"],
+    "Vue.js": ["JavaScript"],
+    "Node.js": ["JavaScript"],
+    "Express.js": ["Node.js"],
+    "GraphQL": ["REST APIs"],
+    "MERN Stack": ["MongoDB", "Express.js", "React", "Node.js"],
+    "Django": ["Python", "SQL"],
+    "Flask": ["Python"],
+    "FastAPI": ["Python", "REST APIs"],
+    "Selenium": ["Python"],
+    # Data
+    "MySQL": ["SQL"],
+    "PostgreSQL": ["SQL"],
+    "Oracle Database": ["SQL"],
+    "Snowflake": ["SQL"],
+    "dbt": ["SQL"],
+    "Data Warehousing": ["SQL"],
+    "ETL": ["SQL", "Python"],
+    "Apache Airflow": ["Python", "ETL"],
+    "Apache Spark": ["Python", "SQL"],
+    "Apache Kafka": ["Linux"],
+    "Hadoop": ["Linux", "Java"],
+    "NumPy": ["Python"],
+    "Pandas": ["Python", "NumPy"],
+    "Data Analysis": ["Pandas", "Statistics"],
+    "Data Visualization": ["Data Analysis"],
+    "Tableau": ["Data Visualization"],
+    "Power BI": ["Data Visualization"],
+    "Machine Learning": ["Python", "Statistics", "Pandas"],
+    "Scikit-learn": ["Machine Learning"],
+    "Deep Learning": ["Machine Learning"],
+    "TensorFlow": ["Deep Learning"],
+    "Keras": ["Deep Learning"],
+    "PyTorch": ["Deep Learning"],
+    "Computer Vision": ["Deep Learning"],
+    "Natural Language Processing": ["Machine Learning"],
+    "Generative AI": ["Deep Learning"],
+    "LangChain": ["Python", "Generative AI"],
+    # Cloud & DevOps
+    "Bash": ["Linux"],
+    "GitHub": ["Git"],
+    "Docker": ["Linux"],
+    "Kubernetes": ["Docker"],
+    "CI/CD": ["Git", "Docker"],
+    "Jenkins": ["CI/CD"],
+    "Ansible": ["Linux"],
+    "Terraform": ["AWS"],
+    "Serverless": ["AWS"],
+    "Cloud Architecture": ["AWS", "Networking"],
+    "Monitoring": ["Linux"],
+    "AWS": ["Linux", "Networking"],
+    "Azure": ["Networking"],
+    "GCP": ["Networking"],
+    # Security
+    "Network Security": ["Networking"],
+    "Wireshark": ["Networking"],
+    "Nmap": ["Networking"],
+    "Cryptography": ["Networking"],
+    "Vulnerability Assessment": ["Network Security"],
+    "Penetration Testing": ["Vulnerability Assessment", "Linux"],
+    "Ethical Hacking": ["Networking", "Linux"],
+    "OWASP": ["REST APIs"],
+    "Burp Suite": ["OWASP"],
+    "SIEM": ["Network Security"],
+    "Incident Response": ["SIEM"],
+    "Cloud Security": ["Cloud Architecture", "Identity and Access Management"],
+    # Mobile
+    "Kotlin": ["Java"],
+    "Android": ["Kotlin"],
+    "Jetpack Compose": ["Android"],
+    "iOS": ["Swift"],
+    "SwiftUI": ["Swift"],
+    "Flutter": ["Dart"],
+    "React Native": ["React"],
+    # Design
+    "Wireframing": ["UX Research"],
+    "Prototyping": ["Wireframing"],
+    "UI Design": ["Wireframing"],
+    "Design Systems": ["UI Design", "Figma"],
+}
+
+
+def _ancestors(skill, seen=None):
+    seen = set() if seen is None else seen
+    for prerequisite in PREREQUISITES.get(skill, []):
+        if prerequisite not in seen:
+            seen.add(prerequisite)
+            _ancestors(prerequisite, seen)
+    return seen
+
+
+def order_skills(skills):
+    """
+    Return skills in learning order: every skill comes after the requested skills it
+    (transitively) depends on; otherwise the input order is kept. Names are matched via the
+    taxonomy but returned as given.
+    """
+    skills = list(skills)
+    canonical = [canonicalize_skill(s) for s in skills]
+    position = {name: i for i, name in reversed(list(enumerate(canonical)))}
+    sorter = TopologicalSorter()
+    for name in canonical:
+        sorter.add(name, *(a for a in _ancestors(name) if a in position and a != name))
+    try:
+        sorter.prepare()
+    except CycleError:
+        return skills
+    ordered = []
+    while sorter.is_active():
+        ready = sorted(sorter.get_ready(), key=position.get)
+        ordered.extend(ready)
+        sorter.done(*ready)
+    return [skills[position[name]] for name in ordered]
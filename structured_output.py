@@ -0,0 +1,313 @@
+# structured_output.py
+import re
+import json
+import threading
+from collections import defaultdict
+import metrics
+
+# -----------------------------
+# Output Schemas
+# -----------------------------
+# A deliberately small JSON-schema subset: type, items, required, properties.
+SCHEMAS = {
+    "roadmap": {"type": "array", "items": {"type": "object",
+                                           "required": ["skill", "recommended_course", "platform", "estimated_duration"]}},
+    "projects": {"type": "array", "items": {"type": "object",
+                                            "required": ["project_name", "description", "estimated_duration"]}},
+    "skill_list": {"type": "array", "items": {"type": "string"}},
+    "recommendations": {"type": "array", "items": {"type": "string"}},
+    "requirements": {"type": "object", "required": ["required_skills", "recommendations"],
+                     "properties": {"required_skills": {"type": "array", "items": {"type": "string"}},
+                                    "recommendations": {"type": "array", "items": {"type": "string"}}}},
+}
+
+_FENCE_RE = re.compile(r"```(?:json)?", re.IGNORECASE)
+_LITERALS = {"True": "true", "False": "false", "None": "null", "true": "true", "false": "false", "null": "null"}
+_CLOSING_QUOTES = {'"': '"', "'": "'", "“": "”", "”": "”"}
+
+_stats = defaultdict(lambda: {"attempts": 0, "ok": 0, "repaired": 0, "failed": 0})
+_stats_lock = threading.Lock()
+
+
+# -----------------------------
+# Tolerant JSON Parsing
+# -----------------------------
+def _strip_trailing_comma(out):
+    i = len(out) - 1
+    while i >= 0 and out[i].isspace():
+        i -= 1
+    if i >= 0 and out[i] == ",":
+        del out[i]
+
+
+def _drop_dangling_key(out):
+    """
+    Remove an object key left without a value by truncation ('"platform":' or '"plat').
+    """
+    i = len(out) - 1
+    while i >= 0 and out[i].isspace():
+        i -= 1
+    if i >= 0 and out[i] == ":":
+        i -= 1
+        while i >= 0 and out[i].isspace():
+            i -= 1
+    if i < 0 or not out[i].endswith('"'):
+        return
+    j = i
+    if out[i] == '"':
+        # A string copied character by character: find its opening quote
+        j = i - 1
+        while j >= 0 and out[j] != '"':
+            j -= 1
+    k = j - 1
+    while k >= 0 and out[k].isspace():
+        k -= 1
+    if k >= 0 and out[k] in (",", "{"):
+        del out[j:]
+
+
+def repair_json(text, start=0):
+    """
+    Rewrite the JSON value starting at text[start] (a '{' or '[') into strict JSON, stopping
+    at its closing bracket. Repairs single/curly-quoted strings, raw newlines in strings,
+    Python literals, unquoted keys, comments and trailing commas, and closes strings and
+    brackets left open by a truncated response (dropping a key it cut off before its value).
+    """
+    out, stack = [], []
+    in_string, escape = None, False
+    i, n = start, len(text)
+    while i < n:
+        c = text[i]
+        if in_string:
+            if escape:
+                out.append(c)
+                escape = False
+            elif c == "\\":
+                out.append(c)
+                escape = True
+            elif c == in_string:
+                out.append('"')
+                in_string = None
+            elif c == '"':
+                out.append('\\"')
+            elif c == "\n":
+                out.append("\\n")
+            elif c == "\t":
+                out.append("\\t")
+            else:
+                out.append(c)
+            i += 1
+            continue
+
+        if c in _CLOSING_QUOTES:
+            in_string = _CLOSING_QUOTES[c]
+            out.append('"')
+        elif c in "{[":
+            stack.append("}" if c == "{" else "]")
+            out.append(c)
+        elif c in "}]":
+            _strip_trailing_comma(out)
+            if stack and stack[-1] == c:
+                stack.pop()
+            out.append(c)
+            if not stack:
+                break
+        elif c == "/" and text.startswith("//", i):
+            end = text.find("\n", i)
+            i = n if end == -1 else end
+            continue
+        elif c == "/" and text.startswith("/*", i):
+            end = text.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+            continue
+        elif c.isdigit() or (c == "-" and i + 1 < n and text[i + 1].isdigit()):
+            j = i + 1
+            while j < n and (text[j].isdigit() or text[j] in ".eE+-"):
+                j += 1
+            out.append(text[i:j])
+            i = j
+            continue
+        elif c.isalpha() or c == "_":
+            j = i
+            while j < n and (text[j].isalnum() or text[j] in "_-"):
+                j += 1
+            word = text[i:j]
+            if word in _LITERALS:
+                out.append(_LITERALS[word])
+            else:
+                out.append(json.dumps(word))  # unquoted key or bare word
+            i = j
+            continue
+        else:
+            out.append(c)
+        i += 1
+
+    if in_string:
+        out.append('"')
+    while stack:
+        if stack[-1] == "}":
+            _drop_dangling_key(out)
+        _strip_trailing_comma(out)
+        if out and out[-1] in ",:":
+            out.pop()
+        out.append(stack.pop())
+    return "".join(out)
+
+
+def extract_json(text, expect=None):
+    """
+    Return the first JSON object or array in text (fences and surrounding prose ignored),
+    repairing common defects. expect="array"/"object" prefers that kind of value.
+    Raises ValueError if nothing parseable is found. Returns (value, repaired).
+    """
+    cleaned = _FENCE_RE.sub("", text or "").strip()
+    try:
+        return json.loads(cleaned), False
+    except json.JSONDecodeError:
+        pass
+
+    openers = {"array": "[", "object": "{"}
+    positions = [p for p in (cleaned.find("["), cleaned.find("{")) if p != -1]
+    if expect in openers and cleaned.find(openers[expect]) != -1:
+        positions = [cleaned.find(openers[expect])]
+    if not positions:
+        raise ValueError("No JSON object or array found in model output")
+    start = min(positions)
+
+    try:
+        return json.loads(repair_json(cleaned, start)), True
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Unrepairable JSON in model output: {e}") from e
+
+
+# -----------------------------
+# Schema Validation
+# -----------------------------
+def _coerce_string(value):
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return ": ".join(str(v) for v in value.values())
+    return str(value)
+
+
+def validate(value, schema):
+    """
+    Validate value against schema, applying lenient coercions (wrapping a lone object in a
+    list, unwrapping {"items": [...]}, stringifying scalars, dropping invalid array items).
+    Returns (coerced_value, errors).
+    """
+    kind = schema.get("type")
+    if kind == "array":
+        if isinstance(value, dict):
+            lists = [v for v in value.values() if isinstance(v, list)]
+            value = lists[0] if len(lists) == 1 else [value]
+        if not isinstance(value, list):
+            return None, [f"expected array, got {type(value).__name__}"]
+        items_schema = schema.get("items")
+        if not items_schema:
+            return value, []
+        items, errors = [], []
+        for index, item in enumerate(value):
+            coerced, item_errors = validate(item, items_schema)
+            if item_errors:
+                errors.extend(f"[{index}] {e}" for e in item_errors)
+            else:
+                items.append(coerced)
+        if value and not items:
+            return None, errors
+        return items, []
+
+    if kind == "object":
+        if not isinstance(value, dict):
+            return None, [f"expected object, got {type(value).__name__}"]
+        missing = [k for k in schema.get("required", []) if k not in value]
+        if missing:
+            return None, [f"missing keys: {', '.join(missing)}"]
+        value = dict(value)
+        for key, prop_schema in schema.get("properties", {}).items():
+            if key in value:
+                coerced, errors = validate(value[key], prop_schema)
+                if errors:
+                    return None, [f"{key}: {e}" for e in errors]
+                value[key] = coerced
+        return value, []
+
+    if kind == "string":
+        if value is None:
+            return None, ["expected string, got null"]
+        return _coerce_string(value), []
+
+    return value, []
+
+
+# -----------------------------
+# Public API
+# -----------------------------
+def parse_structured(text, schema_name):
+    """
+    Parse and validate a model response for one of the SCHEMAS.
+    Returns (value, error); error is None on success.
+    """
+    schema = SCHEMAS[schema_name]
+    error, repaired, value = None, False, None
+    try:
+        raw, repaired = extract_json(text, expect=schema.get("type"))
+        value, errors = validate(raw, schema)
+        if value is None:
+            error = "; ".join(errors[:5])
+    except ValueError as e:
+        error = str(e)
+
+    with _stats_lock:
+        stats = _stats[schema_name]
+        stats["attempts"] += 1
+        if error:
+            stats["failed"] += 1
+        else:
+            stats["ok"] += 1
+            stats["repaired"] += int(repaired)
+    metrics.inc("parse_total", schema=schema_name, result="failed" if error else "repaired" if repaired else "ok")
+    if error:
+        metrics.log_event("parse_failure", schema=schema_name, error=error)
+    return (None, error) if error else (value, None)
+
+
+def validate_item(item, schema_name):
+    """
+    Validate one element of an array schema, e.g. a roadmap entry parsed from a stream.
+    Returns the coerced item, or None if it does not fit (counted as dropped).
+    """
+    value, errors = validate(item, SCHEMAS[schema_name].get("items", {}))
+    metrics.inc("stream_items_total", schema=schema_name, result="dropped" if errors else "ok")
+    if errors:
+        metrics.log_event("stream_item_dropped", schema=schema_name, error="; ".join(errors[:5]))
+        return None
+    return value
+
+
+def failure_message(items):
+    """
+    The message of the first "Failed ..." item in a roadmap/project list (how those stages
+    report a failed parse or missing entries), or None when the list is a usable result.
+    """
+    for item in items or []:
+        if isinstance(item, dict) and str(item.get("message", "")).startswith("Failed"):
+            return item["message"]
+    return None
+
+
+def loads_tolerant(text):
+    """
+    json.loads with the repairs of extract_json; raises ValueError when it cannot parse.
+    """
+    return extract_json(text)[0]
+
+
+def get_parse_stats():
+    """
+    Per-schema parse counters with the success rate, e.g. {"roadmap": {"attempts": 10, "ok": 9, ...}}.
+    """
+    with _stats_lock:
+        return {name: dict(s, success_rate=round(s["ok"] / s["attempts"], 4) if s["attempts"] else None)
+                for name, s in _stats.items()}
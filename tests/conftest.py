@@ -0,0 +1,49 @@
+# tests/conftest.py
+import os
+import sys
+import tempfile
+
+# Configuration is read at import time: keep caches, job and session stores out of the repo
+os.environ.setdefault("SKILLMENTOR_CACHE_DIR", tempfile.mkdtemp(prefix="skillmentor-tests-"))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+import llm_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(tmp_path, monkeypatch):
+    """
+    Every test gets an empty process-wide LLM cache backed by its own SQLite file.
+    """
+    cache = llm_cache.TieredCache(disk=llm_cache.SQLiteCache(str(tmp_path / "llm_cache.sqlite3")))
+    monkeypatch.setattr(llm_cache, "_cache", cache)
+    monkeypatch.setattr(llm_cache, "CACHE_ENABLED", True)
+    return cache
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """
+    Point llm_client at a fresh fake OpenAI server with empty metrics; yields a function that
+    starts one with FakeConfig settings and returns its config.
+    """
+    import llm_client
+    import metrics
+    from devtools.fake_openai_server import start_server
+    servers = []
+
+    def serve(**config):
+        server, base_url = start_server(**config)
+        servers.append(server)
+        monkeypatch.setattr(llm_client, "OPENAI_BASE_URL", base_url)
+        monkeypatch.setattr(llm_client, "_http_client", None)
+        monkeypatch.setattr(llm_client, "_openai_client", None)
+        monkeypatch.setattr(llm_client, "_models", {})
+        return server.RequestHandlerClass.config
+
+    monkeypatch.setenv("OPENAI_API_KEY", "fake")
+    metrics.reset()
+    yield serve
+    for server in servers:
+        server.shutdown()
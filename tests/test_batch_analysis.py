@@ -0,0 +1,83 @@
+# tests/test_batch_analysis.py
+import json
+import pytest
+import batch_analysis
+from batch_analysis import completed_ids, jobs_from_manifest, run_batch
+
+
+@pytest.fixture
+def analyzed(monkeypatch):
+    """
+    Fake resume extraction and analysis: "bad" resumes fail, "flaky" ones come back degraded.
+    Records the paths analysed.
+    """
+    paths = []
+
+    def extract(path):
+        paths.append(path)
+        if "bad" in path:
+            raise ValueError("unreadable file")
+        return f"resume {path}", f"hash-{path}", 0
+
+    def evaluate(resume_text, interests, career_goal):
+        if "flaky" in resume_text:
+            return {"extracted_skills": ["Python"], "degraded": "recommendations failed: Timeout"}
+        return {"extracted_skills": ["Python"], "missing_skills": []}
+
+    monkeypatch.setattr(batch_analysis, "extract_resume_text", extract)
+    monkeypatch.setattr(batch_analysis, "evaluate_resume_profile", evaluate)
+    return paths
+
+
+def jobs(*ids):
+    return [{"id": id, "path": f"{id}.pdf", "career_goal": "Data Scientist", "interests": []} for id in ids]
+
+
+def records(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+# -----------------------------
+# Checkpoint
+# -----------------------------
+def test_completed_ids_ignores_failures_and_truncated_lines(tmp_path):
+    out = tmp_path / "results.jsonl"
+    assert completed_ids(str(out)) == set()
+    out.write_text('{"id": "a", "status": "ok"}\n{"id": "b", "status": "error"}\n{"id": "c", "sta',
+                   encoding="utf-8")
+    assert completed_ids(str(out)) == {"a"}
+
+
+def test_rerun_skips_succeeded_and_retries_failed(tmp_path, analyzed):
+    out = tmp_path / "results.jsonl"
+    assert run_batch(jobs("a", "bad", "flaky"), str(out), workers=2) == (1, 2, 0)
+    by_id = {r["id"]: r for r in records(out)}
+    assert by_id["bad"]["error"] == "ValueError: unreadable file"
+    assert by_id["flaky"]["error"].startswith("degraded:")
+
+    analyzed.clear()
+    assert run_batch(jobs("a", "bad", "flaky", "d"), str(out), workers=2) == (1, 2, 1)
+    assert sorted(analyzed) == ["bad.pdf", "d.pdf", "flaky.pdf"]
+    assert completed_ids(str(out)) == {"a", "d"}
+
+
+def test_resume_after_interrupted_write(tmp_path, analyzed):
+    out = tmp_path / "results.jsonl"
+    out.write_text('{"id": "a", "status": "ok"}\n{"id": "b", "stat', encoding="utf-8")
+    assert run_batch(jobs("a", "b"), str(out)) == (1, 0, 1)
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert lines[1] == '{"id": "b", "stat'  # the new record starts on its own line
+    assert json.loads(lines[2])["id"] == "b"
+    assert completed_ids(str(out)) == {"a", "b"}
+
+
+# -----------------------------
+# Inputs
+# -----------------------------
+def test_manifest_paths_are_relative_to_manifest(tmp_path):
+    manifest = tmp_path / "cohort.csv"
+    manifest.write_text("path,career_goal,interests\nresumes/ada.pdf,Data Scientist,Data Science; AI\n",
+                        encoding="utf-8")
+    assert list(jobs_from_manifest(str(manifest))) == [{
+        "id": "resumes/ada.pdf", "path": str(tmp_path / "resumes/ada.pdf"), "career_goal": "Data Scientist",
+        "interests": ["Data Science", "AI"]}]
@@ -0,0 +1,120 @@
+# tests/test_firebase_auth.py
+import pytest
+import firebase_auth
+from firebase_auth import AuthError, get_id_token, sign_in, sign_up
+from devtools.fake_identity_toolkit import start_server
+
+
+@pytest.fixture
+def identity(monkeypatch):
+    """
+    Point firebase_auth at a fresh fake identity toolkit; yields a function that restarts it
+    with other settings (accounts are per server).
+    """
+    servers = []
+
+    def serve(**config):
+        server, base_url = start_server(**config)
+        servers.append(server)
+        monkeypatch.setattr(firebase_auth, "AUTH_URL", base_url)
+        monkeypatch.setattr(firebase_auth, "SECURE_TOKEN_URL", base_url)
+        return server.RequestHandlerClass.config
+
+    monkeypatch.setattr(firebase_auth, "API_KEY", "fake")
+    monkeypatch.setattr(firebase_auth, "BACKOFF_BASE", 0.01)
+    yield serve
+    for server in servers:
+        server.shutdown()
+
+
+# -----------------------------
+# Account Operations
+# -----------------------------
+def test_sign_up_then_sign_in(identity):
+    identity()
+    created = sign_up("ada@example.com", "secret1")
+    account = sign_in("ada@example.com", "secret1")
+    assert account["user_id"] == created["user_id"]
+    assert account["email"] == "ada@example.com" and account["id_token"] and account["refresh_token"]
+
+
+def test_sign_up_errors(identity):
+    identity()
+    sign_up("ada@example.com", "secret1")
+    with pytest.raises(AuthError) as e:
+        sign_up("ada@example.com", "secret1")
+    assert e.value.code == "EMAIL_EXISTS"
+    with pytest.raises(AuthError) as e:
+        sign_up("bob@example.com", "123")
+    assert e.value.code == "WEAK_PASSWORD"
+
+
+def test_wrong_password(identity):
+    identity()
+    sign_up("ada@example.com", "secret1")
+    with pytest.raises(AuthError) as e:
+        sign_in("ada@example.com", "wrong-password")
+    assert e.value.code == "INVALID_LOGIN_CREDENTIALS"
+
+
+def test_throttled_sign_in_is_not_retried(identity):
+    config = identity(fail_first=1)
+    with pytest.raises(AuthError) as e:
+        sign_in("ada@example.com", "secret1")
+    assert e.value.code == "TOO_MANY_ATTEMPTS_TRY_LATER"
+    assert config.requests == 1
+
+
+def test_throttled_sign_up_is_retried(identity):
+    config = identity(fail_first=1)
+    assert sign_up("ada@example.com", "secret1")["user_id"]
+    assert config.requests == 2
+
+
+def test_unreachable_server(monkeypatch):
+    monkeypatch.setattr(firebase_auth, "AUTH_URL", "http://127.0.0.1:9/v1")
+    monkeypatch.setattr(firebase_auth, "MAX_RETRIES", 0)
+    with pytest.raises(AuthError) as e:
+        sign_in("ada@example.com", "secret1")
+    assert e.value.code == "NETWORK_ERROR"
+
+
+# -----------------------------
+# Tokens
+# -----------------------------
+def test_fresh_token_is_not_refreshed(identity):
+    config = identity()
+    account = sign_up("ada@example.com", "secret1")
+    token = account["id_token"]
+    assert get_id_token(account) == token
+    assert config.requests == 1
+
+
+def test_expiring_token_is_refreshed(identity):
+    config = identity(expires_in=60)  # inside the refresh margin
+    account = sign_up("ada@example.com", "secret1")
+    old_token, old_refresh = account["id_token"], account["refresh_token"]
+    token = get_id_token(account)
+    assert token != old_token and account["id_token"] == token
+    assert account["refresh_token"] != old_refresh
+    assert config.requests == 2
+
+
+def test_forced_refresh(identity):
+    identity()
+    account = sign_up("ada@example.com", "secret1")
+    old_token = account["id_token"]
+    assert get_id_token(account, force_refresh=True) != old_token
+
+
+def test_revoked_refresh_token_ends_session(identity):
+    identity()
+    account = sign_up("ada@example.com", "secret1")
+    account["refresh_token"] = "revoked"
+    with pytest.raises(AuthError) as e:
+        get_id_token(account, force_refresh=True)
+    assert e.value.code in firebase_auth.SESSION_ENDED_CODES
+
+
+def test_no_account():
+    assert get_id_token(None) is None
@@ -0,0 +1,175 @@
+# tests/test_job_queue.py
+import json
+import threading
+import time
+import pytest
+import job_queue
+from job_queue import DONE, FAILED, JobQueue, JobStore, job_id
+from structured_output import failure_message
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(JobStore(str(tmp_path / "jobs.sqlite3")), workers=4)
+
+
+@pytest.fixture
+def gated():
+    """
+    A registered job kind that blocks until released and counts its runs.
+    """
+    gate, runs = threading.Event(), []
+
+    def work(text, n=0):
+        runs.append((text, n))
+        gate.wait(5)
+        return {"length": len(text), "n": n}
+
+    job_queue.register("test_gated", work)
+    yield gate, runs
+    gate.set()
+
+
+def wait_for(queue, id, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = queue.status(id)
+        if job["status"] in (DONE, FAILED):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {id} did not finish")
+
+
+# -----------------------------
+# Single-flight
+# -----------------------------
+def test_identical_submissions_share_one_run(queue, gated):
+    gate, runs = gated
+    ids = [queue.submit("test_gated", text="resume", n=1) for _ in range(5)]
+    ids += [queue.submit("test_gated", n=1, text="  resume ") for _ in range(5)]  # normalised inputs
+    assert len(set(ids)) == 1
+    gate.set()
+    assert wait_for(queue, ids[0])["result"] == {"length": 6, "n": 1}
+    assert runs == [("resume", 1)]
+
+
+def test_concurrent_submissions_share_one_run(queue, gated):
+    gate, runs = gated
+    ids = []
+    threads = [threading.Thread(target=lambda: ids.append(queue.submit("test_gated", text="x"))) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    gate.set()
+    wait_for(queue, ids[0])
+    assert len(set(ids)) == 1 and len(runs) == 1
+
+
+def test_different_inputs_run_separately(queue, gated):
+    gate, runs = gated
+    a = queue.submit("test_gated", text="a")
+    b = queue.submit("test_gated", text="b")
+    assert a != b
+    gate.set()
+    wait_for(queue, a)
+    wait_for(queue, b)
+    assert sorted(runs) == [("a", 0), ("b", 0)]
+
+
+def test_finished_job_is_reused(queue, gated):
+    gate, runs = gated
+    gate.set()
+    id = queue.submit("test_gated", text="x")
+    wait_for(queue, id)
+    assert queue.submit("test_gated", text="x") == id
+    assert len(runs) == 1
+
+
+def test_forgotten_job_runs_again(queue, gated):
+    gate, runs = gated
+    gate.set()
+    id = queue.submit("test_gated", text="x")
+    wait_for(queue, id)
+    queue.forget(id)
+    assert queue.status(id) is None
+    wait_for(queue, queue.submit("test_gated", text="x"))
+    assert len(runs) == 2
+
+
+def test_failed_parse_runs_again(queue):
+    runs = []
+
+    def parse(text):
+        runs.append(text)
+        return [{"message": "Failed to parse GPT JSON output. Raw output: ..."}]
+
+    job_queue.register("test_parse", parse, streaming=False, check=failure_message)
+    id = queue.submit("test_parse", text="x")
+    job = wait_for(queue, id)
+    assert job["status"] == FAILED and job["error"].startswith("Failed to parse")
+    assert queue.submit("test_parse", text="x") == id
+    wait_for(queue, id)
+    assert runs == ["x", "x"]
+
+
+def test_unknown_kind(queue):
+    with pytest.raises(KeyError):
+        queue.submit("no_such_kind")
+
+
+# -----------------------------
+# Streaming, Failure and Persistence
+# -----------------------------
+def test_streaming_job_collects_items(queue):
+    job_queue.register("test_stream", lambda n: iter(range(n)), streaming=True)
+    job = wait_for(queue, queue.submit("test_stream", n=5))
+    assert job["result"] == [0, 1, 2, 3, 4]
+    assert queue.store.get(job_id("test_stream", n=5))["items"] == [0, 1, 2, 3, 4]
+
+
+def test_failed_job_reports_error(queue):
+    def boom():
+        raise RuntimeError("model unavailable")
+
+    job_queue.register("test_boom", boom)
+    job = wait_for(queue, queue.submit("test_boom"))
+    assert job["status"] == FAILED and job["error"] == "RuntimeError: model unavailable"
+
+
+def test_long_text_params_are_stored_by_hash(queue, gated):
+    gate, _ = gated
+    gate.set()
+    resume = "Python developer. " * 200
+    id = queue.submit("test_gated", text=resume)
+    wait_for(queue, id)
+    params = queue.store._conn.execute("SELECT params FROM jobs WHERE id = ?", (id,)).fetchone()[0]
+    assert "Python developer" not in params
+    assert "$blob" in json.loads(params)["text"]
+
+
+def test_abandoned_job_is_recovered(tmp_path, gated):
+    gate, runs = gated
+    gate.set()
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    id = job_id("test_gated", text="y" * 3000)
+    store.enqueue(id, "test_gated", {"text": "y" * 3000})
+    store._conn.execute("UPDATE jobs SET status = 'running', updated_at = 0 WHERE id = ?", (id,))
+    store._conn.commit()
+    queue = JobQueue(store)
+    queue.recover()
+    assert wait_for(queue, id)["result"] == {"length": 3000, "n": 0}
+    assert runs == [("y" * 3000, 0)]
+
+
+def test_heartbeat_keeps_running_jobs_fresh(tmp_path, gated):
+    gate, _ = gated
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    queue = JobQueue(store)
+    id = queue.submit("test_gated", text="slow")
+    store._conn.execute("UPDATE jobs SET updated_at = 0 WHERE id = ?", (id,))
+    store._conn.commit()
+    store.touch([id])
+    assert store.stale() == []
+    gate.set()
+    wait_for(queue, id)
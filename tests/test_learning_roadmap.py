@@ -0,0 +1,121 @@
+# tests/test_learning_roadmap.py
+import llm_cache
+import model_router
+import semantic_cache
+import learning_roadmap
+from learning_roadmap import _assign, _entry_key, generate_learning_roadmap
+
+
+def entry(skill, course="Course"):
+    return {"skill": skill, "recommended_course": f"{course} {skill}", "platform": "Udemy",
+            "estimated_duration": "2 weeks"}
+
+
+# -----------------------------
+# Entry Assignment
+# -----------------------------
+def test_assign_matches_canonical_name_and_caches_under_it():
+    pending = ["Kubernetes", "AWS"]
+    skill, stored = _assign(entry("k8s"), pending)
+    assert skill == "Kubernetes"
+    assert stored["skill"] == "Kubernetes"
+    assert pending == ["AWS"]
+    assert llm_cache.lookup(_entry_key("Kubernetes")) == stored
+
+
+def test_assign_is_case_insensitive():
+    pending = ["Docker"]
+    assert _assign(entry("docker"), pending)[0] == "Docker"
+    assert pending == []
+
+
+def test_assign_rejects_entries_for_other_skills():
+    pending = ["Docker", "AWS"]
+    assert _assign(entry("Kubernetes (container orchestration)"), pending) is None
+    assert _assign(entry(""), pending) is None
+    assert _assign({"recommended_course": "No skill key"}, pending) is None
+    assert pending == ["Docker", "AWS"]
+    assert llm_cache.lookup(_entry_key("Docker")) is None
+    assert llm_cache.lookup(_entry_key("Kubernetes (container orchestration)")) is None
+
+
+def test_assign_skill_already_done():
+    pending = ["AWS"]
+    assert _assign(entry("Docker"), pending) is None
+
+
+# -----------------------------
+# Roadmap Generation
+# -----------------------------
+def asked(prompt):
+    line = next(l for l in prompt.splitlines() if "missing the following skills:" in l)
+    return line.split(":", 1)[1].strip().split(", ")
+
+
+def fake_model(monkeypatch, answers):
+    """
+    Serve complete_structured/escalate from a list of item lists, recording the prompts.
+    """
+    prompts = []
+
+    def answer(task, prompt, schema, **kwargs):
+        prompts.append(prompt)
+        return answers.pop(0), None, ""
+
+    monkeypatch.setattr(model_router, "complete_structured", answer)
+    monkeypatch.setattr(model_router, "escalate", answer)
+    monkeypatch.setattr(semantic_cache, "lookup_roadmap", lambda skills: None)
+    monkeypatch.setattr(semantic_cache, "remember_roadmap", lambda skills, key: None)
+    return prompts
+
+
+def test_mismatched_entry_is_retried_not_miscached(monkeypatch):
+    prompts = fake_model(monkeypatch, [
+        [entry("Kubernetes (container orchestration)"), entry("AWS")],
+        [entry("Docker", "Retry")],
+    ])
+    roadmap = generate_learning_roadmap(["Docker", "AWS"])
+    assert {e["skill"]: e["recommended_course"] for e in roadmap} == {
+        "Docker": "Retry Docker", "AWS": "Course AWS"}
+    assert [asked(p) for p in prompts] == [["Docker", "AWS"], ["Docker"]]
+    assert llm_cache.lookup(_entry_key("Docker"))["recommended_course"] == "Retry Docker"
+
+
+def test_cached_entries_are_reused(monkeypatch):
+    prompts = fake_model(monkeypatch, [[entry("Docker"), entry("AWS")], [entry("Kubernetes")]])
+    generate_learning_roadmap(["Docker", "AWS"])
+    roadmap = generate_learning_roadmap(["Docker", "AWS", "Kubernetes"])
+    assert {e["skill"] for e in roadmap} == {"Docker", "AWS", "Kubernetes"}
+    assert asked(prompts[1]) == ["Kubernetes"]
+
+
+def test_incomplete_roadmap_is_not_cached_whole(monkeypatch):
+    fake_model(monkeypatch, [[entry("Docker")], []])
+    roadmap = generate_learning_roadmap(["Docker", "AWS"])
+    assert roadmap[0]["skill"] == "Docker"
+    assert roadmap[1] == {"message": "Failed to generate entries for: AWS"}
+    key = llm_cache.make_key("learning_roadmap", model_router.model_for("learning_roadmap"),
+                             missing_skills=["Docker", "AWS"])
+    assert llm_cache.lookup(key) is None
+
+
+def test_incomplete_streamed_roadmap_ends_with_marker(monkeypatch):
+    fake_model(monkeypatch, [[]])
+    llm_cache.store(_entry_key("Docker"), entry("Docker"))
+    monkeypatch.setattr(model_router, "stream", lambda task, prompt: iter(["[]"]))
+    monkeypatch.setattr(model_router, "escalate", lambda *a, **k: ([], None, "[]"))
+    items = list(learning_roadmap.stream_learning_roadmap(["Docker", "AWS"]))
+    assert items == [entry("Docker"), {"message": "Failed to generate entries for: AWS"}]
+
+
+def test_no_missing_skills():
+    assert generate_learning_roadmap([]) == [{"message": "No missing skills detected. No roadmap needed."}]
+
+
+def test_parse_failure_keeps_cached_entries(monkeypatch):
+    llm_cache.store(_entry_key("Docker"), entry("Docker"))
+    monkeypatch.setattr(model_router, "complete_structured", lambda *a, **k: (None, "bad", "not json"))
+    monkeypatch.setattr(semantic_cache, "lookup_roadmap", lambda skills: None)
+    roadmap = learning_roadmap.generate_learning_roadmap(["Docker", "AWS"])
+    assert roadmap[0]["skill"] == "Docker"
+    assert roadmap[1]["message"].startswith("Failed to parse")
@@ -0,0 +1,97 @@
+# tests/test_llm_cache.py
+import time
+import llm_cache
+from llm_cache import MemoryCache, SQLiteCache, TieredCache, make_key
+
+
+# -----------------------------
+# Keys
+# -----------------------------
+def test_key_ignores_cosmetic_differences():
+    a = make_key("roadmap", "gpt-4o", skills={"Docker", "AWS"}, goal="  Cloud   Engineer ")
+    b = make_key("roadmap", "gpt-4o", goal="Cloud Engineer", skills={"AWS", "Docker"})
+    assert a == b
+
+
+def test_key_depends_on_namespace_model_and_inputs():
+    base = make_key("roadmap", "gpt-4o", skills=["Docker"])
+    assert base.startswith("roadmap:")
+    assert make_key("projects", "gpt-4o", skills=["Docker"]) != base
+    assert make_key("roadmap", "gpt-4o-mini", skills=["Docker"]) != base
+    assert make_key("roadmap", "gpt-4o", skills=["AWS"]) != base
+
+
+def test_key_keeps_list_order():
+    assert make_key("roadmap", "m", skills=["A", "B"]) != make_key("roadmap", "m", skills=["B", "A"])
+
+
+# -----------------------------
+# Expiry and Eviction
+# -----------------------------
+def test_memory_entry_expires():
+    cache = MemoryCache()
+    cache.set("k", "1", time.time() - 1)
+    cache.set("fresh", "2", time.time() + 60)
+    cache.set("forever", "3", None)
+    assert cache.get("k") is None
+    assert cache.get("fresh") == "2"
+    assert cache.get("forever") == "3"
+
+
+def test_memory_evicts_least_recently_used():
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", "1", None)
+    cache.set("b", "2", None)
+    cache.get("a")
+    cache.set("c", "3", None)
+    assert cache.get("b") is None
+    assert cache.get("a") == "1" and cache.get("c") == "3"
+
+
+def test_sqlite_entry_expires_and_is_deleted(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "c.sqlite3"))
+    cache.set("old", "1", time.time() - 1)
+    assert cache.get("old") is None
+    count = cache._conn.execute("SELECT COUNT(*) FROM llm_cache WHERE key = 'old'").fetchone()[0]
+    assert count == 0
+
+
+def test_sqlite_evicts_beyond_max_entries(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "c.sqlite3"), max_entries=3)
+    for i in range(5):
+        cache.set(f"k{i}", str(i), None)
+    assert cache._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] == 3
+    assert cache.get("k4") == ("4", None)
+
+
+def test_tiered_ttl(tmp_path, monkeypatch):
+    cache = TieredCache(disk=SQLiteCache(str(tmp_path / "c.sqlite3")))
+    now = [1000.0]
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now[0])
+    cache.set("k", {"v": 1}, ttl=10)
+    cache.set("forever", [1], ttl=0)
+    now[0] += 5
+    assert cache.get("k") == {"v": 1}
+    now[0] += 10
+    assert cache.get("k") is None
+    assert cache.get("forever") == [1]
+
+
+def test_disk_hit_is_promoted_to_memory(tmp_path):
+    disk = SQLiteCache(str(tmp_path / "c.sqlite3"))
+    TieredCache(disk=disk).set("k", {"v": 1})
+    cache = TieredCache(disk=disk)
+    assert cache.get("k") == {"v": 1}
+    assert cache.memory.get("k") is not None
+
+
+def test_lookup_returns_a_copy():
+    llm_cache.store("k", {"skills": ["A"]})
+    llm_cache.lookup("k")["skills"].append("B")
+    assert llm_cache.lookup("k") == {"skills": ["A"]}
+
+
+def test_disabled_cache_misses(monkeypatch):
+    monkeypatch.setattr(llm_cache, "CACHE_ENABLED", False)
+    llm_cache.store("k", 1)
+    assert llm_cache.lookup("k") is None
@@ -0,0 +1,77 @@
+# tests/test_llm_client.py
+import pytest
+import metrics
+import llm_client
+
+PROMPT = "Suggest a job title for this resume."
+
+
+def last_call():
+    return llm_client.get_call_metrics()[-1]
+
+
+# -----------------------------
+# Retries
+# -----------------------------
+@pytest.mark.parametrize("status", [429, 503])
+def test_complete_retries_transient_failures(fake_llm, status):
+    config = fake_llm(fail_first=2, fail_status=status)
+    assert llm_client.complete(PROMPT, name="test_retry") == "Data Scientist"
+    assert config.requests == 3
+    call = last_call()
+    assert (call["name"], call["status"], call["attempts"]) == ("test_retry", "ok", 3)
+    assert metrics.counter_total("llm_retries_total", name="test_retry") == 2
+
+
+def test_complete_gives_up_after_max_retries(fake_llm, monkeypatch):
+    monkeypatch.setattr(llm_client, "MAX_RETRIES", 1)
+    config = fake_llm(fail_first=5, fail_status=500)
+    with pytest.raises(Exception):
+        llm_client.complete(PROMPT, name="test_retry")
+    assert config.requests == 2
+    assert last_call()["attempts"] == 2 and last_call()["status"] != "ok"
+
+
+def test_client_errors_are_not_retried(fake_llm):
+    config = fake_llm(fail_first=1, fail_status=400)
+    with pytest.raises(Exception):
+        llm_client.complete(PROMPT)
+    assert config.requests == 1
+
+
+def test_stream_retries_before_first_chunk(fake_llm):
+    config = fake_llm(fail_first=1, fail_status=429)
+    assert "".join(llm_client.stream(PROMPT, name="test_stream")) == "Data Scientist"
+    assert config.requests == 2
+    assert last_call()["attempts"] == 2 and last_call()["streamed"]
+
+
+# -----------------------------
+# Metrics and Concurrency
+# -----------------------------
+def test_complete_records_reported_usage(fake_llm):
+    fake_llm()
+    llm_client.complete(PROMPT, name="test_usage", model="gpt-4o")
+    call = last_call()
+    assert call["prompt_tokens"] > 0 and call["completion_tokens"] == 2 and not call["tokens_estimated"]
+    assert call["cost_usd"] == round(llm_client.call_cost("gpt-4o", call["prompt_tokens"], 2), 6)
+    assert metrics.counter_total("llm_calls_total", name="test_usage", status="ok") == 1
+    assert metrics.counter_total("llm_tokens_total", name="test_usage", kind="completion", source="reported") == 2
+
+
+def test_stream_records_estimated_usage(fake_llm):
+    fake_llm()
+    list(llm_client.stream(PROMPT, name="test_usage"))
+    call = last_call()
+    assert call["tokens_estimated"] and call["completion_tokens"] > 0
+    assert metrics.counter_total("llm_tokens_total", name="test_usage", source="estimated") > 0
+
+
+def test_closed_stream_releases_its_slot(fake_llm, monkeypatch):
+    fake_llm()
+    monkeypatch.setattr(llm_client, "_semaphore", llm_client.threading.BoundedSemaphore(1))
+    chunks = llm_client.stream(PROMPT, name="test_cancel")
+    next(chunks)
+    chunks.close()
+    assert last_call()["status"] == "cancelled"
+    assert llm_client._semaphore.acquire(blocking=False)
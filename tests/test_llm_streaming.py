@@ -0,0 +1,67 @@
+# tests/test_llm_streaming.py
+import json
+from llm_streaming import JsonArrayStream, iter_json_array_items
+
+ROADMAP = [
+    {"skill": "Docker", "recommended_course": "Docker Mastery", "platform": "Udemy", "estimated_duration": "2 weeks"},
+    {"skill": "AWS", "recommended_course": "AWS Cloud Practitioner", "platform": "Coursera",
+     "estimated_duration": "1 month"},
+]
+
+
+def chunked(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def test_items_survive_any_chunking():
+    text = json.dumps(ROADMAP)
+    for size in (1, 3, 7, len(text)):
+        assert list(iter_json_array_items(chunked(text, size))) == ROADMAP
+
+
+def test_item_is_emitted_as_soon_as_it_closes():
+    text = json.dumps(ROADMAP)
+    first_end = text.index("}") + 1
+    parser = JsonArrayStream()
+    assert parser.feed(text[:first_end - 1]) == []
+    assert parser.feed(text[first_end - 1:first_end]) == [ROADMAP[0]]
+    assert parser.feed(text[first_end:]) == [ROADMAP[1]]
+    assert parser.finished
+
+
+def test_fence_and_prose_before_the_array_are_ignored():
+    text = "Here is your roadmap:\n```json\n" + json.dumps(ROADMAP) + "\n```\nGood luck!"
+    assert list(iter_json_array_items(chunked(text, 5))) == ROADMAP
+
+
+def test_brackets_and_quotes_inside_strings():
+    items = [{"description": "Use [brackets], {braces} and \"quotes\" \\ here"}, "a, b", 3]
+    assert list(iter_json_array_items(chunked(json.dumps(items), 2))) == items
+
+
+def test_scalars():
+    assert list(iter_json_array_items(['["Python", 4, true, null]'])) == ["Python", 4, True, None]
+
+
+def test_malformed_element_is_repaired_or_dropped():
+    text = "[{'skill': 'Docker', platform: 'Udemy',}, {\"skill\": }, {\"skill\": \"AWS\"}]"
+    assert list(iter_json_array_items(chunked(text, 4))) == [
+        {"skill": "Docker", "platform": "Udemy"}, {"skill": "AWS"}]
+
+
+def test_truncated_stream_yields_the_complete_items():
+    text = json.dumps(ROADMAP)
+    cut = text.index("AWS Cloud")
+    assert list(iter_json_array_items(chunked(text[:cut], 6))) == ROADMAP[:1]
+
+
+def test_source_is_drained():
+    consumed = []
+
+    def source():
+        for chunk in ['[1, 2]', ' trailing', ' text']:
+            consumed.append(chunk)
+            yield chunk
+
+    assert list(iter_json_array_items(source())) == [1, 2]
+    assert len(consumed) == 3
@@ -0,0 +1,79 @@
+# tests/test_model_router.py
+import json
+import pytest
+import metrics
+import model_router
+from devtools.fake_openai_server import respond
+
+PROJECTS_PROMPT = "Suggest 3 projects. Return a JSON array of objects with keys project_name, description."
+
+
+def routing(**labels):
+    return metrics.counter_total("routing_total", **labels)
+
+
+# -----------------------------
+# Tier Selection
+# -----------------------------
+def test_tasks_are_routed_by_tier():
+    assert model_router.route("project_recommendations") == ("small", model_router.TIERS["small"])
+    assert model_router.route("resume_analysis") == ("large", model_router.TIERS["large"])
+    assert model_router.route("unknown_task") == ("large", model_router.TIERS["large"])
+
+
+def test_route_may_name_a_model(monkeypatch):
+    monkeypatch.setitem(model_router.ROUTES, "career_goal", "gpt-4.1-nano")
+    assert model_router.route("career_goal") == ("gpt-4.1-nano", "gpt-4.1-nano")
+
+
+def test_parse_routes():
+    assert model_router._parse_routes("learning_roadmap=large, career_goal = small,,bad") == {
+        "learning_roadmap": "large", "career_goal": "small"}
+
+
+# -----------------------------
+# Escalation
+# -----------------------------
+def test_valid_small_tier_output_is_used(fake_llm):
+    config = fake_llm()
+    value, error, _ = model_router.complete_structured("project_recommendations", PROJECTS_PROMPT, "projects")
+    assert error is None and value == json.loads(respond(PROJECTS_PROMPT))
+    assert config.requests == 1
+    assert routing(task="project_recommendations", tier="small", outcome="ok") == 1
+    assert metrics.counter_total("routing_escalations_total") == 0
+
+
+def test_invalid_small_tier_output_escalates(fake_llm):
+    config = fake_llm(malformed_models={model_router.TIERS["small"]})
+    value, error, text = model_router.complete_structured("project_recommendations", PROJECTS_PROMPT, "projects")
+    assert error is None and [p["project_name"] for p in value][0] == "Portfolio Website"
+    assert config.requests == 2
+    assert routing(task="project_recommendations", tier="small", outcome="invalid") == 1
+    assert routing(task="project_recommendations", tier="large", model=model_router.TIERS["large"],
+                   outcome="escalated") == 1
+    assert metrics.counter_total("routing_escalations_total", task="project_recommendations", reason="invalid") == 1
+    assert metrics.counter_total("llm_calls_total", model=model_router.TIERS["large"]) == 1
+    row = next(r for r in model_router.summary() if r["task"] == "project_recommendations")
+    assert (row["calls"], row["invalid"], row["escalated"]) == (2, 1, 1)
+
+
+def test_escalation_can_be_disabled(fake_llm, monkeypatch):
+    fake_llm(malformed_models={model_router.TIERS["small"]})
+    monkeypatch.setattr(model_router, "ESCALATION_ENABLED", False)
+    value, error, text = model_router.complete_structured("project_recommendations", PROJECTS_PROMPT, "projects")
+    assert error is not None and text.startswith("Sure!")
+
+
+def test_large_tier_task_is_not_escalated(fake_llm):
+    config = fake_llm()
+    assert model_router.escalate("resume_analysis", PROJECTS_PROMPT, "projects") is None
+    assert config.requests == 0
+
+
+def test_failed_call_is_recorded(fake_llm, monkeypatch):
+    import llm_client
+    monkeypatch.setattr(llm_client, "MAX_RETRIES", 0)
+    fake_llm(fail_first=1, fail_status=500)
+    with pytest.raises(Exception):
+        model_router.complete("career_goal", "Suggest a job title.")
+    assert routing(task="career_goal", tier="small", outcome="error") == 1
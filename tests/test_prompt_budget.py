@@ -0,0 +1,78 @@
+# tests/test_prompt_budget.py
+from prompt_budget import compress_resume, count_tokens, dedupe_lines, detect_sections, normalize_whitespace
+
+
+def resume(experience_lines=5, hobby_lines=2):
+    return "\n".join(
+        ["Jane Doe", "jane@example.com", "", "Skills", "Python, SQL, Docker, AWS", "", "Experience"]
+        + [f"Built data pipeline number {i} processing events for team {i % 7}" for i in range(experience_lines)]
+        + ["", "Projects", "Resume parser with Aho-Corasick matching", "", "Hobbies"]
+        + [f"Hobby {i}: hiking trail {i}" for i in range(hobby_lines)]
+    )
+
+
+# -----------------------------
+# Cleanup
+# -----------------------------
+def test_normalize_whitespace():
+    assert normalize_whitespace("  a   b \r\n\n\n\nc\t\td  ") == "a b\n\nc d"
+
+
+def test_dedupe_drops_page_numbers_and_repeated_lines():
+    text = "Jane Doe - Resume\nSkills\nPage 1 of 2\nJane Doe - Resume\nPython\n2"
+    assert dedupe_lines(text) == "Jane Doe - Resume\nSkills\nPython"
+
+
+def test_detect_sections():
+    headings = [h for h, _ in detect_sections(resume())]
+    assert headings == ["header", "skills", "experience", "projects", "hobbies"]
+
+
+# -----------------------------
+# Budgeting
+# -----------------------------
+def test_resume_within_budget_is_returned_cleaned_but_uncut():
+    text = resume(experience_lines=40)
+    cleaned = dedupe_lines(normalize_whitespace(text))
+    budget = count_tokens(cleaned) + 10
+    # The experience section alone is larger than a third of the budget; nothing may be cut
+    assert count_tokens(detect_sections(cleaned)[2][1]) > budget // 3
+    compressed, report = compress_resume(text, max_tokens=budget)
+    assert compressed == cleaned
+    assert report["dropped_sections"] == []
+
+
+def test_cleanup_savings_are_reported_without_cutting():
+    text = resume().replace("\n", "\n\n\n   ") + "\nPage 3"
+    compressed, report = compress_resume(text, max_tokens=10_000)
+    assert "Page 3" not in compressed
+    assert report["tokens_saved"] == report["original_tokens"] - report["compressed_tokens"] > 0
+
+
+def test_over_budget_resume_fits_and_keeps_priority_sections():
+    text = resume(experience_lines=200, hobby_lines=50)
+    compressed, report = compress_resume(text, max_tokens=300)
+    assert report["original_tokens"] > 300
+    # Sections are joined with blank lines, which may add a token or two per section
+    assert report["compressed_tokens"] <= 300 + 2 * len(report["sections"])
+    assert "Python, SQL, Docker, AWS" in compressed
+    assert "Resume parser with Aho-Corasick matching" in compressed
+    assert "Hobby 49" not in compressed
+
+
+def test_least_useful_sections_are_dropped_first():
+    compressed, report = compress_resume(resume(experience_lines=200, hobby_lines=50), max_tokens=60)
+    assert "hobbies" in report["dropped_sections"]
+    assert "skills" not in report["dropped_sections"]
+    assert "Python, SQL, Docker, AWS" in compressed
+
+
+def test_long_section_is_capped_when_over_budget():
+    compressed, _ = compress_resume(resume(experience_lines=200), max_tokens=300)
+    experience = compressed.split("Experience", 1)[1].split("Projects", 1)[0]
+    assert count_tokens(experience) <= 300 // 3 + 2
+
+
+def test_empty_resume():
+    assert compress_resume("", max_tokens=100)[0] == ""
+    assert compress_resume(None, max_tokens=100)[0] == ""
@@ -0,0 +1,75 @@
+# tests/test_resume_analysis.py
+import pytest
+import model_router
+from resume_analysis import evaluate_resume_profile, resume_skills
+
+RESUME = "Java developer. Skills: Spring Boot, SQL, Git, Docker, HTML, CSS."
+SPARSE_RESUME = "Built a small website for a bakery."
+
+
+@pytest.fixture
+def model(monkeypatch):
+    """
+    Serve complete_structured by schema from a dict of values or exceptions; records the
+    schemas asked for.
+    """
+    answers, calls = {}, []
+
+    def answer(task, prompt, schema, **kwargs):
+        calls.append(schema)
+        value = answers[schema]
+        if isinstance(value, Exception):
+            raise value
+        if value is None:
+            return None, "could not parse", "not json"
+        return value, None, ""
+
+    monkeypatch.setattr(model_router, "complete_structured", answer)
+    return answers, calls
+
+
+# -----------------------------
+# Degraded Results
+# -----------------------------
+def test_failed_recommendations_are_degraded_and_not_cached(model):
+    answers, calls = model
+    answers["recommendations"] = TimeoutError("model down")
+    result = evaluate_resume_profile(RESUME, [], "Java Full Stack Developer")
+    assert result["degraded"].startswith("recommendations failed: TimeoutError")
+    assert "Java" in result["extracted_skills"] and result["missing_skills"]  # local part still computed
+
+    answers["recommendations"] = ["Learn Hibernate."]
+    result = evaluate_resume_profile(RESUME, [], "Java Full Stack Developer")
+    assert "degraded" not in result and result["recommendations"] == ["Learn Hibernate."]
+    assert calls == ["recommendations", "recommendations"]
+
+
+def test_unparsed_required_skills_are_degraded_and_not_cached(model):
+    answers, calls = model
+    answers["requirements"] = None
+    result = evaluate_resume_profile(RESUME, [], "Underwater Welder")
+    assert result["degraded"] == "required skills could not be parsed"
+    assert result["required_skills"] == []
+
+    answers["requirements"] = {"required_skills": ["Java", "Welding"], "recommendations": ["Get certified."]}
+    result = evaluate_resume_profile(RESUME, [], "Underwater Welder")
+    assert "degraded" not in result and result["missing_skills"] == ["Welding"]
+    assert calls == ["requirements", "requirements"]
+
+
+def test_complete_result_is_cached(model):
+    answers, calls = model
+    answers["recommendations"] = ["Learn Hibernate."]
+    first = evaluate_resume_profile(RESUME, [], "Java Full Stack Developer")
+    assert evaluate_resume_profile(RESUME, [], "Java Full Stack Developer") == first
+    assert calls == ["recommendations"]
+
+
+def test_local_skills_are_not_cached_when_llm_fallback_fails(model):
+    answers, calls = model
+    answers["skill_list"] = ConnectionError("model down")
+    assert resume_skills(SPARSE_RESUME) == []
+    answers["skill_list"] = ["HTML", "CSS"]
+    assert resume_skills(SPARSE_RESUME) == ["HTML", "CSS"]
+    assert resume_skills(SPARSE_RESUME) == ["HTML", "CSS"]
+    assert calls == ["skill_list", "skill_list"]
@@ -0,0 +1,81 @@
+# tests/test_semantic_cache.py
+import pytest
+import llm_cache
+import semantic_cache
+from semantic_cache import SemanticIndex, Vectorizer, goal_features
+
+
+@pytest.fixture(autouse=True)
+def fresh_indexes(monkeypatch):
+    monkeypatch.setattr(semantic_cache, "_indexes", {})
+    monkeypatch.setattr(semantic_cache, "SEMANTIC_CACHE_ENABLED", True)
+
+
+def entry(skill):
+    return {"skill": skill, "recommended_course": f"{skill} Fundamentals", "platform": "Udemy",
+            "estimated_duration": "2 weeks"}
+
+
+def remember_roadmap(skills, roadmap):
+    key = llm_cache.make_key("learning_roadmap", "test", missing_skills=skills)
+    llm_cache.store(key, roadmap)
+    semantic_cache.remember_roadmap(skills, key)
+
+
+# -----------------------------
+# Threshold
+# -----------------------------
+def test_threshold_is_inclusive():
+    vectorizer = Vectorizer(goal_features, ["Data Scientist", "Web Developer", "Data Engineer"])
+    probe = SemanticIndex("probe", vectorizer, threshold=0.0)
+    probe.add("Data Scientist", "key")
+    score = probe.query("Data Science Engineer")[0][2]
+    assert 0 < score < 1
+
+    at = SemanticIndex("at", vectorizer, threshold=score)
+    at.add("Data Scientist", "key")
+    assert [m[0] for m in at.query("Data Science Engineer")] == ["key"]
+
+    above = SemanticIndex("above", vectorizer, threshold=score + 1e-4)
+    above.add("Data Scientist", "key")
+    assert above.query("Data Science Engineer") == []
+
+
+def test_projects_for_similar_goal():
+    key = llm_cache.make_key("project_recommendations", "test", career_goal="Data Scientist")
+    llm_cache.store(key, [{"project_name": "Churn Model"}])
+    semantic_cache.remember_projects("Data Scientist", key)
+    assert semantic_cache.lookup_projects("Sr. Data Scientist") == [{"project_name": "Churn Model"}]
+    assert semantic_cache.lookup_projects("Mobile App Developer") is None
+
+
+# -----------------------------
+# Roadmap Coverage
+# -----------------------------
+def test_roadmap_for_aliased_skills():
+    remember_roadmap(["React", "AWS"], [entry("React"), entry("AWS")])
+    assert semantic_cache.lookup_roadmap(["Amazon Web Services", "ReactJS"]) == [entry("React"), entry("AWS")]
+
+
+def test_roadmap_hit_is_trimmed_to_requested_skills():
+    remember_roadmap(["Docker", "AWS", "Kubernetes", "Terraform"],
+                     [entry("Docker"), entry("AWS"), entry("Kubernetes"), entry("Terraform")])
+    assert semantic_cache.lookup_roadmap(["Docker", "AWS", "Kubernetes"]) == [
+        entry("Docker"), entry("AWS"), entry("Kubernetes")]
+
+
+def test_roadmap_must_cover_every_requested_skill():
+    remember_roadmap(["Docker", "AWS", "Kubernetes"], [entry("Docker"), entry("AWS"), entry("Kubernetes")])
+    assert semantic_cache.lookup_roadmap(["Docker", "AWS", "Kubernetes", "Terraform"]) is None
+
+
+def test_roadmap_missing_an_entry_is_not_served():
+    remember_roadmap(["Docker", "AWS", "Kubernetes", "Terraform"], [entry("Docker"), entry("AWS"), entry("Terraform")])
+    assert semantic_cache.lookup_roadmap(["Docker", "AWS", "Kubernetes"]) is None
+
+
+def test_expired_roadmap_is_dropped_from_index(monkeypatch):
+    remember_roadmap(["Docker", "AWS"], [entry("Docker"), entry("AWS")])
+    monkeypatch.setattr(llm_cache, "_cache", llm_cache.TieredCache())  # exact cache forgot everything
+    assert semantic_cache.lookup_roadmap(["Docker", "AWS"]) is None
+    assert len(semantic_cache.get_index("roadmap")) == 0
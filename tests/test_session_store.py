@@ -0,0 +1,70 @@
+# tests/test_session_store.py
+import pytest
+import session_store
+from llm_cache import SQLiteCache
+from session_store import BlobStore, Handle
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """
+    A process-wide store over its own SQLite file, with no tracked sessions.
+    """
+    blobs = BlobStore(disk=SQLiteCache(str(tmp_path / "session_store.sqlite3")))
+    monkeypatch.setattr(session_store, "_store", blobs)
+    monkeypatch.setattr(session_store, "_sessions", {})
+    return blobs
+
+
+ROADMAP = [{"skill": "Docker", "recommended_course": "Docker Fundamentals", "platform": "Udemy"}]
+
+
+# -----------------------------
+# Handles
+# -----------------------------
+def test_offload_round_trip(store):
+    handle = session_store.offload(ROADMAP)
+    assert isinstance(handle, Handle) and handle.size > 0
+    assert session_store.resolve(handle) == ROADMAP
+
+
+def test_identical_values_are_stored_once(store):
+    a = session_store.offload({"b": 1, "a": [1, 2]})
+    b = session_store.offload({"a": [1, 2], "b": 1})
+    assert a == b and len(store) == 1
+
+
+def test_resolve_passes_other_values_through(store):
+    assert session_store.offload(None) is None
+    assert session_store.resolve(None) is None
+    assert session_store.resolve(ROADMAP) is ROADMAP
+    assert session_store.resolve("resume text") == "resume text"
+
+
+# -----------------------------
+# Memory Tier
+# -----------------------------
+def test_memory_tier_is_bounded_by_bytes(tmp_path):
+    blobs = BlobStore(max_bytes=100, disk=SQLiteCache(str(tmp_path / "s.sqlite3")))
+    first = blobs.put("a" * 60)
+    second = blobs.put("b" * 60)
+    assert len(blobs) == 1 and blobs.memory_bytes == second.size
+    # Evicted from memory, reloaded from disk
+    assert blobs.get(first) == "a" * 60
+
+
+def test_memory_only_store_loses_evicted_values():
+    blobs = BlobStore(max_bytes=100)
+    first = blobs.put("a" * 60)
+    blobs.put("b" * 60)
+    assert blobs.get(first) is None
+
+
+def test_idle_sessions_release_values_only_they_use(store):
+    shared, own = session_store.offload("shared resume"), session_store.offload(ROADMAP)
+    session_store.track("idle", {"resume_text": shared, "roadmap": own})
+    session_store.track("active", {"resume_text": shared})
+    session_store._sessions["idle"]["last_active"] = 0
+    assert session_store.evict_idle(idle_seconds=60) == 1
+    assert len(store) == 1 and store.memory_bytes == shared.size
+    assert session_store.resolve(own) == ROADMAP  # still on disk
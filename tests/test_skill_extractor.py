@@ -0,0 +1,124 @@
+# tests/test_skill_extractor.py
+import pytest
+from skill_extractor import SkillMatcher, canonicalize_skill, canonicalize_skills, compute_skill_match, extract_skills
+
+
+# -----------------------------
+# Extraction
+# -----------------------------
+def test_aliases_map_to_canonical_names_in_order():
+    text = "Built services with NodeJS and Amazon Web Services, deployed on K8s. Also JS."
+    assert extract_skills(text) == ["Node.js", "AWS", "Kubernetes", "JavaScript"]
+
+
+def test_longest_match_wins():
+    assert extract_skills("Languages: C++, Python") == ["C++", "Python"]
+
+
+def test_matches_need_word_boundaries():
+    assert "Java" not in extract_skills("Wrote JavaScript daily")
+    assert extract_skills("Javanese culture") == []
+
+
+def test_case_sensitive_aliases():
+    assert extract_skills("Worked on ML models") == ["Machine Learning"]
+    assert extract_skills("The ml of water") == []
+
+
+def test_multiword_alias_across_line_break():
+    assert extract_skills("Machine\nLearning") == ["Machine Learning"]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Languages: C, C++, Python", ["C", "C++", "Python"]),
+    ("Python / R", ["Python", "R"]),
+    ("R, Python, SQL", ["R", "Python", "SQL"]),
+    ("Skills\nC\nJava", ["C", "Java"]),
+    ("• R\n• SQL", ["R", "SQL"]),
+    ("I know Python, C.", ["Python", "C"]),
+])
+def test_single_letters_in_lists(text, expected):
+    assert extract_skills(text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "I got a grade C in maths",
+    "John R. Smith",
+    "Vitamin C, zinc",
+    "Plan C, then B",
+    "C and R are letters",
+])
+def test_single_letters_in_prose_are_ignored(text):
+    assert "C" not in extract_skills(text) and "R" not in extract_skills(text)
+
+
+@pytest.mark.parametrize("text", [
+    "I got a grade: C in maths",
+    "Grade: C",
+    "Let's go to market",
+    "Go to the settings page",
+])
+def test_labels_and_verbs_are_not_skills(text):
+    assert extract_skills(text) == []
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Languages: Go, Python", ["Golang", "Python"]),
+    ("Python / Go", ["Python", "Golang"]),
+    ("Built services in Golang", ["Golang"]),
+])
+def test_go_in_lists(text, expected):
+    assert extract_skills(text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "I excel at communication and networking",
+    "Worked in an agile team",
+    "Built a react app",
+])
+def test_ordinary_words_are_not_skills(text):
+    assert extract_skills(text) == []
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Advanced Excel and Power BI", ["Excel", "Power BI"]),
+    ("Agile delivery with Scrum", ["Agile"]),
+    ("Frontend in React", ["React"]),
+    ("Skills: Networking, Linux", ["Networking", "Linux"]),
+])
+def test_skill_words_as_written_in_resumes(text, expected):
+    assert extract_skills(text) == expected
+
+
+@pytest.mark.parametrize("text", ["Probability theory", "Shipping containers", "Graph algorithms"])
+def test_broad_topics_are_not_skills(text):
+    assert extract_skills(text) == []
+
+
+def test_custom_taxonomy():
+    matcher = SkillMatcher({"Go": ["Golang"]}, case_sensitive={"Go"}, list_context=())
+    assert matcher.find("Golang, Go and go") == ["Go"]
+
+
+def test_empty_text():
+    assert extract_skills("") == []
+    assert extract_skills(None) == []
+
+
+# -----------------------------
+# Canonicalization and Matching
+# -----------------------------
+def test_canonicalize():
+    assert canonicalize_skill(" amazon  web services ") == "AWS"
+    assert canonicalize_skill("Underwater Basket Weaving") == "Underwater Basket Weaving"
+    assert canonicalize_skills(["K8s", "Kubernetes", "aws", "AWS", ""]) == ["Kubernetes", "AWS"]
+
+
+def test_compute_skill_match():
+    result = compute_skill_match(["Python", "k8s"], ["Python", "Kubernetes", "AWS"])
+    assert result == {"skill_match_percentage": 67, "skill_gap_percentage": 33, "missing_skills": ["AWS"]}
+
+
+def test_compute_skill_match_without_requirements():
+    assert compute_skill_match(["Python"], []) == {
+        "skill_match_percentage": 0, "skill_gap_percentage": 0, "missing_skills": []}
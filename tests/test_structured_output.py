@@ -0,0 +1,84 @@
+# tests/test_structured_output.py
+import pytest
+from structured_output import extract_json, loads_tolerant, parse_structured, validate_item
+
+ENTRY = {"skill": "Docker", "recommended_course": "Docker Mastery", "platform": "Udemy",
+         "estimated_duration": "2 weeks"}
+
+
+# -----------------------------
+# JSON Repair
+# -----------------------------
+def test_strict_json_is_not_repaired():
+    assert extract_json('[{"a": 1}]') == ([{"a": 1}], False)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('```json\n[{"a": 1}]\n```', [{"a": 1}]),
+    ('Sure! Here it is: {"a": 1} Hope that helps.', {"a": 1}),
+    ("{'a': 'b'}", {"a": "b"}),
+    ('{a: 1, b: [1, 2,],}', {"a": 1, "b": [1, 2]}),
+    ('{"ok": True, "missing": None}', {"ok": True, "missing": None}),
+    ('{"a": 1, // note\n "b": 2}', {"a": 1, "b": 2}),
+    ('{"text": "line one\nline two"}', {"text": "line one\nline two"}),
+    ('{"text": “curly”}', {"text": "curly"}),
+    ('[{"skill": "Docker", "platform": "Udem', [{"skill": "Docker", "platform": "Udem"}]),
+    ('[{"skill": "Docker", "platform":', [{"skill": "Docker"}]),
+    ('[{"skill": "Docker", "plat', [{"skill": "Docker"}]),
+    ('{"a": {"b": 1}, c', {"a": {"b": 1}}),
+    ('["a", "b', ["a", "b"]),
+])
+def test_repairs(text, expected):
+    assert loads_tolerant(text) == expected
+
+
+def test_expected_kind_is_preferred():
+    text = 'Note {"x": 1} then [1, 2]'
+    assert extract_json(text, expect="array")[0] == [1, 2]
+    assert extract_json(text)[0] == {"x": 1}
+
+
+@pytest.mark.parametrize("text", ["", "No JSON here at all.", None])
+def test_nothing_to_parse(text):
+    with pytest.raises(ValueError):
+        extract_json(text)
+
+
+# -----------------------------
+# Schemas
+# -----------------------------
+def test_parse_structured_roadmap():
+    value, error = parse_structured("```json\n[" + str(ENTRY).replace("'", '"') + ",]\n```", "roadmap")
+    assert error is None and value == [ENTRY]
+
+
+def test_invalid_items_are_dropped():
+    value, error = parse_structured('[{"skill": "AWS"}, ' + str(ENTRY).replace("'", '"') + "]", "roadmap")
+    assert error is None and value == [ENTRY]
+
+
+def test_all_items_invalid_is_an_error():
+    value, error = parse_structured('[{"skill": "AWS"}]', "roadmap")
+    assert value is None and "missing keys" in error
+
+
+def test_wrapped_and_single_objects_are_coerced():
+    assert parse_structured('{"roadmap": [' + str(ENTRY).replace("'", '"') + "]}", "roadmap")[0] == [ENTRY]
+    assert parse_structured(str(ENTRY).replace("'", '"'), "roadmap")[0] == [ENTRY]
+
+
+def test_requirements_object():
+    value, error = parse_structured('{"required_skills": ["Python", 3], "recommendations": ["Learn AWS"]}',
+                                    "requirements")
+    assert error is None
+    assert value == {"required_skills": ["Python", "3"], "recommendations": ["Learn AWS"]}
+
+
+def test_prose_only_is_an_error():
+    assert parse_structured("I cannot help with that.", "projects") == (None, "No JSON object or array found in model output")
+
+
+def test_validate_item():
+    assert validate_item(ENTRY, "roadmap") == ENTRY
+    assert validate_item({"skill": "AWS"}, "roadmap") is None
+    assert validate_item("Docker", "roadmap") is None